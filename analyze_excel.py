@@ -1,30 +1,38 @@
-import pandas as pd
 import sys
 import json
+from pathlib import Path
 
-def analyze_excel(file_path):
+sys.path.insert(0, str(Path(__file__).parent / "scripts"))
+from workbook import Workbook
+
+def analyze_excel(file_path, headers_only=False):
     """Analyze Excel file structure"""
     try:
-        # Read all sheets
-        xls = pd.ExcelFile(file_path)
-        print(f"File: {file_path}")
-        print(f"Sheets: {xls.sheet_names}\n")
-        
-        for sheet_name in xls.sheet_names:
-            df = pd.read_excel(file_path, sheet_name=sheet_name)
-            print(f"=== Sheet: {sheet_name} ===")
-            print(f"Rows: {len(df)}")
-            print(f"Columns: {list(df.columns)}")
-            print(f"\nFirst 3 rows:")
-            print(df.head(3).to_string())
-            print("\n" + "="*80 + "\n")
-            
+        # Open the workbook once and read every sheet from it
+        with Workbook(file_path) as workbook:
+            print(f"File: {file_path}")
+            print(f"Sheets: {workbook.sheet_names}\n")
+
+            for sheet_name in workbook.sheet_names:
+                print(f"=== Sheet: {sheet_name} ===")
+                if headers_only:
+                    # Only the header and preview rows are read
+                    df = workbook.preview(sheet_name, rows=3)
+                else:
+                    df = workbook.read_sheet(sheet_name)
+                    print(f"Rows: {len(df)}")
+                print(f"Columns: {list(df.columns)}")
+                print(f"\nFirst 3 rows:")
+                print(df.head(3).to_string())
+                print("\n" + "="*80 + "\n")
+
     except Exception as e:
         print(f"Error analyzing Excel: {str(e)}")
 
 if __name__ == "__main__":
-    if len(sys.argv) < 2:
-        print("Usage: python analyze_excel.py <excel_path>")
+    args = [arg for arg in sys.argv[1:] if arg != "--headers"]
+    if len(args) < 1:
+        print("Usage: python analyze_excel.py [--headers] <excel_path>")
         sys.exit(1)
-    
-    analyze_excel(sys.argv[1])
+
+    analyze_excel(args[0], headers_only="--headers" in sys.argv[1:])
@@ -1,26 +1,55 @@
 import pdfplumber
 import json
+import os
 import sys
 
+def iter_pdf_sections(pdf_path):
+    """Yield one '=== Page N ===' section per page with text, closing each page after use"""
+    with pdfplumber.open(pdf_path) as pdf:
+        for page_num, page in enumerate(pdf.pages, 1):
+            text = page.extract_text()
+            page.close()
+            if text:
+                yield f"=== Page {page_num} ===\n{text}\n"
+
+def write_pdf_text(pdf_path, out):
+    """Stream the page sections of a PDF to a text file object"""
+    for i, section in enumerate(iter_pdf_sections(pdf_path)):
+        if i:
+            out.write("\n")
+        out.write(section)
+
 def extract_pdf_text(pdf_path):
     """Extract text from PDF file"""
-    text_content = []
-    
     try:
-        with pdfplumber.open(pdf_path) as pdf:
-            for page_num, page in enumerate(pdf.pages, 1):
-                text = page.extract_text()
-                if text:
-                    text_content.append(f"=== Page {page_num} ===\n{text}\n")
-        
-        return "\n".join(text_content)
+        return "\n".join(iter_pdf_sections(pdf_path))
     except Exception as e:
         return f"Error extracting PDF: {str(e)}"
 
+def save_pdf_text(pdf_path, output_path):
+    """Stream the extracted text to a temporary file, then move it over output_path"""
+    tmp_path = f"{output_path}.tmp"
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            write_pdf_text(pdf_path, f)
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
 if __name__ == "__main__":
     if len(sys.argv) < 2:
-        print("Usage: python extract_pdf.py <pdf_path>")
+        print("Usage: python extract_pdf.py <pdf_path> [output_path]")
         sys.exit(1)
     
     pdf_path = sys.argv[1]
-    print(extract_pdf_text(pdf_path))
+    try:
+        if len(sys.argv) > 2:
+            save_pdf_text(pdf_path, sys.argv[2])
+        else:
+            # Print page by page instead of building the whole text first
+            write_pdf_text(pdf_path, sys.stdout)
+            print()
+    except Exception as e:
+        print(f"Error extracting PDF: {str(e)}")
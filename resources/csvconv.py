@@ -1,6 +1,11 @@
 import os
+import shutil
+import sys
 import pandas as pd
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts'))
+from discovery import distinct_files, prefer_originals
+
 def convert_excel_to_csv():
     # Get the current working directory (where this script is located)
     current_directory = os.getcwd()
@@ -17,10 +22,17 @@ def convert_excel_to_csv():
 
     print(f"Found {len(excel_files)} Excel file(s). Starting conversion...\n")
 
-    for file in excel_files:
+    # Parse each distinct workbook once; byte-identical copies ("Copy of ...",
+    # "(1)") get a copy of the original's CSV instead of a second parse
+    paths = prefer_originals(os.path.join(current_directory, f) for f in excel_files)
+    distinct, aliases = distinct_files(paths)
+    converted = {}
+
+    for path in distinct:
+        file = path.name
         try:
             # Construct the full file path
-            file_path = os.path.join(current_directory, file)
+            file_path = str(path)
             
             # Read the Excel file (default loads the first sheet)
             # engine='openpyxl' is for .xlsx, 'xlrd' is for .xls usually auto-detected
@@ -33,13 +45,21 @@ def convert_excel_to_csv():
             
             # Save to CSV (index=False prevents pandas from adding a row number column)
             df.to_csv(csv_path, index=False, encoding='utf-8')
+            converted[path] = csv_path
             
             print(f"✅ Successfully converted: {file} -> {csv_filename}")
             
         except Exception as e:
             print(f"❌ Error converting {file}: {e}")
 
+    for alias, original in aliases.items():
+        if original not in converted:
+            continue
+        csv_filename = os.path.splitext(alias.name)[0] + '.csv'
+        shutil.copyfile(converted[original], os.path.join(current_directory, csv_filename))
+        print(f"♻️  {alias.name} is identical to {original.name}, copied -> {csv_filename}")
+
     print("\nAll tasks completed.")
 
 if __name__ == "__main__":
-    convert_excel_to_csv()
\ No newline at end of file
+    convert_excel_to_csv()
@@ -0,0 +1,415 @@
+"""
+Benchmark harness for the investor data converters
+Generates synthetic vendor files (CSV or XLSX) with the header variants
+and messy cells the real sources have, runs a converter end to end over
+them, and records throughput and peak memory overall and per stage. The
+overall figures come from a plain run; the per-stage ones from a second
+run with --profile, whose tracemalloc overhead would otherwise dominate
+the totals. Each run gets its own process so peak RSS figures don't leak
+from one into the next, and both are repeated --repeat times with the
+median of every figure kept, since single runs vary by 20-30% from
+noise alone. Generated files are kept under .cache/bench/ and reused.
+
+Results can be saved as a baseline and later runs compared against it;
+the run fails (exit status 1) when throughput drops or peak memory grows
+by more than --threshold.
+
+    python scripts/benchmark.py --sizes 10k 100k 1m --formats csv xlsx
+    python scripts/benchmark.py --sizes 10k --save-baseline
+    python scripts/benchmark.py --sizes 10k --threshold 0.25 --repeat 9
+"""
+import argparse
+import contextlib
+import csv
+import importlib.util
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from profiling import peak_rss_bytes
+
+# Bump when the figures change meaning so old baselines aren't compared
+BENCH_VERSION = 3
+# Bump when the generated data changes so cached files are rebuilt
+GENERATOR_VERSION = 2
+
+SCRIPTS_PATH = Path(__file__).parent
+BENCH_PATH = SCRIPTS_PATH.parent / ".cache" / "bench"
+BASELINE_FILE = BENCH_PATH / "baseline.json"
+RESULTS_FILE = BENCH_PATH / "results.json"
+
+CONVERTERS = {
+    'csv': ('convert-csv-to-json.py', 'CSV_FILES', ['--force']),
+    'xlsx': ('convert-excel-to-json.py', 'EXCEL_FILES', []),
+}
+
+SIZES = {'10k': 10_000, '100k': 100_000, '1m': 1_000_000}
+
+# Stages shorter than this in the baseline are too noisy to compare
+MIN_STAGE_SECONDS = 0.1
+
+# One synthetic source per header style: (header, canonical field) pairs,
+# with the spellings, padding and fuzzy variants vendors actually send.
+# Fields starting with '_' are vendor columns the schema doesn't use.
+HEADER_VARIANTS = {
+    "bench_angels": (
+        ("Unnamed: 0", '_row'), ("Investor Name", 'name'), ("Investor Type", 'type'),
+        ("Location", 'geography'), ("HQ", 'city'), ("Investment Stage", 'stage'), ("Sector", 'focus'),
+        ("Contact Email", 'email'), ("LinkedIn URL", 'linkedin'), ("Website", 'website'),
+        ("Check Size", 'ticket_size'), ("About", 'description'),
+    ),
+    "bench_vc": (
+        ("VC Firm name", 'name'), ("Category", 'type'), (" Region ", 'geography'),
+        ("Headquarters", 'city'), ("Funding  Stage", 'stage'), ("Industries", 'focus'),
+        ("Contact E-mail", 'email'), ("LinkedIn Profile", 'linkedin'), ("URL", 'website'),
+        ("Ticket", 'ticket_size'), ("Overview", 'description'), ("First Name", 'first name'),
+        ("Last Name", 'last name'), ("Title", 'title'), ("Phone", 'phone'),
+        ("Lead Source", '_lead_source'), ("Last Contacted", '_last_contacted'),
+    ),
+    "bench_family_offices": (
+        ("ANGEL NAME", 'name'), ("Kind", 'type'), ("Country", 'geography'),
+        ("City", 'city'), ("Stages", 'stage'), ("Verticals", 'focus'),
+        ("E-mail", 'email'), ("linkedin", 'linkedin'), ("Web", 'website'),
+        ("Investment Size", 'ticket_size'), ("Bio", 'description'), ("Notes", 'notes'),
+        ("Portfolio", 'portfolio'), ("Company Twitter", 'twitter url'),
+    ),
+}
+
+_WORDS = ("Alpha", "Blue", "Cedar", "Delta", "Summit", "Harbor", "Nova", "Peak",
+          "River", "Orbit", "Lotus", "Falcon", "Granite", "Zenith", "Saffron", "Atlas")
+_SUFFIXES = ("Capital", "Ventures", "Partners", "Fund", "Investments", "Angels", "LLP", "Pvt Ltd")
+_TYPES = ("VC", "Angel", "Angel Network", "Family Office", "Micro VC", "CVC", "PE")
+_GEOGRAPHIES = ("India", "UAE", "Saudi Arabia", "USA", "UK", "Germany", "Singapore")
+_CITIES = ("Bangalore", "Mumbai", "Dubai", "Riyadh", "New York", "London", "Berlin")
+_STAGES = ("Pre-Seed", "Seed", "Series A", "Series B", "Growth", "Seed, Series A")
+_SECTORS = ("Fintech", "SaaS", "Healthtech", "D2C", "Climate", "AI/ML", "Edtech, SaaS")
+_MISSING = ("", "n/a", "N/A", "-", "nan", " ")
+
+def _value(rng, field, i):
+    """One cell for a canonical field, messy in the ways the vendor files are"""
+    if field == '_row':
+        return str(i)
+    if field != 'name' and rng.random() < 0.15:
+        return rng.choice(_MISSING)
+    if field == '_lead_source':
+        return rng.choice(("Apollo", "Manual", "Referral", "Event"))
+    if field == '_last_contacted':
+        return f"2024-{rng.randrange(1, 13):02d}-{rng.randrange(1, 29):02d}"
+    if field == 'name':
+        if rng.random() < 0.01:
+            return rng.choice(_MISSING)
+        name = f"{rng.choice(_WORDS)} {rng.choice(_WORDS)} {rng.choice(_SUFFIXES)} {i}"
+        return f"  {name} " if rng.random() < 0.1 else name
+    if field == 'type':
+        return rng.choice(_TYPES)
+    if field == 'geography':
+        return rng.choice(_GEOGRAPHIES)
+    if field == 'city':
+        return rng.choice(_CITIES)
+    if field == 'stage':
+        return rng.choice(_STAGES)
+    if field == 'focus':
+        return rng.choice(_SECTORS)
+    if field == 'email':
+        return f"contact{i}@{rng.choice(_WORDS).lower()}.com"
+    if field in ('linkedin', 'twitter url'):
+        host = 'linkedin.com/company' if field == 'linkedin' else 'twitter.com'
+        return f"https://www.{host}/{rng.choice(_WORDS).lower()}-{i}"
+    if field == 'website':
+        return f"{rng.choice(['https://', 'http://', 'www.', ''])}{rng.choice(_WORDS).lower()}{i}.com"
+    if field == 'ticket_size':
+        low = rng.choice((25, 50, 100, 250, 500))
+        return rng.choice((f"${low}K - ${low * 4}K", f"USD {low},000", f"INR {low} Lakhs", str(low * 1000)))
+    if field == 'phone':
+        return f"+91 {rng.randrange(10**9, 10**10)}"
+    if field == 'first name':
+        return rng.choice(("Asha", "Omar", "Priya", "Sam", "Lena", "Ravi"))
+    if field == 'last name':
+        return rng.choice(("Shah", "Haddad", "Iyer", "Klein", "Morgan", "Das"))
+    if field == 'title':
+        return rng.choice(("Partner", "Principal", "Associate", "Managing Director"))
+    words = " ".join(rng.choice(_WORDS).lower() for _ in range(rng.randrange(4, 16)))
+    return words.capitalize() + "."
+
+def synthetic_rows(source_key, rows, seed=0):
+    """Yield the header row, then rows of cells for one synthetic source"""
+    columns = HEADER_VARIANTS[source_key]
+    rng = random.Random(f"{seed}:{source_key}")
+    yield [header for header, _ in columns]
+    for i in range(rows):
+        yield [_value(rng, field, i) for _, field in columns]
+
+def _split(rows):
+    """Split a row total across the synthetic sources"""
+    share, extra = divmod(rows, len(HEADER_VARIANTS))
+    return {key: share + (1 if i < extra else 0) for i, key in enumerate(HEADER_VARIANTS)}
+
+def dataset_files(fmt, rows, seed=0, data_path=BENCH_PATH / "data"):
+    """
+    Generate (or reuse) the synthetic files for a case and return
+    (data directory, {source key: filename})
+    """
+    data_dir = Path(data_path) / f"v{GENERATOR_VERSION}-{fmt}-{rows}-{seed}"
+    data_dir.mkdir(parents=True, exist_ok=True)
+    files = {}
+    for source_key, source_rows in _split(rows).items():
+        filename = f"{source_key}.{fmt}"
+        files[source_key] = filename
+        path = data_dir / filename
+        if path.exists():
+            continue
+        tmp_path = path.with_name(f"tmp-{filename}")
+        if fmt == 'csv':
+            with open(tmp_path, 'w', encoding='utf-8', newline='') as f:
+                csv.writer(f).writerows(synthetic_rows(source_key, source_rows, seed))
+        else:
+            from openpyxl import Workbook
+            workbook = Workbook(write_only=True)
+            sheet = workbook.create_sheet("Investors")
+            for row in synthetic_rows(source_key, source_rows, seed):
+                sheet.append(row)
+            workbook.save(tmp_path)
+        os.replace(tmp_path, path)
+    return data_dir, files
+
+def _load_converter(fmt):
+    filename, _, _ = CONVERTERS[fmt]
+    spec = importlib.util.spec_from_file_location(f"bench_{fmt}_converter", SCRIPTS_PATH / filename)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def run_case(fmt, rows, seed, result_path, profiled=False):
+    """
+    Run one converter over one synthetic dataset in this process and
+    write the end-to-end figures, or with profiled the per-stage ones, to
+    result_path
+    """
+    data_dir, files = dataset_files(fmt, rows, seed)
+    converter = _load_converter(fmt)
+    _, files_attr, extra_args = CONVERTERS[fmt]
+
+    with tempfile.TemporaryDirectory() as out_dir:
+        converter.BASE_PATH = data_dir
+        converter.OUTPUT_PATH = Path(out_dir)
+        setattr(converter, files_attr, files)
+        profile_path = Path(out_dir) / "profile.json"
+        args = extra_args + (['--profile', str(profile_path)] if profiled else [])
+
+        started = time.perf_counter()
+        with open(os.devnull, 'w', encoding='utf-8') as devnull, contextlib.redirect_stdout(devnull):
+            converter.main(args)
+        wall = time.perf_counter() - started
+
+        if profiled:
+            with open(profile_path, 'r', encoding='utf-8') as f:
+                profile = json.load(f)
+            result = {"stages": {entry["stage"]: entry for entry in profile["totals"]}}
+        else:
+            result = {
+                "format": fmt,
+                "rows": rows,
+                "wall_s": round(wall, 6),
+                "rows_per_s": round(rows / wall, 1),
+                "peak_rss_bytes": peak_rss_bytes(),
+                "output_bytes": (Path(out_dir) / "investors.json").stat().st_size,
+            }
+    with open(result_path, 'w', encoding='utf-8') as f:
+        json.dump(result, f, indent=2)
+
+def _case_key(fmt, rows):
+    return f"{fmt}-{rows}"
+
+def _run_in_process(fmt, rows, seed, profiled):
+    """run_case in a fresh process; returns its result, or None if it failed"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        result_path = Path(tmp_dir) / "result.json"
+        completed = subprocess.run([
+            sys.executable, __file__, '--run-case', fmt, str(rows),
+            '--seed', str(seed), '--result', str(result_path),
+        ] + (['--profiled'] if profiled else []))
+        if completed.returncode != 0 or not result_path.exists():
+            print(f"  ✗ {'profiled ' if profiled else ''}run failed (exit status {completed.returncode})")
+            return None
+        with open(result_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+def _median(entries, fields):
+    """The first entry with each of fields replaced by its median over all entries"""
+    merged = dict(entries[0])
+    for field in fields:
+        values = [entry.get(field) for entry in entries]
+        if None not in values:
+            merged[field] = statistics.median(values)
+    return merged
+
+def _repeated(fmt, rows, seed, profiled, repeat):
+    """All results of repeat runs, or None if one of them failed"""
+    runs = []
+    for _ in range(repeat):
+        result = _run_in_process(fmt, rows, seed, profiled)
+        if result is None:
+            return None
+        runs.append(result)
+    return runs
+
+def run_cases(formats, sizes, seed, repeat=1):
+    """
+    Run every (format, size) case repeat times plain, for the end-to-end
+    figures, and repeat times profiled, for the per-stage ones; return
+    {case key: result} with the median of each figure
+    """
+    results = {}
+    for fmt in formats:
+        for rows in sizes:
+            key = _case_key(fmt, rows)
+            print(f"Running {key} ({repeat} run(s) each plain and profiled)...")
+            plain = _repeated(fmt, rows, seed, False, repeat)
+            profiled = _repeated(fmt, rows, seed, True, repeat) if plain else None
+            if profiled is None:
+                results[key] = None
+                continue
+            result = _median(plain, ('wall_s', 'rows_per_s', 'peak_rss_bytes'))
+            result["runs"] = repeat
+            result["stages"] = {
+                name: _median([run["stages"][name] for run in profiled],
+                              ('wall_s', 'cpu_s', 'rows_per_s', 'peak_traced_bytes', 'peak_rss_bytes'))
+                for name in profiled[0]["stages"]
+            }
+            results[key] = result
+            print(f"  ✓ median {result['wall_s']:.2f} s, {result['rows_per_s']:,.0f} rows/s, "
+                  f"peak RSS {result['peak_rss_bytes'] / 2**20:.0f} MB")
+    return results
+
+def compare(results, baseline, threshold):
+    """
+    Print each case's figures next to the baseline and return the list of
+    regressions: throughput below (1 - threshold) x baseline, or peak
+    memory above (1 + threshold) x baseline
+    """
+    regressions = []
+
+    def check(label, current, previous, higher_is_better):
+        if current is None or not previous:
+            return
+        change = current / previous - 1
+        regressed = change < -threshold if higher_is_better else change > threshold
+        mark = "✗" if regressed else "✓"
+        print(f"  {mark} {label:36s} {previous:>14,.0f} -> {current:>14,.0f} ({change:+.1%})")
+        if regressed:
+            regressions.append(f"{label}: {change:+.1%}")
+
+    for key, result in results.items():
+        previous = baseline.get("cases", {}).get(key)
+        if result is None:
+            regressions.append(f"{key}: failed")
+            continue
+        if previous is None:
+            print(f"  {key}: no baseline")
+            continue
+        print(f"\n{key}:")
+        check(f"{key} rows/s", result["rows_per_s"], previous["rows_per_s"], True)
+        check(f"{key} peak RSS bytes", result["peak_rss_bytes"], previous["peak_rss_bytes"], False)
+        for name, stage in result["stages"].items():
+            before = previous["stages"].get(name)
+            if before is None or before["wall_s"] < MIN_STAGE_SECONDS:
+                continue
+            check(f"{key} {name} rows/s", stage["rows_per_s"], before["rows_per_s"], True)
+    return regressions
+
+def main(argv=None):
+    """Run the benchmark cases and compare them with the baseline"""
+    parser = argparse.ArgumentParser(description="Benchmark the investor converters on synthetic data")
+    parser.add_argument('--sizes', nargs='+', default=['10k', '100k', '1m'], metavar='SIZE',
+                        help="row totals to run: 10k, 100k, 1m or a number (default: all three)")
+    parser.add_argument('--formats', nargs='+', choices=sorted(CONVERTERS), default=['csv', 'xlsx'],
+                        help="converters to run (default: csv xlsx)")
+    parser.add_argument('--seed', type=int, default=0, help="seed for the synthetic data")
+    parser.add_argument('--output', default=str(RESULTS_FILE), metavar='FILE',
+                        help="where to write the results as JSON")
+    parser.add_argument('--baseline', default=str(BASELINE_FILE), metavar='FILE',
+                        help="baseline to compare with (and to write with --save-baseline)")
+    parser.add_argument('--save-baseline', action='store_true',
+                        help="store these results as the new baseline instead of comparing")
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help="allowed relative slowdown or memory growth (default: 0.2)")
+    parser.add_argument('--repeat', type=int, default=5, metavar='N',
+                        help="runs per case; the median of each figure is kept (default: 5)")
+    parser.add_argument('--run-case', nargs=2, metavar=('FORMAT', 'ROWS'), help=argparse.SUPPRESS)
+    parser.add_argument('--result', help=argparse.SUPPRESS)
+    parser.add_argument('--profiled', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.run_case:
+        fmt, rows = args.run_case
+        run_case(fmt, int(rows), args.seed, args.result, args.profiled)
+        return 0
+
+    try:
+        sizes = [SIZES[size.lower()] if size.lower() in SIZES else int(size) for size in args.sizes]
+    except ValueError:
+        parser.error(f"unknown size in {args.sizes}")
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1")
+
+    print("="*60)
+    print("Investor converter benchmark")
+    print("="*60)
+    for fmt in args.formats:
+        for rows in sizes:
+            dataset_files(fmt, rows, args.seed)
+
+    results = {
+        "version": BENCH_VERSION,
+        "python": platform.python_version(),
+        "machine": platform.platform(),
+        "cpus": os.cpu_count(),
+        "repeat": args.repeat,
+        "cases": run_cases(args.formats, sizes, args.seed, args.repeat),
+    }
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2)
+    print(f"\n✓ Wrote results to {output}")
+
+    baseline_path = Path(args.baseline)
+    if args.save_baseline:
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(baseline_path, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"✓ Saved baseline to {baseline_path}")
+        return 1 if None in results["cases"].values() else 0
+
+    if not baseline_path.exists():
+        print(f"No baseline at {baseline_path}; run with --save-baseline to create one")
+        return 1 if None in results["cases"].values() else 0
+
+    with open(baseline_path, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+    if baseline.get("version") != BENCH_VERSION:
+        print(f"Baseline {baseline_path} is from another benchmark version; "
+              f"run with --save-baseline to replace it")
+        return 1
+    print(f"\nComparing with {baseline_path} (threshold {args.threshold:.0%}, "
+          f"medians of {args.repeat} run(s) against {baseline.get('repeat')})")
+    regressions = compare(results["cases"], baseline, args.threshold)
+
+    print("\n" + "="*60)
+    if regressions:
+        print(f"✗ {len(regressions)} regression(s):")
+        for regression in regressions:
+            print(f"  {regression}")
+        return 1
+    print("✓ No regressions")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
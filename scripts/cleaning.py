@@ -0,0 +1,102 @@
+"""
+Vectorized record cleaning shared by the investor data converters
+Cleans a whole DataFrame column by column and only then builds the output
+dicts, instead of calling pd.isna and the string checks once per cell.
+"""
+import numpy as np
+import pandas as pd
+from pandas.api.types import infer_dtype, is_bool_dtype, is_numeric_dtype
+
+from records import record_builder
+
+def unique_columns(df):
+    """
+    Collapse duplicate column names the way df.to_dict('records') does:
+    the key keeps the position of its first occurrence but takes the
+    values of its last one.
+    """
+    if df.columns.is_unique:
+        return df
+    last = {col: i for i, col in enumerate(df.columns)}
+    names = list(dict.fromkeys(df.columns))
+    df = df.iloc[:, [last[col] for col in names]]
+    df.columns = names
+    return df
+
+def clean_column(values, missing_values, numbers_only):
+    """
+    Return a column as an object array of Python values, with None for
+    every cell that should be left out of the records.
+
+    Strings are stripped and dropped when they are empty or (case-
+    insensitively) one of missing_values. Other non-NaN values are kept,
+    or only int/float ones when numbers_only is set.
+    """
+    if is_numeric_dtype(values) or is_bool_dtype(values):
+        cleaned = values.to_numpy(dtype=object)
+        cleaned[values.isna().to_numpy()] = None
+        return cleaned
+
+    if values.dtype.kind == 'M' or values.dtype.kind == 'm':
+        if numbers_only:
+            return np.full(len(values), None, dtype=object)
+        # A copy: with copy-on-write the converted array can be read-only
+        cleaned = values.astype(object).to_numpy(copy=True)
+        cleaned[values.isna().to_numpy()] = None
+        return cleaned
+
+    raw = values.to_numpy(dtype=object)
+    present = values.notna().to_numpy()
+    if infer_dtype(values, skipna=True) in ('string', 'empty'):
+        is_str = present
+    else:
+        # Mixed column (typical for Excel): find the string cells once
+        is_str = np.fromiter((isinstance(v, str) for v in raw), dtype=bool, count=len(raw))
+
+    cleaned = np.full(len(values), None, dtype=object)
+
+    if is_str.any():
+        # Vendor columns repeat heavily, so strip and test each distinct
+        # string once and broadcast the result back through the codes
+        codes, uniques = pd.factorize(raw[is_str])
+        stripped = np.array([u.strip() for u in uniques], dtype=object)
+        missing = set(missing_values)
+        stripped[[i for i, u in enumerate(stripped) if not u or u.lower() in missing]] = None
+        cleaned[is_str] = stripped[codes]
+
+    other = present & ~is_str
+    if other.any():
+        if numbers_only:
+            other &= np.fromiter(
+                (isinstance(v, (int, float, np.integer, np.floating)) for v in raw),
+                dtype=bool, count=len(raw),
+            )
+        cleaned[other] = [v.item() if isinstance(v, np.generic) else v for v in raw[other]]
+
+    return cleaned
+
+def clean_frame(df, missing_values=(), numbers_only=False, require_clean_name=True):
+    """
+    Clean a DataFrame of investor rows and return one Investor per valid
+    row, with dropped cells left unset.
+
+    Rows need a name: with require_clean_name the cleaned 'name' must be
+    non-empty, otherwise only the raw value must be non-empty (a blank
+    name is then dropped from the record but the row is kept).
+    """
+    if 'name' not in df.columns or df.empty:
+        return []
+
+    df = unique_columns(df)
+    missing_values = list(missing_values)
+    columns = list(df.columns)
+    cleaned = [clean_column(df[col], missing_values, numbers_only) for col in columns]
+
+    if require_clean_name:
+        name = pd.Series(cleaned[columns.index('name')], dtype=object)
+    else:
+        name = df['name'].astype(object)
+    keep = (name.notna() & (name != '') & (name != 0)).to_numpy()
+
+    build = record_builder(columns)
+    return [build(row) for row in zip(*(col[keep] for col in cleaned))]
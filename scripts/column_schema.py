@@ -0,0 +1,173 @@
+"""
+Column schema shared by the investor data converters
+Declares every canonical investor field once, with the header aliases
+vendors use for it, its value type and an optional value normalizer
+(from normalize.py), which standardize_columns applies to the cells of
+that type. The schema is compiled at import time into a header lookup
+table; headers that match no alias exactly are matched fuzzily (e.g.
+'Contact E-mail' -> email, 'VC Firm name' -> name). Resolved mappings
+are cached per source and header row, so chunked and per-sheet reads
+don't redo the work.
+"""
+import re
+from collections import namedtuple
+from difflib import get_close_matches
+
+from normalize import canonical_url, normalize_emails
+
+# Minimum difflib similarity for a header to match an alias fuzzily
+FUZZY_CUTOFF = 0.85
+
+Field = namedtuple('Field', ['name', 'aliases', 'type', 'normalizer'])
+Field.__new__.__defaults__ = ('text', None)
+
+# Cell values a field's normalizer is given, by field type; other cells
+# (a number in a URL column, an Excel date) are kept as they are
+TYPE_VALUES = {
+    'text': (str,),
+    'email': (str,),
+    'url': (str,),
+    'money': (str, int, float),
+    'phone': (str, int, float),
+}
+
+SCHEMA = (
+    Field('name', ('investor name', 'vc name', 'firm name', 'company', 'angel name',
+                   'company name', 'fund name', 'organization')),
+    Field('type', ('investor type', 'category', 'kind')),
+    Field('geography', ('location', 'region', 'country', 'countries of investment')),
+    Field('city', ('hq', 'headquarters', 'global hq')),
+    Field('stage', ('investment stage', 'funding stage', 'stages', 'stage of investment')),
+    Field('focus', ('sector', 'industry', 'focus area', 'verticals', 'sectors',
+                    'industries', 'vertical', 'focus sector')),
+    Field('email', ('contact email', 'e-mail'), 'email', normalize_emails),
+    Field('linkedin', ('linkedin url', 'linkedin profile'), 'url', canonical_url),
+    Field('website', ('url', 'web', 'site'), 'url', canonical_url),
+    Field('personal linkedin url', (), 'url', canonical_url),
+    Field('company linkedin url', (), 'url', canonical_url),
+    Field('twitter url', (), 'url', canonical_url),
+    Field('ticket_size', ('check size', 'investment size', 'ticket'), 'money'),
+    Field('description', ('about', 'bio', 'overview')),
+    Field('notes', ('how to reach them',)),
+    Field('portfolio', ('portfolio companies',)),
+    Field('contact_person', ('contact', 'contact name', 'partner', 'key person',
+                             'firm owner/ executive')),
+    Field('phone', ('mobile', 'contact number', 'tel'), 'phone'),
+)
+
+_SPACE_RE = re.compile(r'\s+')
+
+def header_key(header):
+    """Lower-cased header with surrounding and repeated whitespace removed"""
+    return _SPACE_RE.sub(' ', str(header).strip().lower())
+
+def _compile(schema):
+    lookup = {}
+    for field in schema:
+        if field.type not in TYPE_VALUES:
+            raise ValueError(f"unknown type {field.type!r} for field {field.name!r}")
+        for alias in (field.name,) + tuple(field.aliases):
+            lookup[header_key(alias)] = field.name
+    return lookup
+
+FIELDS = {field.name: field for field in SCHEMA}
+ALIASES = _compile(SCHEMA)
+_ALIAS_KEYS = sorted(ALIASES)
+
+# header key -> (canonical field or None, matched alias); shared by all sources
+_resolved = {}
+# (source, header keys) -> {header key: canonical field}
+_source_mappings = {}
+
+def resolve_header(key):
+    """Return (canonical field, alias) for a header key, or (None, None)"""
+    if key not in _resolved:
+        if key in ALIASES:
+            _resolved[key] = (ALIASES[key], key)
+        else:
+            close = get_close_matches(key, _ALIAS_KEYS, n=1, cutoff=FUZZY_CUTOFF)
+            _resolved[key] = (ALIASES[close[0]], close[0]) if close else (None, None)
+    return _resolved[key]
+
+def column_mapping(headers, source=None):
+    """
+    Return {header key: canonical field} for a source's header row. Exact
+    alias matches come first; a fuzzy match is only used for a field no
+    header of the row names exactly (see fuzzy_matches).
+    """
+    keys = tuple(header_key(h) for h in headers)
+    cache_key = (source, keys)
+    if cache_key in _source_mappings:
+        return _source_mappings[cache_key]
+
+    mapping = {}
+    fuzzy = {}
+    for key in keys:
+        field, alias = resolve_header(key)
+        if field is None:
+            continue
+        if alias == key:
+            mapping[key] = field
+        else:
+            fuzzy[key] = (field, alias)
+    exact_fields = set(mapping.values())
+    for key, (field, alias) in fuzzy.items():
+        if field not in exact_fields:
+            mapping[key] = field
+
+    _source_mappings[cache_key] = mapping
+    return mapping
+
+def fuzzy_matches(headers, source=None):
+    """{header key: (canonical field, alias)} for the headers of a row mapped fuzzily"""
+    mapping = column_mapping(headers, source)
+    matches = {}
+    for key, field in mapping.items():
+        alias = resolve_header(key)[1]
+        if alias != key:
+            matches[key] = (field, alias)
+    return matches
+
+def report_fuzzy_matches(matches):
+    """Print the fuzzy header matches of a source, for checking new vendor files"""
+    for key, (field, alias) in matches.items():
+        print(f"  Mapped column '{key}' to {field} (close to '{alias}')")
+
+def used_columns(headers, source=None, keep=()):
+    """
+    Positions of the headers worth reading: those mapped to a canonical
+    field, plus any whose key is in keep (e.g. vendor columns the records
+    carry as they are). The mapping of the pruned header row is cached
+    too, so standardize_columns on the pruned frame doesn't redo it.
+    """
+    mapping = column_mapping(headers, source)
+    keys = [header_key(h) for h in headers]
+    positions = [i for i, key in enumerate(keys) if key in mapping or key in keep]
+    pruned = tuple(keys[i] for i in positions)
+    _source_mappings.setdefault(
+        (source, pruned), {key: mapping[key] for key in pruned if key in mapping}
+    )
+    return positions
+
+def _normalize_cells(normalizer, value_types):
+    def normalize(value):
+        return normalizer(value) if isinstance(value, value_types) else value
+    return normalize
+
+def standardize_columns(df, source_file=None):
+    """
+    Rename a DataFrame's columns to the canonical field names and apply
+    each field's normalizer to its cells
+    """
+    mapping = column_mapping(df.columns, source_file)
+    # Normalize column names (lowercase, strip spaces)
+    df.columns = [header_key(col) for col in df.columns]
+    df = df.rename(columns=mapping)
+
+    # Positional, since two headers can map to the same field
+    for position, column in enumerate(df.columns):
+        field = FIELDS.get(column)
+        if field is not None and field.normalizer is not None:
+            normalize = _normalize_cells(field.normalizer, TYPE_VALUES[field.type])
+            df.iloc[:, position] = df.iloc[:, position].map(normalize)
+    return df
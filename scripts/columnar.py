@@ -0,0 +1,104 @@
+"""
+Columnar, dictionary-encoded investor export
+Stores every field as one array instead of repeating the key names in
+every object, and replaces low-cardinality string fields (source, focus,
+city, ...) with integer codes into a dictionary of distinct values.
+
+Layout:
+    {
+      "version": 1,
+      "count": <number of records>,
+      "shapes": [[key, ...], ...],      distinct key lists, in record order
+      "shape": [i, ...],                per record, index into "shapes"
+      "columns": {
+        key: {"values": [...]}                        plain column, or
+        key: {"dictionary": [...], "codes": [...]}    dictionary-encoded
+      }
+    }
+A column only holds values for the records whose shape contains its key,
+so missing fields cost nothing and the original key order is preserved.
+"""
+import json
+import os
+from pathlib import Path
+
+COLUMNAR_VERSION = 1
+
+# Dictionary-encode a column when its distinct values are at most this
+# fraction of its length
+MAX_DICTIONARY_RATIO = 0.5
+
+def _hashable(value):
+    """Dictionary keys must keep True/1/1.0 apart"""
+    return (type(value).__name__, value)
+
+def encode_column(values, max_ratio=MAX_DICTIONARY_RATIO):
+    """Encode one column, dictionary-encoding it if it repeats enough"""
+    dictionary = {}
+    codes = []
+    for value in values:
+        key = _hashable(value)
+        code = dictionary.get(key)
+        if code is None:
+            code = dictionary[key] = len(dictionary)
+            if len(dictionary) > max_ratio * len(values):
+                return {"values": list(values)}
+        codes.append(code)
+    return {"dictionary": [value for _, value in dictionary], "codes": codes}
+
+def encode_columnar(records, max_ratio=MAX_DICTIONARY_RATIO):
+    """Encode a list of record dicts into the columnar layout"""
+    shapes = {}
+    shape = []
+    columns = {}
+    for record in records:
+        keys = tuple(record)
+        code = shapes.get(keys)
+        if code is None:
+            code = shapes[keys] = len(shapes)
+        shape.append(code)
+        for key, value in record.items():
+            columns.setdefault(key, []).append(value)
+
+    return {
+        "version": COLUMNAR_VERSION,
+        "count": len(records),
+        "shapes": [list(keys) for keys in shapes],
+        "shape": shape,
+        "columns": {
+            key: encode_column(values, max_ratio) for key, values in columns.items()
+        },
+    }
+
+def decode_column(column):
+    """Return the plain list of values of an encoded column"""
+    if "dictionary" in column:
+        dictionary = column["dictionary"]
+        return [dictionary[code] for code in column["codes"]]
+    return column["values"]
+
+def decode_columnar(data):
+    """Rebuild the list of record dicts from the columnar layout"""
+    if data.get("version") != COLUMNAR_VERSION:
+        raise ValueError(f"Unsupported columnar version: {data.get('version')}")
+    columns = {key: iter(decode_column(column)) for key, column in data["columns"].items()}
+    shapes = [[(key, columns[key]) for key in keys] for keys in data["shapes"]]
+    return [
+        {key: next(values) for key, values in shapes[code]}
+        for code in data["shape"]
+    ]
+
+def write_columnar(records, path, max_ratio=MAX_DICTIONARY_RATIO):
+    """Encode records and write them as minified JSON, atomically"""
+    path = Path(path)
+    data = encode_columnar(records, max_ratio)
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+    os.replace(tmp_path, path)
+    return data
+
+def read_columnar(path):
+    """Read a columnar export and return the rebuilt records"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return decode_columnar(json.load(f))
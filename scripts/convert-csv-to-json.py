@@ -3,10 +3,30 @@ CSV to JSON Converter for Investor/VC Database
 Converts CSV files into a consolidated JSON format
 """
 import pandas as pd
+import argparse
+import contextlib
 import json
 import os
+from collections import Counter
 from pathlib import Path
 
+from cleaning import clean_frame
+from column_schema import fuzzy_matches, report_fuzzy_matches, standardize_columns
+from columnar import write_columnar
+from csv_dialect import DEFAULT_DIALECT, detect_dialects
+from csv_reader import ENGINES, iter_source, read_source
+from dedup import deduplicate
+from discovery import distinct_files, report_aliases
+from hashing import file_sha256
+from json_writer import BACKENDS, DEFAULT_BACKEND, JsonArrayWriter, NdjsonWriter, write_json
+from normalize import normalize_records
+from parallel import map_ordered
+from profiling import enable as enable_profiling, finish as finish_profiling, stage
+from records import Investor, json_default
+from search_index import INDEX_FILE, SearchIndexBuilder
+from shards import ShardSet, write_shards
+from sqlite_store import SqliteWriter, write_sqlite
+
 # Define the base path
 BASE_PATH = Path(__file__).parent.parent / "resources"
 OUTPUT_PATH = Path(__file__).parent.parent / "public" / "data"
@@ -19,162 +39,439 @@ CSV_FILES = {
     "us_uae_eu": "US UAE EU VC List.csv"
 }
 
-def standardize_columns(df, source_file):
-    """Standardize column names across different CSV files"""
-    # Create a mapping of possible column names to standard names
-    column_mapping = {
-        # Name variations
-        'name': 'name',
-        'investor name': 'name',
-        'vc name': 'name',
-        'firm name': 'name',
-        'company': 'name',
-        'angel name': 'name',
-        'company name': 'name',
-        'fund name': 'name',
-        'organization': 'name',
-        
-        # Type variations
-        'type': 'type',
-        'investor type': 'type',
-        'category': 'type',
-        'kind': 'type',
-        
-        # Geography variations
-        'geography': 'geography',
-        'location': 'geography',
-        'region': 'geography',
-        'country': 'geography',
-        'city': 'city',
-        'hq': 'city',
-        'headquarters': 'city',
-        
-        # Stage variations
-        'stage': 'stage',
-        'investment stage': 'stage',
-        'funding stage': 'stage',
-        'stages': 'stage',
-        
-        # Focus variations
-        'focus': 'focus',
-        'sector': 'focus',
-        'industry': 'focus',
-        'focus area': 'focus',
-        'verticals': 'focus',
-        'sectors': 'focus',
-        'industries': 'focus',
-        'vertical': 'focus',
-        
-        # Contact variations
-        'email': 'email',
-        'contact email': 'email',
-        'e-mail': 'email',
-        'linkedin': 'linkedin',
-        'linkedin url': 'linkedin',
-        'linkedin profile': 'linkedin',
-        'website': 'website',
-        'url': 'website',
-        'web': 'website',
-        'site': 'website',
-        
-        # Additional info
-        'ticket size': 'ticket_size',
-        'check size': 'ticket_size',
-        'investment size': 'ticket_size',
-        'ticket': 'ticket_size',
-        'description': 'description',
-        'notes': 'notes',
-        'portfolio': 'portfolio',
-        'about': 'description',
-        'bio': 'description',
-        'overview': 'description',
-        
-        # Contact person
-        'contact': 'contact_person',
-        'contact name': 'contact_person',
-        'partner': 'contact_person',
-        'key person': 'contact_person',
-        
-        # Phone
-        'phone': 'phone',
-        'mobile': 'phone',
-        'contact number': 'phone',
-        'tel': 'phone',
-    }
-    
-    # Normalize column names (lowercase, strip spaces)
-    df.columns = df.columns.str.lower().str.strip()
-    
-    # Rename columns based on mapping
-    renamed_cols = {}
-    for col in df.columns:
-        if col in column_mapping:
-            renamed_cols[col] = column_mapping[col]
-    
-    df = df.rename(columns=renamed_cols)
-    
-    return df
+# Geography mapping
+GEOGRAPHY_MAP = {
+    "indian_vc_jumbo": "India",
+    "indian_vc": "India",
+    "uae_middle_east": "UAE & Middle East",
+    "us_uae_eu": "US, UAE & EU"
+}
+
+# Cell values treated as missing (compared after stripping, case-insensitive)
+MISSING_VALUES = ['nan', 'n/a', 'na', '-', '']
+
+# Manifest of already-ingested sources, stored next to the output.
+# Bump MANIFEST_VERSION whenever parsing, cleaning or a side output's
+# format changes so that cached records and side outputs from an older
+# converter are not reused.
+MANIFEST_FILE = "investors.manifest.json"
+MANIFEST_VERSION = 7
+
+# Directory (under OUTPUT_PATH) for --shards output
+SHARDS_DIR = "shards"
+
+# Database (under OUTPUT_PATH) for --sqlite output
+SQLITE_FILE = "investors.sqlite3"
+
+def report_skipped(skipped, file_path):
+    """Print how many malformed lines a read dropped"""
+    if skipped:
+        print(f"  ⚠ Skipped {skipped} malformed line(s) in {file_path.name} (too many fields)")
 
-def process_csv_file(file_path, source_name, source_geography):
-    """Process a single CSV file and return standardized data"""
+def process_csv_file(file_path, source_name, source_geography, engine='c',
+                     dialect=DEFAULT_DIALECT):
+    """Process a single CSV file and return a standardized DataFrame"""
     print(f"Processing {file_path.name}...")
+    if dialect != DEFAULT_DIALECT:
+        print(f"  Reading as {dialect.describe()}")
     
     try:
-        # Read CSV file
-        df = pd.read_csv(file_path, encoding='utf-8', on_bad_lines='skip')
+        # Read the schema's columns of the CSV file as text
+        with stage('read_csv', source_name) as timed:
+            df, skipped = read_source(file_path, source_name, engine, dialect)
+            timed.rows = len(df)
+        report_skipped(skipped, file_path)
         
         if df.empty:
             print(f"  Warning: Empty file {file_path}")
-            return []
+            return pd.DataFrame()
         
         # Standardize columns
-        df = standardize_columns(df, source_name)
+        report_fuzzy_matches(fuzzy_matches(df.columns, source_name))
+        with stage('standardize', source_name) as timed:
+            df = standardize_columns(df, source_name)
+            timed.rows = len(df)
         
         # Add source metadata
         df['source'] = source_name
         df['source_geography'] = source_geography
         
-        # Convert to dict records
-        records = df.to_dict('records')
-        
-        print(f"  ✓ Extracted {len(records)} records from {file_path.name}")
-        return records
+        print(f"  ✓ Extracted {len(df)} records from {file_path.name}")
+        return df
         
     except Exception as e:
         print(f"  ✗ Error processing {file_path}: {str(e)}")
-        return []
+        return pd.DataFrame()
 
-def clean_investor_data(investors):
-    """Clean and validate investor data"""
-    cleaned = []
-    
-    for inv in investors:
-        # Skip empty records
-        if not inv.get('name') or pd.isna(inv.get('name')):
+def clean_investor_data(df):
+    """
+    Clean and validate investor data, returning one Investor per valid row.
+    Strings are stripped and MISSING_VALUES dropped column by column;
+    non-string values are kept only if numeric, and rows without a name
+    are removed.
+    """
+    return clean_frame(df, missing_values=MISSING_VALUES, numbers_only=True,
+                       require_clean_name=True)
+
+def ingest_csv_source(file_path, source_name, source_geography, engine='c',
+                      dialect=DEFAULT_DIALECT):
+    """Read and clean one CSV source, returning (row_count, cleaned records)"""
+    df = process_csv_file(file_path, source_name, source_geography, engine, dialect)
+    with stage('clean', source_name) as timed:
+        records = clean_investor_data(df)
+        timed.rows = len(df)
+    with stage('normalize', source_name) as timed:
+        normalize_records(records)
+        timed.rows = len(records)
+    return len(df), records
+
+def discover_sources():
+    """
+    Return [(source_key, file_path)] for the CSV_FILES that exist, leaving
+    out any file that is a byte-identical or near-identical copy of an earlier source.
+    """
+    found = []
+    for source_key, filename in CSV_FILES.items():
+        file_path = BASE_PATH / filename
+        
+        if not file_path.exists():
+            print(f"⚠ Warning: File not found: {filename}")
+            print(f"  Looking in: {BASE_PATH}")
             continue
+        found.append((source_key, file_path))
+    
+    distinct, aliases = distinct_files([file_path for _, file_path in found])
+    report_aliases(aliases)
+    return [(source_key, file_path) for source_key, file_path in found if file_path in distinct]
+
+def stream_csv_file(file_path, source_name, source_geography, chunksize,
+                    dialect=DEFAULT_DIALECT):
+    """
+    Read a CSV file in chunks of chunksize rows and yield
+    (row_count, cleaned records) per chunk. Malformed lines are skipped
+    and reported once the file is read.
+    """
+    chunks = iter_source(file_path, source_name, chunksize, dialect)
+    skipped = 0
+    first = True
+    while True:
+        with stage('read_csv', source_name) as timed:
+            chunk, chunk_skipped = next(chunks, (None, 0))
+            timed.rows = 0 if chunk is None else len(chunk)
+        if chunk is None:
+            break
+        skipped += chunk_skipped
+        if first:
+            report_fuzzy_matches(fuzzy_matches(chunk.columns, source_name))
+            first = False
+        with stage('standardize', source_name) as timed:
+            chunk = standardize_columns(chunk, source_name)
+            chunk['source'] = source_name
+            chunk['source_geography'] = source_geography
+            timed.rows = len(chunk)
+        with stage('clean', source_name) as timed:
+            records = clean_investor_data(chunk)
+            timed.rows = len(chunk)
+        with stage('normalize', source_name) as timed:
+            normalize_records(records)
+            timed.rows = len(records)
+        yield len(chunk), records
+    report_skipped(skipped, file_path)
+
+def load_manifest(manifest_file):
+    """Load the ingest manifest, or return an empty one if missing/stale"""
+    empty = {"version": MANIFEST_VERSION, "sources": {}}
+    if not manifest_file.exists():
+        return empty
+    try:
+        with open(manifest_file, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"  Warning: Ignoring unreadable manifest {manifest_file}: {str(e)}")
+        return empty
+    if manifest.get("version") != MANIFEST_VERSION:
+        return empty
+    for entry in manifest["sources"].values():
+        entry["records"] = [Investor.from_mapping(record) for record in entry["records"]]
+    return manifest
+
+def save_manifest(manifest_file, manifest):
+    """Write the ingest manifest atomically"""
+    tmp_file = manifest_file.with_suffix(manifest_file.suffix + '.tmp')
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, default=json_default)
+    os.replace(tmp_file, manifest_file)
+
+def cached_source(entry, file_path, source_geography):
+    """
+    Return the manifest entry for file_path if it is still valid, else None.
+    Size and mtime are checked first; the content hash is only recomputed
+    when they differ, so a touched-but-unchanged file is still reused.
+    """
+    if not entry or entry.get("source_geography") != source_geography:
+        return None
+    stat = file_path.stat()
+    if entry.get("size") != stat.st_size:
+        return None
+    if entry.get("mtime_ns") == stat.st_mtime_ns:
+        return entry
+    if entry.get("sha256") != file_sha256(file_path):
+        return None
+    entry["mtime_ns"] = stat.st_mtime_ns
+    return entry
+
+def side_output_current(previous, path, data_hash):
+    """
+    True if path is the side output the last run built from the output
+    with content hash data_hash, and hasn't been touched since
+    """
+    path = Path(path)
+    if not previous or not path.exists():
+        return False
+    stat = path.stat()
+    return (previous.get("path") == str(path)
+            and previous.get("data_sha256") == data_hash
+            and previous.get("size") == stat.st_size
+            and previous.get("mtime_ns") == stat.st_mtime_ns)
+
+def side_output_entry(path, data_hash):
+    """Manifest entry for a side output just built from data_hash"""
+    stat = Path(path).stat()
+    return {"path": str(path), "data_sha256": data_hash,
+            "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+class RecordSummary:
+    """Running counts for the summary statistics printed after a conversion"""
+    
+    SECTIONS = (
+        ("🌍 By Geography:", 'source_geography', None),
+        ("💼 By Type:", 'type', None),
+        ("📈 By Stage:", 'stage', 10),
+    )
+    CONTACTS = (('email', 'With email:'), ('linkedin', 'With LinkedIn:'),
+                ('website', 'With website:'))
+    
+    def __init__(self):
+        self.total = 0
+        self.counts = {field: Counter() for _, field, _ in self.SECTIONS}
+        self.contacts = Counter()
+    
+    def add_many(self, records):
+        """Count every record of an iterable"""
+        for record in records:
+            self.total += 1
+            for field, counter in self.counts.items():
+                if field in record:
+                    counter[record[field]] += 1
+            self.contacts.update(key for key, _ in self.CONTACTS if key in record)
+    
+    def print(self):
+        """Print the per-field counts and contact coverage"""
+        if not self.total:
+            return
+        for title, field, limit in self.SECTIONS:
+            if self.counts[field]:
+                print(f"\n{title}")
+                for value, count in self.counts[field].most_common(limit):
+                    print(f"  {str(value):20s}: {count:4d} investors")
+        
+        print("\n📧 Contact Information:")
+        for key, label in self.CONTACTS:
+            count = self.contacts[key]
+            print(f"  {label:20s} {count:4d} ({count/self.total*100:.1f}%)")
+
+def report_shards(index):
+    """Print the files listed in a shard index"""
+    print(f"✓ Wrote {sum(len(entries) for entries in index['shards'].values())} shards")
+    for field, entries in index["shards"].items():
+        for entry in entries:
+            values = ' | '.join(str(value) for value in entry['values'])
+            print(f"  {field}={values}: {entry['count']} records -> {entry['file']}")
+
+def stream_main(args):
+    """
+    Streaming conversion: each CSV is read in chunks and its records are
+    written out as soon as they are cleaned, so peak memory depends on
+    the chunk size, not on the input size. The manifest is not used.
+    """
+    print("="*60)
+    print("CSV to JSON Conversion for Investor Directory (streaming)")
+    print("="*60)
+    print(f"Base path: {BASE_PATH}\n")
+    
+    OUTPUT_PATH.mkdir(parents=True, exist_ok=True)
+    output_file = OUTPUT_PATH / ("investors.ndjson" if args.format == 'ndjson' else "investors.json")
+    
+    stats = {}
+    total_rows = 0
+    summary = RecordSummary()
+    search_index = SearchIndexBuilder() if args.search_index else None
+    
+    sources = discover_sources()
+    with stage('sniff'):
+        dialects = detect_dialects([file_path for _, file_path in sources])
+    
+    # Every writer is aborted (temp files removed, SQLite connection
+    # closed) if anything fails before all of them are finished
+    with contextlib.ExitStack() as outputs:
+        if args.format == 'ndjson':
+            writer = outputs.enter_context(NdjsonWriter(output_file, args.json_backend))
+        else:
+            writer = outputs.enter_context(JsonArrayWriter(output_file, backend=args.json_backend))
+        debug_copy = (outputs.enter_context(JsonArrayWriter(args.debug_copy, indent=2))
+                      if args.debug_copy else None)
+        shards = outputs.enter_context(ShardSet(OUTPUT_PATH / SHARDS_DIR)) if args.shards else None
+        sqlite = outputs.enter_context(SqliteWriter(OUTPUT_PATH / SQLITE_FILE)) if args.sqlite else None
         
-        # Clean up the record
-        clean_inv = {}
-        for key, value in inv.items():
-            # Skip NaN values
-            if pd.isna(value):
-                continue
-            # Convert to string and strip
-            if isinstance(value, str):
-                value = value.strip()
-                if value and value.lower() not in ['nan', 'n/a', 'na', '-', '']:
-                    clean_inv[key] = value
-            elif isinstance(value, (int, float)):
-                clean_inv[key] = value
+        for source_key, file_path in sources:
+            print(f"Streaming {file_path.name}...")
+            if dialects[file_path] != DEFAULT_DIALECT:
+                print(f"  Reading as {dialects[file_path].describe()}")
+            rows = written = 0
+            try:
+                for row_count, records in stream_csv_file(
+                    file_path, source_key,
+                    GEOGRAPHY_MAP.get(source_key, "Unknown"),
+                    args.chunksize, dialects[file_path]
+                ):
+                    rows += row_count
+                    with stage('write', source_key) as timed:
+                        writer.write_many(records)
+                        timed.rows = len(records)
+                    written += len(records)
+                    if debug_copy is not None:
+                        with stage('debug_copy', source_key) as timed:
+                            debug_copy.write_many(records)
+                            timed.rows = len(records)
+                    if shards is not None:
+                        with stage('shards', source_key) as timed:
+                            shards.add_many(records)
+                            timed.rows = len(records)
+                    if search_index is not None:
+                        with stage('search_index', source_key) as timed:
+                            search_index.add_many(records)
+                            timed.rows = len(records)
+                    if sqlite is not None:
+                        with stage('sqlite', source_key) as timed:
+                            sqlite.add_many(records)
+                            timed.rows = len(records)
+                    with stage('summary', source_key) as timed:
+                        summary.add_many(records)
+                        timed.rows = len(records)
+                print(f"  ✓ Streamed {written} records from {file_path.name} ({rows} rows)")
+            except Exception as e:
+                # Chunks already written stay in the output
+                print(f"  ✗ Error processing {file_path} after {rows} rows: {str(e)}")
+            stats[source_key] = written
+            total_rows += rows
         
-        # Only add if we have a name
-        if clean_inv.get('name'):
-            cleaned.append(clean_inv)
+        writer.close()
+        print(f"\n✓ Successfully created {output_file}")
+        if debug_copy is not None:
+            debug_copy.close()
+            print(f"✓ Wrote indented copy {debug_copy.path}")
+        if shards is not None:
+            with stage('shards'):
+                shard_index = shards.close()
+            report_shards(shard_index)
+        if search_index is not None:
+            with stage('search_index'):
+                search_index.write(OUTPUT_PATH / INDEX_FILE, file_sha256(output_file))
+            print(f"✓ Wrote {OUTPUT_PATH / INDEX_FILE}")
+        if sqlite is not None:
+            with stage('sqlite'):
+                sqlite.close()
+            print(f"✓ Wrote {sqlite.path} ({sqlite.count} rows)")
+        # All finished: nothing left to abort
+        outputs.pop_all()
+    
+    total = writer.count
+    print(f"✓ Total investors: {total} (from {total_rows} rows)")
     
-    return cleaned
+    print("\n📊 Records by Source:")
+    for source, count in stats.items():
+        print(f"  {source:20s}: {count:4d} records")
+    
+    summary.print()
+    
+    print("\n" + "="*60)
+    print("✓ CONVERSION COMPLETE!")
+    print("="*60)
 
-def main():
+def main(argv=None):
     """Main conversion function"""
+    parser = argparse.ArgumentParser(description="Convert investor CSV files to JSON")
+    parser.add_argument('--force', action='store_true',
+                        help="ignore the manifest and re-parse every source")
+    parser.add_argument('--jobs', type=int, default=1, metavar='N',
+                        help="parse sources in N worker processes (0 = one per CPU)")
+    parser.add_argument('--stream', action='store_true',
+                        help="read CSVs in chunks and write records incrementally")
+    parser.add_argument('--engine', choices=ENGINES, default='c',
+                        help="pandas CSV parser; pyarrow is offered when installed "
+                             "and can't be used with --stream (default: c)")
+    parser.add_argument('--chunksize', type=int, default=50000, metavar='ROWS',
+                        help="rows per chunk in --stream mode (default: 50000)")
+    parser.add_argument('--format', choices=['json', 'ndjson'], default='json',
+                        help="output format in --stream mode (default: json)")
+    parser.add_argument('--json-backend', choices=sorted(BACKENDS), default=DEFAULT_BACKEND,
+                        help=f"JSON encoder (default: {DEFAULT_BACKEND})")
+    parser.add_argument('--debug-copy', metavar='FILE',
+                        help="also write an indented copy of the output to FILE for reading "
+                             "and diffing (the output itself is minified)")
+    parser.add_argument('--shards', action='store_true',
+                        help=f"also write minified per-geography/per-source shards "
+                             f"and an index to {SHARDS_DIR}/")
+    parser.add_argument('--columnar', action='store_true',
+                        help="also write a columnar, dictionary-encoded investors.columnar.json")
+    parser.add_argument('--search-index', action='store_true',
+                        help=f"also build the inverted search index {INDEX_FILE}")
+    parser.add_argument('--sqlite', action='store_true',
+                        help=f"also write an indexed SQLite database with full-text search "
+                             f"to {SQLITE_FILE}")
+    parser.add_argument('--dedup', action='store_true',
+                        help="merge duplicate investors found across sources")
+    parser.add_argument('--dedup-report', metavar='FILE',
+                        help="with --dedup, write the list of merges to FILE as JSON")
+    parser.add_argument('--profile', nargs='?', const='', metavar='FILE',
+                        help="time each stage per source (wall, CPU, peak memory, rows/s), "
+                             "print a table and write the figures to FILE as JSON if given")
+    parser.add_argument('--profile-stage', metavar='STAGE',
+                        help="with --profile, also run STAGE (e.g. read_csv, standardize, "
+                             "clean, write) under cProfile and print its top functions")
+    args = parser.parse_args(argv)
+    
+    if args.stream and args.columnar:
+        parser.error("--columnar needs every record in memory and can't be used with --stream")
+    if args.stream and args.dedup:
+        parser.error("--dedup needs every record in memory and can't be used with --stream")
+    if args.format == 'ndjson' and args.search_index:
+        parser.error("the search index points into investors.json, so it can't be built "
+                     "with --format ndjson")
+    if args.stream and args.engine != 'c':
+        parser.error("the pyarrow engine can't read in chunks, so it can't be used with --stream")
+    
+    if args.profile_stage and args.profile is None:
+        parser.error("--profile-stage needs --profile")
+    
+    if args.profile is not None:
+        enable_profiling(args.profile_stage)
+        if args.jobs != 1:
+            # Stages that run in worker processes can't be timed from here
+            print("Profiling: parsing sources in this process (--jobs ignored)")
+            args.jobs = 1
+    
+    if args.stream:
+        stream_main(args)
+    else:
+        convert(args)
+    
+    if args.profile is not None:
+        finish_profiling(args.profile or None)
+
+def convert(args):
+    """Convert every source in memory, reusing unchanged sources from the manifest"""
+    
     print("="*60)
     print("CSV to JSON Conversion for Investor Directory")
     print("="*60)
@@ -182,45 +479,85 @@ def main():
     
     all_investors = []
     stats = {}
+    before_count = 0
     
-    # Geography mapping
-    geography_map = {
-        "indian_vc_jumbo": "India",
-        "indian_vc": "India",
-        "uae_middle_east": "UAE & Middle East",
-        "us_uae_eu": "US, UAE & EU"
-    }
+    manifest_file = OUTPUT_PATH / MANIFEST_FILE
+    manifest = {"version": MANIFEST_VERSION, "sources": {}}
+    if not args.force:
+        manifest = load_manifest(manifest_file)
+    new_sources = {}
     
-    # Process each CSV file
-    for source_key, filename in CSV_FILES.items():
-        file_path = BASE_PATH / filename
-        
-        if not file_path.exists():
-            print(f"⚠ Warning: File not found: {filename}")
-            print(f"  Looking in: {BASE_PATH}")
-            continue
-        
-        data = process_csv_file(
-            file_path, 
-            source_key,
-            geography_map.get(source_key, "Unknown")
+    # Find the sources that changed since the last run
+    sources = []
+    pending = []
+    for source_key, file_path in discover_sources():
+        source_geography = GEOGRAPHY_MAP.get(source_key, "Unknown")
+        entry = cached_source(
+            manifest["sources"].get(source_key), file_path, source_geography
         )
-        all_investors.extend(data)
-        stats[source_key] = len(data)
+        
+        if entry is not None:
+            print(f"Skipping {file_path.name} (unchanged)")
+        else:
+            pending.append((file_path, source_key, source_geography))
+        sources.append((source_key, entry))
+    
+    # Detect each changed file's encoding and delimiter (cached by content)
+    with stage('sniff'):
+        dialects = detect_dialects([file_path for file_path, _, _ in pending])
+    
+    # Parse the changed sources, in worker processes if --jobs > 1
+    tasks = [(file_path, source_key, source_geography, args.engine, dialects[file_path])
+             for file_path, source_key, source_geography in pending]
+    parsed = map_ordered(ingest_csv_source, tasks, args.jobs)
+    fresh = {}
+    for (file_path, source_key, source_geography), (row_count, records) in zip(pending, parsed):
+        stat = file_path.stat()
+        # Records are cleaned one at a time, so cleaning per source
+        # gives the same result as cleaning the merged list.
+        fresh[source_key] = {
+            "path": file_path.name,
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "sha256": file_sha256(file_path),
+            "source_geography": source_geography,
+            "row_count": row_count,
+            "records": records,
+        }
+    reused_all = not fresh
+    
+    # Merge in CSV_FILES order so the output doesn't depend on --jobs
+    for source_key, entry in sources:
+        entry = fresh.get(source_key, entry)
+        # Don't cache failed or empty reads, retry them next run
+        if entry["row_count"]:
+            new_sources[source_key] = entry
+        all_investors.extend(entry["records"])
+        stats[source_key] = entry["row_count"]
+        before_count += entry["row_count"]
     
     # Clean the data
     print("\n" + "="*60)
     print("Cleaning and validating data...")
     print("="*60)
     
-    before_count = len(all_investors)
-    all_investors = clean_investor_data(all_investors)
     after_count = len(all_investors)
     
     print(f"  Before cleaning: {before_count} records")
     print(f"  After cleaning: {after_count} records")
     print(f"  Removed: {before_count - after_count} invalid records")
     
+    if args.dedup:
+        with stage('dedup') as timed:
+            timed.rows = len(all_investors)
+            all_investors, merges = deduplicate(all_investors)
+        merged_count = after_count - len(all_investors)
+        print(f"  Merged duplicates: {merged_count} records into {len(merges)} investors")
+        if args.dedup_report:
+            with open(args.dedup_report, 'w', encoding='utf-8') as f:
+                json.dump(merges, f, indent=2, ensure_ascii=False)
+            print(f"  Merge report: {args.dedup_report}")
+    
     # Create output directory if it doesn't exist
     OUTPUT_PATH.mkdir(parents=True, exist_ok=True)
     
@@ -230,10 +567,87 @@ def main():
     print(f"Saving to {output_file}...")
     print("="*60)
     
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(all_investors, f, indent=2, ensure_ascii=False)
+    # Nothing to do if every source was reused and the output is the one
+    # we wrote last time (same sources in the same order, same options,
+    # file untouched)
+    previous_output = manifest.get("output")
+    output_options = {"dedup": args.dedup}
+    up_to_date = (
+        reused_all
+        and previous_output is not None
+        and previous_output.get("options") == output_options
+        and list(manifest["sources"]) == list(new_sources)
+        and output_file.exists()
+        and previous_output.get("size") == output_file.stat().st_size
+        and previous_output.get("mtime_ns") == output_file.stat().st_mtime_ns
+    )
+    
+    if up_to_date:
+        print(f"✓ {output_file} is up to date")
+        output_hash = previous_output.get("sha256") or file_sha256(output_file)
+    else:
+        with stage('write') as timed:
+            timed.rows = write_json(all_investors, output_file, backend=args.json_backend)
+        print(f"✓ Successfully created {output_file}")
+        output_hash = file_sha256(output_file)
+    
+    # Side outputs are rebuilt unless the last run built them from this
+    # same output and they haven't changed since; entries for outputs
+    # not asked for this time are kept for a later run
+    side_outputs = dict(manifest.get("side_outputs", {}))
+    
+    def needs_build(name, path):
+        return not side_output_current(side_outputs.get(name), path, output_hash)
+    
+    if args.debug_copy and needs_build('debug_copy', args.debug_copy):
+        with stage('debug_copy') as timed:
+            timed.rows = write_json(all_investors, args.debug_copy, indent=2,
+                                    backend=args.json_backend)
+        side_outputs['debug_copy'] = side_output_entry(args.debug_copy, output_hash)
+        print(f"✓ Wrote indented copy {args.debug_copy}")
+    
+    shard_index = OUTPUT_PATH / SHARDS_DIR / "index.json"
+    if args.shards and needs_build('shards', shard_index):
+        with stage('shards') as timed:
+            index = write_shards(all_investors, OUTPUT_PATH / SHARDS_DIR)
+            timed.rows = len(all_investors)
+        side_outputs['shards'] = side_output_entry(shard_index, output_hash)
+        report_shards(index)
+    
+    columnar_file = OUTPUT_PATH / "investors.columnar.json"
+    if args.columnar and needs_build('columnar', columnar_file):
+        with stage('columnar') as timed:
+            write_columnar(all_investors, columnar_file)
+            timed.rows = len(all_investors)
+        side_outputs['columnar'] = side_output_entry(columnar_file, output_hash)
+        print(f"✓ Wrote {columnar_file} ({columnar_file.stat().st_size:,} bytes)")
+    
+    index_file = OUTPUT_PATH / INDEX_FILE
+    if args.search_index and needs_build('search_index', index_file):
+        with stage('search_index') as timed:
+            search_index = SearchIndexBuilder()
+            search_index.add_many(all_investors)
+            search_index.write(index_file, output_hash)
+            timed.rows = len(all_investors)
+        side_outputs['search_index'] = side_output_entry(index_file, output_hash)
+        print(f"✓ Wrote {index_file} ({index_file.stat().st_size:,} bytes)")
+    
+    sqlite_file = OUTPUT_PATH / SQLITE_FILE
+    if args.sqlite and needs_build('sqlite', sqlite_file):
+        with stage('sqlite') as timed:
+            timed.rows = write_sqlite(all_investors, sqlite_file)
+        side_outputs['sqlite'] = side_output_entry(sqlite_file, output_hash)
+        print(f"✓ Wrote {sqlite_file} ({sqlite_file.stat().st_size:,} bytes)")
+    
+    stat = output_file.stat()
+    save_manifest(manifest_file, {
+        "version": MANIFEST_VERSION,
+        "output": {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns,
+                   "sha256": output_hash, "options": output_options},
+        "side_outputs": side_outputs,
+        "sources": new_sources,
+    })
     
-    print(f"✓ Successfully created {output_file}")
     print(f"✓ Total investors: {len(all_investors)}")
     
     # Generate summary statistics
@@ -245,38 +659,11 @@ def main():
     for source, count in stats.items():
         print(f"  {source:20s}: {count:4d} records")
     
-    if all_investors:
-        df = pd.DataFrame(all_investors)
-        
-        if 'source_geography' in df.columns:
-            print("\n🌍 By Geography:")
-            geo_counts = df['source_geography'].value_counts()
-            for geo, count in geo_counts.items():
-                print(f"  {geo:20s}: {count:4d} investors")
-        
-        if 'type' in df.columns:
-            print("\n💼 By Type:")
-            type_counts = df['type'].value_counts()
-            for inv_type, count in type_counts.items():
-                print(f"  {str(inv_type):20s}: {count:4d} investors")
-        
-        if 'stage' in df.columns:
-            print("\n📈 By Stage:")
-            stage_counts = df['stage'].value_counts().head(10)
-            for stage, count in stage_counts.items():
-                print(f"  {str(stage):20s}: {count:4d} investors")
-        
-        # Count records with contact info
-        print("\n📧 Contact Information:")
-        if 'email' in df.columns:
-            email_count = df['email'].notna().sum()
-            print(f"  With email:          {email_count:4d} ({email_count/len(df)*100:.1f}%)")
-        if 'linkedin' in df.columns:
-            linkedin_count = df['linkedin'].notna().sum()
-            print(f"  With LinkedIn:       {linkedin_count:4d} ({linkedin_count/len(df)*100:.1f}%)")
-        if 'website' in df.columns:
-            website_count = df['website'].notna().sum()
-            print(f"  With website:        {website_count:4d} ({website_count/len(df)*100:.1f}%)")
+    with stage('summary') as timed:
+        summary = RecordSummary()
+        summary.add_many(all_investors)
+        timed.rows = summary.total
+    summary.print()
     
     print("\n" + "="*60)
     print("✓ CONVERSION COMPLETE!")
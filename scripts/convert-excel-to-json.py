@@ -3,10 +3,19 @@ Excel to JSON Converter for Investor/VC Database
 Converts multiple Excel files into a consolidated JSON format
 """
 import pandas as pd
-import json
+import argparse
 import os
 from pathlib import Path
 
+from cleaning import clean_frame
+from column_schema import fuzzy_matches, report_fuzzy_matches, standardize_columns
+from discovery import distinct_files, report_aliases
+from json_writer import BACKENDS, DEFAULT_BACKEND, write_json
+from normalize import normalize_records
+from parallel import map_ordered
+from profiling import enable as enable_profiling, finish as finish_profiling, stage
+from workbook import Workbook
+
 # Define the base path
 BASE_PATH = Path(__file__).parent.parent / "resources"
 OUTPUT_PATH = Path(__file__).parent.parent / "public" / "data"
@@ -19,98 +28,47 @@ EXCEL_FILES = {
     "us_uae_eu": "US UAE EU VC List.xlsx"
 }
 
-def standardize_columns(df, source_file):
-    """Standardize column names across different Excel files"""
-    # Create a mapping of possible column names to standard names
-    column_mapping = {
-        # Name variations
-        'name': 'name',
-        'investor name': 'name',
-        'vc name': 'name',
-        'firm name': 'name',
-        'company': 'name',
-        'angel name': 'name',
-        
-        # Type variations
-        'type': 'type',
-        'investor type': 'type',
-        'category': 'type',
-        
-        # Geography variations
-        'geography': 'geography',
-        'location': 'geography',
-        'region': 'geography',
-        'country': 'geography',
-        'city': 'city',
-        
-        # Stage variations
-        'stage': 'stage',
-        'investment stage': 'stage',
-        'funding stage': 'stage',
-        
-        # Focus variations
-        'focus': 'focus',
-        'sector': 'focus',
-        'industry': 'focus',
-        'focus area': 'focus',
-        'verticals': 'focus',
-        
-        # Contact variations
-        'email': 'email',
-        'contact email': 'email',
-        'linkedin': 'linkedin',
-        'website': 'website',
-        'url': 'website',
-        
-        # Additional info
-        'ticket size': 'ticket_size',
-        'check size': 'ticket_size',
-        'investment size': 'ticket_size',
-        'description': 'description',
-        'notes': 'notes',
-        'portfolio': 'portfolio'
-    }
-    
-    # Normalize column names (lowercase, strip spaces)
-    df.columns = df.columns.str.lower().str.strip()
-    
-    # Rename columns based on mapping
-    renamed_cols = {}
-    for col in df.columns:
-        if col in column_mapping:
-            renamed_cols[col] = column_mapping[col]
-    
-    df = df.rename(columns=renamed_cols)
+def sheet_records(df, source_name, source_geography):
+    """Standardize and clean one sheet's DataFrame and return its records"""
+    if df.empty:
+        return []
     
-    return df
+    # Standardize columns (and normalize URLs and emails)
+    report_fuzzy_matches(fuzzy_matches(df.columns, source_name))
+    with stage('standardize', source_name) as timed:
+        df = standardize_columns(df, source_name)
+        timed.rows = len(df)
+    
+    # Add source metadata
+    df['source'] = source_name
+    df['source_geography'] = source_geography
+    
+    # Clean and convert to dict records
+    with stage('clean', source_name) as timed:
+        records = clean_investor_data(df)
+        timed.rows = len(df)
+    
+    # Structured location / ticket fields
+    with stage('normalize', source_name) as timed:
+        normalize_records(records)
+        timed.rows = len(records)
+    return records
 
 def process_excel_file(file_path, source_name, source_geography):
     """Process a single Excel file and return standardized data"""
     print(f"Processing {file_path}...")
     
     try:
-        # Read Excel file
-        xls = pd.ExcelFile(file_path)
         all_data = []
         
-        # Process each sheet
-        for sheet_name in xls.sheet_names:
-            print(f"  Reading sheet: {sheet_name}")
-            df = pd.read_excel(file_path, sheet_name=sheet_name)
-            
-            if df.empty:
-                continue
-            
-            # Standardize columns
-            df = standardize_columns(df, source_name)
-            
-            # Add source metadata
-            df['source'] = source_name
-            df['source_geography'] = source_geography
-            
-            # Convert to dict records
-            records = df.to_dict('records')
-            all_data.extend(records)
+        # Open the workbook once and stream each sheet from it
+        with Workbook(file_path) as workbook:
+            for sheet_name in workbook.sheet_names:
+                print(f"  Reading sheet: {sheet_name}")
+                with stage('read_excel', source_name) as timed:
+                    df = workbook.read_sheet(sheet_name)
+                    timed.rows = len(df)
+                all_data.extend(sheet_records(df, source_name, source_geography))
         
         print(f"  Extracted {len(all_data)} records from {file_path}")
         return all_data
@@ -119,35 +77,88 @@ def process_excel_file(file_path, source_name, source_geography):
         print(f"  Error processing {file_path}: {str(e)}")
         return []
 
-def clean_investor_data(investors):
-    """Clean and validate investor data"""
-    cleaned = []
-    
-    for inv in investors:
-        # Skip empty records
-        if not inv.get('name') or pd.isna(inv.get('name')):
+def load_sheet(file_path, sheet_name, source_name, source_geography):
+    """Pool worker: read one sheet, returning (records, error message)"""
+    try:
+        with Workbook(file_path) as workbook:
+            df = workbook.read_sheet(sheet_name)
+        return sheet_records(df, source_name, source_geography), None
+    except Exception as e:
+        return [], str(e)
+
+def process_excel_files_parallel(sources, jobs):
+    """
+    Read every sheet of every (file_path, source_name, source_geography)
+    in a process pool and return one record list per file, in order.
+    A file with any failing sheet yields no records, as in the serial path.
+    """
+    tasks = []
+    errors = {}
+    for file_path, source_name, source_geography in sources:
+        try:
+            with Workbook(file_path) as workbook:
+                sheet_names = workbook.sheet_names
+        except Exception as e:
+            errors[file_path] = str(e)
+            sheet_names = []
+        for sheet_name in sheet_names:
+            tasks.append((file_path, sheet_name, source_name, source_geography))
+    
+    results = map_ordered(load_sheet, tasks, jobs)
+    
+    per_file = {file_path: [] for file_path, _, _ in sources}
+    for (file_path, sheet_name, _, _), (records, error) in zip(tasks, results):
+        if error is not None:
+            errors.setdefault(file_path, error)
+        per_file[file_path].extend(records)
+    
+    all_data = []
+    for file_path, _, _ in sources:
+        print(f"Processing {file_path}...")
+        if file_path in errors:
+            print(f"  Error processing {file_path}: {errors[file_path]}")
+            all_data.append([])
             continue
-        
-        # Clean up the record
-        clean_inv = {}
-        for key, value in inv.items():
-            # Skip NaN values
-            if pd.isna(value):
-                continue
-            # Convert to string and strip
-            if isinstance(value, str):
-                value = value.strip()
-                if value:  # Only add non-empty strings
-                    clean_inv[key] = value
-            else:
-                clean_inv[key] = value
-        
-        cleaned.append(clean_inv)
-    
-    return cleaned
+        print(f"  Extracted {len(per_file[file_path])} records from {file_path}")
+        all_data.append(per_file[file_path])
+    return all_data
+
+def clean_investor_data(df):
+    """
+    Clean and validate investor data, returning one Investor per row
+    with a name. Strings are stripped column by column and blank or NaN cells
+    are left out of the records.
+    """
+    return clean_frame(df, missing_values=[''], numbers_only=False,
+                       require_clean_name=False)
 
-def main():
+def main(argv=None):
     """Main conversion function"""
+    parser = argparse.ArgumentParser(description="Convert investor Excel files to JSON")
+    parser.add_argument('--jobs', type=int, default=1, metavar='N',
+                        help="read sheets in N worker processes (0 = one per CPU)")
+    parser.add_argument('--json-backend', choices=sorted(BACKENDS), default=DEFAULT_BACKEND,
+                        help=f"JSON encoder (default: {DEFAULT_BACKEND})")
+    parser.add_argument('--debug-copy', metavar='FILE',
+                        help="also write an indented copy of the output to FILE for reading "
+                             "and diffing (the output itself is minified)")
+    parser.add_argument('--profile', nargs='?', const='', metavar='FILE',
+                        help="time each stage per source (wall, CPU, peak memory, rows/s), "
+                             "print a table and write the figures to FILE as JSON if given")
+    parser.add_argument('--profile-stage', metavar='STAGE',
+                        help="with --profile, also run STAGE (e.g. read_excel, standardize, "
+                             "clean, write) under cProfile and print its top functions")
+    args = parser.parse_args(argv)
+    
+    if args.profile_stage and args.profile is None:
+        parser.error("--profile-stage needs --profile")
+    if args.profile is not None:
+        enable_profiling(args.profile_stage)
+        if args.jobs != 1:
+            # Stages that run in worker processes can't be timed from here
+            print("Profiling: reading sheets in this process (--jobs ignored)")
+            args.jobs = 1
+    
     print("Starting Excel to JSON conversion...")
     print(f"Base path: {BASE_PATH}")
     
@@ -162,6 +173,7 @@ def main():
     }
     
     # Process each Excel file
+    sources = []
     for source_key, filename in EXCEL_FILES.items():
         file_path = BASE_PATH / filename
         
@@ -169,16 +181,24 @@ def main():
             print(f"Warning: File not found: {file_path}")
             continue
         
-        data = process_excel_file(
-            file_path, 
-            source_key,
-            geography_map.get(source_key, "Unknown")
-        )
-        all_investors.extend(data)
+        sources.append((file_path, source_key, geography_map.get(source_key, "Unknown")))
     
-    # Clean the data
-    print("\nCleaning investor data...")
-    all_investors = clean_investor_data(all_investors)
+    # Parse each distinct workbook once
+    distinct, aliases = distinct_files([file_path for file_path, _, _ in sources])
+    report_aliases(aliases)
+    sources = [source for source in sources if source[0] in distinct]
+    
+    if args.jobs == 1:
+        for file_path, source_key, source_geography in sources:
+            data = process_excel_file(file_path, source_key, source_geography)
+            all_investors.extend(data)
+    else:
+        # Sheets are merged back in file and sheet order, so the output
+        # is identical to the serial run
+        for data in process_excel_files_parallel(sources, args.jobs):
+            all_investors.extend(data)
+    
+    # Records were cleaned per sheet (see sheet_records)
     
     # Create output directory if it doesn't exist
     OUTPUT_PATH.mkdir(parents=True, exist_ok=True)
@@ -187,15 +207,23 @@ def main():
     output_file = OUTPUT_PATH / "investors.json"
     print(f"\nSaving {len(all_investors)} investors to {output_file}...")
     
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(all_investors, f, indent=2, ensure_ascii=False)
+    with stage('write') as timed:
+        timed.rows = write_json(all_investors, output_file, backend=args.json_backend)
     
     print(f"✓ Successfully created {output_file}")
+    if args.debug_copy:
+        with stage('debug_copy') as timed:
+            timed.rows = write_json(all_investors, args.debug_copy, indent=2,
+                                    backend=args.json_backend)
+        print(f"✓ Wrote indented copy {args.debug_copy}")
     print(f"✓ Total investors: {len(all_investors)}")
     
     # Generate summary statistics
     print("\n=== Summary Statistics ===")
-    df = pd.DataFrame(all_investors)
+    with stage('summary') as timed:
+        # Investors are slotted mappings: give pandas their present keys only
+        df = pd.DataFrame([investor.to_dict() for investor in all_investors])
+        timed.rows = len(df)
     
     if 'source_geography' in df.columns:
         print("\nBy Geography:")
@@ -206,6 +234,9 @@ def main():
         print(df['type'].value_counts())
     
     print("\n✓ Conversion complete!")
+    
+    if args.profile is not None:
+        finish_profiling(args.profile or None)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,157 @@
+"""
+Encoding and dialect detection for vendor CSV files
+Looks at the first SNIFF_BYTES of a file for a byte order mark, the text
+encoding (UTF-8, UTF-16, cp1252, falling back to latin-1), the delimiter
+and the quoting style, and returns them as a CsvDialect whose
+read_options() go straight to pandas.read_csv.
+
+Results are cached under .cache/ keyed by the file's SHA-256, so each
+version of a file is sniffed once. Because of that cache, a sample that
+looks like UTF-8 is confirmed against the rest of the file before the
+encoding is trusted: a cp1252 byte late in an export would otherwise
+fail the parse half way through.
+"""
+import codecs
+import csv
+import json
+import os
+from collections import namedtuple
+from pathlib import Path
+
+from hashing import file_sha256
+
+DIALECT_VERSION = 1
+CACHE_PATH = Path(__file__).parent.parent / ".cache" / "csv-dialects.json"
+SNIFF_BYTES = 16 * 1024
+DELIMITERS = ',;\t|'
+
+# Longest BOMs first: the UTF-32 LE mark starts with the UTF-16 LE one
+_BOMS = (
+    (codecs.BOM_UTF32_LE, 'utf-32'),
+    (codecs.BOM_UTF32_BE, 'utf-32'),
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+)
+
+class CsvDialect(namedtuple('CsvDialect', ['encoding', 'delimiter', 'quotechar',
+                                           'skipinitialspace'])):
+    """
+    How to read one CSV file. Embedded quotes are always taken to be
+    doubled (""), as in every export seen so far: the sniffer can only
+    confirm that when the sample happens to contain one.
+    """
+    __slots__ = ()
+
+    def read_options(self):
+        """Keyword arguments for pandas.read_csv"""
+        options = dict(encoding=self.encoding, sep=self.delimiter, quotechar=self.quotechar)
+        # Left out when off: the pyarrow engine rejects the option
+        if self.skipinitialspace:
+            options['skipinitialspace'] = True
+        return options
+
+    def describe(self):
+        """Short text such as: cp1252, ';'-delimited"""
+        delimiter = {'\t': 'tab'}.get(self.delimiter, repr(self.delimiter))
+        return f"{self.encoding}, {delimiter}-delimited"
+
+CsvDialect.__new__.__defaults__ = ('utf-8', ',', '"', False)
+DEFAULT_DIALECT = CsvDialect()
+
+def _decodes(path, encoding):
+    """True if the whole file decodes cleanly in encoding"""
+    decoder = codecs.getincrementaldecoder(encoding)()
+    try:
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                decoder.decode(block)
+        decoder.decode(b'', final=True)
+    except UnicodeDecodeError:
+        return False
+    return True
+
+def detect_encoding(path, sample):
+    """Encoding of a file, from its BOM or its bytes"""
+    for bom, encoding in _BOMS:
+        if sample.startswith(bom):
+            return encoding
+
+    # UTF-16 without a BOM: ASCII text leaves every other byte NUL
+    if sample:
+        even, odd = sample[0::2].count(0), sample[1::2].count(0)
+        if odd > len(sample) // 4 and even == 0:
+            return 'utf-16-le'
+        if even > len(sample) // 4 and odd == 0:
+            return 'utf-16-be'
+
+    try:
+        sample.decode('utf-8')
+        utf8_sample = True
+    except UnicodeDecodeError as e:
+        # A character cut off at the end of the sample is not an error
+        utf8_sample = e.reason == 'unexpected end of data'
+    if utf8_sample and _decodes(path, 'utf-8'):
+        return 'utf-8'
+    if _decodes(path, 'cp1252'):
+        return 'cp1252'
+    return 'latin-1'
+
+def sniff_dialect(path, sample_size=SNIFF_BYTES):
+    """Detect a file's encoding, delimiter and quoting from its first bytes"""
+    with open(path, 'rb') as f:
+        sample = f.read(sample_size)
+    encoding = detect_encoding(path, sample)
+
+    text = sample.decode(encoding, errors='ignore')
+    if len(sample) == sample_size and '\n' in text:
+        # Drop the last, probably partial, line
+        text = text[:text.rindex('\n')]
+    try:
+        sniffed = csv.Sniffer().sniff(text, delimiters=DELIMITERS)
+    except csv.Error:
+        return CsvDialect(encoding)
+    header = text.splitlines()[0] if text.strip() else ''
+    if sniffed.delimiter not in header:
+        # The sniffer guessed from the data rows; trust the header
+        return CsvDialect(encoding)
+    return CsvDialect(encoding, sniffed.delimiter, sniffed.quotechar or '"',
+                      sniffed.skipinitialspace)
+
+def _load_cache(cache_path):
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+        if cache.get("version") == DIALECT_VERSION:
+            return cache
+    except (OSError, ValueError):
+        pass
+    return {"version": DIALECT_VERSION, "files": {}}
+
+def detect_dialects(paths, cache_path=CACHE_PATH):
+    """
+    Return {path: CsvDialect} for the given files, sniffing only those
+    whose content hash isn't in the cache yet
+    """
+    cache_path = Path(cache_path)
+    cache = _load_cache(cache_path)
+    dialects = {}
+    changed = False
+    for path in paths:
+        digest = file_sha256(path)
+        entry = cache["files"].get(digest)
+        if entry is None:
+            dialect = sniff_dialect(path)
+            cache["files"][digest] = dialect._asdict()
+            changed = True
+        else:
+            dialect = CsvDialect(**entry)
+        dialects[path] = dialect
+
+    if changed:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_name(cache_path.name + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(cache, f, indent=2)
+        os.replace(tmp_path, cache_path)
+    return dialects
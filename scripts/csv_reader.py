@@ -0,0 +1,83 @@
+"""
+Schema-aware CSV reader for the investor data converters
+The header row is read first and matched against the shared column
+schema; only columns that map to a canonical field, or that the records
+keep as vendor fields (records.ATTRIBUTES), are kept. Every column is
+read as text, so values reach cleaning as the vendor wrote them and
+chunked reads can't disagree on a column's type.
+
+How a file is encoded and delimited comes from a CsvDialect (see
+csv_dialect.py); the default is comma-separated UTF-8.
+
+Rows with more fields than the header are skipped and counted. The
+pyarrow engine checks row width while tokenizing, so it parses only the
+kept columns (usecols). The C engine stops checking row width once
+usecols is given, so it parses every column and drops the unused ones
+straight after.
+"""
+import warnings
+
+import pandas as pd
+from pandas.errors import ParserWarning
+
+from column_schema import used_columns
+from csv_dialect import DEFAULT_DIALECT
+from records import ATTRIBUTES
+
+try:
+    import pyarrow  # noqa: F401
+    ENGINES = ('c', 'pyarrow')
+except ImportError:
+    ENGINES = ('c',)
+
+def read_header(file_path, dialect=DEFAULT_DIALECT):
+    """Column names of a CSV file, as pandas names them (duplicates suffixed)"""
+    return list(pd.read_csv(file_path, nrows=0, **dialect.read_options()).columns)
+
+def _count_skipped(caught):
+    """Malformed rows reported by pandas warnings; other warnings are re-issued"""
+    skipped = 0
+    for warning in caught:
+        if issubclass(warning.category, ParserWarning):
+            # C: one warning per block, one "Skipping line" entry per row;
+            # pyarrow: one warning per row
+            skipped += max(1, str(warning.message).count("Skipping line"))
+        else:
+            warnings.warn_explicit(warning.message, warning.category,
+                                   warning.filename, warning.lineno)
+    return skipped
+
+def read_source(file_path, source_name, engine='c', dialect=DEFAULT_DIALECT):
+    """Read the schema's columns of a CSV file; return (DataFrame, skipped row count)"""
+    if engine not in ENGINES:
+        raise ValueError(f"CSV engine '{engine}' is not available (choose from {', '.join(ENGINES)})")
+    headers = read_header(file_path, dialect)
+    positions = used_columns(headers, source_name, keep=ATTRIBUTES)
+
+    options = dict(dtype=str, on_bad_lines='warn', engine=engine, **dialect.read_options())
+    if engine == 'pyarrow':
+        options.update(header=0, names=headers, usecols=[headers[i] for i in positions])
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter('always', ParserWarning)
+        df = pd.read_csv(file_path, **options)
+    if engine != 'pyarrow':
+        df = df.iloc[:, positions]
+    return df, _count_skipped(caught)
+
+def iter_source(file_path, source_name, chunksize, dialect=DEFAULT_DIALECT):
+    """
+    Read the schema's columns of a CSV file in chunks of up to chunksize
+    rows (C engine), yielding (DataFrame, skipped row count) per chunk
+    """
+    positions = used_columns(read_header(file_path, dialect), source_name, keep=ATTRIBUTES)
+    with pd.read_csv(file_path, dtype=str, on_bad_lines='warn', chunksize=chunksize,
+                     **dialect.read_options()) as reader:
+        chunks = iter(reader)
+        while True:
+            # Catch warnings around the read only, not across the yield
+            with warnings.catch_warnings(record=True) as caught:
+                warnings.simplefilter('always', ParserWarning)
+                chunk = next(chunks, None)
+            if chunk is None:
+                break
+            yield chunk.iloc[:, positions], _count_skipped(caught)
@@ -0,0 +1,208 @@
+"""
+Fuzzy deduplication across investor sources
+Finds records that describe the same investor (e.g. the same partner in
+both Indian VC lists) and merges them, without comparing all pairs.
+
+Matching:
+  - same normalized email, or same personal LinkedIn handle: a match if
+    the firm names agree too (a person can move firms, or run a fund and
+    an angel network under one email)
+  - otherwise records are grouped into blocks by website host (or email
+    domain, or first firm-name token) and, inside each block, sorted by
+    name and compared only with their next WINDOW neighbours: people
+    match on a similar first + last name, firm-only rows on a similar
+    firm name, unless the two rows carry different emails or LinkedIn
+    handles (different partners of the same firm)
+so the work is O(n log n) plus a constant number of comparisons per row.
+"""
+import re
+import unicodedata
+from difflib import SequenceMatcher
+from urllib.parse import urlsplit
+
+WINDOW = 5
+SIMILARITY = 0.9
+
+FREE_MAIL_DOMAINS = {
+    'gmail.com', 'googlemail.com', 'yahoo.com', 'yahoo.co.in', 'hotmail.com',
+    'outlook.com', 'live.com', 'icloud.com', 'me.com', 'aol.com',
+    'protonmail.com', 'rediffmail.com', 'zoho.com',
+}
+
+LEGAL_SUFFIXES = {
+    'pvt', 'private', 'ltd', 'limited', 'llp', 'llc', 'inc', 'co', 'corp',
+    'company', 'the', 'gmbh', 'plc', 'fz', 'fze', 'fzco',
+}
+
+_WORD_RE = re.compile(r'[a-z0-9]+')
+_LINKEDIN_RE = re.compile(r'linkedin\.com/(in|company|pub)/([^/?#]+)', re.IGNORECASE)
+
+def _words(text):
+    text = unicodedata.normalize('NFKD', str(text))
+    return _WORD_RE.findall(text.encode('ascii', 'ignore').decode('ascii').lower())
+
+def normalize_name(name):
+    """Lower-case, accent-free firm or person name without legal suffixes"""
+    return ' '.join(w for w in _words(name) if w not in LEGAL_SUFFIXES)
+
+def normalize_email(email):
+    """Lower-cased, trimmed email, or None if it doesn't look like one"""
+    email = str(email).strip().lower()
+    return email if '@' in email else None
+
+def normalize_host(url):
+    """Website host without scheme, 'www.' or port, e.g. 'dale.com'"""
+    url = str(url).strip().lower()
+    if '//' not in url:
+        url = '//' + url
+    host = urlsplit(url).hostname or ''
+    return host[4:] if host.startswith('www.') else host or None
+
+def normalize_linkedin(url):
+    """'in/handle' or 'company/handle' from a LinkedIn URL"""
+    match = _LINKEDIN_RE.search(str(url))
+    if not match:
+        return None
+    kind = 'in' if match.group(1).lower() == 'pub' else match.group(1).lower()
+    return f"{kind}/{match.group(2).lower().rstrip('-')}"
+
+def person_name(record):
+    """Normalized 'first last' name of the contact person, if any"""
+    parts = [record.get('first name'), record.get('last name')]
+    name = ' '.join(str(p) for p in parts if p)
+    return normalize_name(name) if name else ''
+
+def _block_key(record, firm):
+    """Blocking key: website host, else email domain, else firm-name token"""
+    if record.get('website'):
+        host = normalize_host(record['website'])
+        if host:
+            return ('host', host)
+    email = normalize_email(record.get('email', ''))
+    if email:
+        domain = email.rsplit('@', 1)[1]
+        if domain not in FREE_MAIL_DOMAINS:
+            return ('domain', domain)
+    return ('name', firm.split(' ', 1)[0]) if firm else None
+
+def _similar(a, b):
+    if a == b:
+        return True
+    matcher = SequenceMatcher(None, a, b)
+    # Cheap upper bounds first, the full ratio only for close candidates
+    return (matcher.real_quick_ratio() >= SIMILARITY
+            and matcher.quick_ratio() >= SIMILARITY
+            and matcher.ratio() >= SIMILARITY)
+
+def _same_firm(a, b):
+    """
+    True if two normalized firm names can name one firm: similar, one the
+    leading words of the other ('accel' and 'accel india'), or one unknown
+    """
+    if not a or not b:
+        return True
+    short, long = sorted((a.split(), b.split()), key=len)
+    return long[:len(short)] == short or _similar(a, b)
+
+def _conflicts(a, b):
+    """True if two (email, handle) identities name different people"""
+    return any(x and y and x != y for x, y in zip(a, b))
+
+class _UnionFind:
+    def __init__(self, size):
+        self.parent = list(range(size))
+
+    def find(self, i):
+        while self.parent[i] != i:
+            self.parent[i] = self.parent[self.parent[i]]
+            i = self.parent[i]
+        return i
+
+    def union(self, a, b):
+        # The lower index (earlier record) stays the root
+        a, b = self.find(a), self.find(b)
+        if a != b:
+            self.parent[max(a, b)] = min(a, b)
+            return True
+        return False
+
+def find_duplicates(records, window=WINDOW):
+    """Return (union-find, {index: reason}) for the matched records"""
+    groups = _UnionFind(len(records))
+    reasons = {}
+
+    def link(a, b, reason):
+        if groups.union(a, b):
+            reasons[max(a, b)] = reason
+
+    exact = {}
+    blocks = {}
+    firms = []
+    for i, record in enumerate(records):
+        email = normalize_email(record.get('email', '')) if record.get('email') else None
+        if email:
+            exact.setdefault(('email', email), []).append(i)
+        linkedin = record.get('personal linkedin url') or record.get('linkedin')
+        handle = normalize_linkedin(linkedin) if linkedin else None
+        if handle and not handle.startswith('in/'):
+            handle = None
+        if handle:
+            exact.setdefault(('linkedin', handle), []).append(i)
+
+        firm = normalize_name(record.get('name', ''))
+        firms.append(firm)
+        key = _block_key(record, firm)
+        if key is not None:
+            person = person_name(record)
+            blocks.setdefault(key, []).append((person or firm, bool(person), i, (email, handle)))
+
+    for (kind, value), members in exact.items():
+        for pos, i in enumerate(members[1:], 1):
+            # Joins the first earlier record of the same firm, if any
+            for j in members[:pos]:
+                if _same_firm(firms[j], firms[i]):
+                    link(j, i, f"same {kind} {value}")
+                    break
+
+    for (kind, value), members in blocks.items():
+        members.sort()
+        for pos, (name, is_person, i, identity) in enumerate(members):
+            for other, other_is_person, j, other_identity in members[pos + 1:pos + 1 + window]:
+                if (is_person == other_is_person and name
+                        and not _conflicts(identity, other_identity)
+                        and _similar(name, other)):
+                    link(i, j, f"similar name '{other}' ~ '{name}' at {kind} {value}")
+
+    return groups, reasons
+
+def deduplicate(records, window=WINDOW):
+    """
+    Merge duplicate records and return (records, report). Each merged
+    group keeps the position and values of its first record; fields only
+    the later duplicates have are filled in from them. The report lists
+    every merge with the reason it matched.
+    """
+    groups, reasons = find_duplicates(records, window)
+
+    merged = {}
+    report = {}
+    order = []
+    for i, record in enumerate(records):
+        root = groups.find(i)
+        if root not in merged:
+            merged[root] = record.copy()
+            order.append(root)
+            continue
+        target = merged[root]
+        for key, value in record.items():
+            target.setdefault(key, value)
+        report.setdefault(root, {
+            "kept": {"name": records[root].get('name'), "source": records[root].get('source'),
+                     "index": root},
+            "merged": [],
+        })["merged"].append({
+            "name": record.get('name'), "source": record.get('source'),
+            "index": i, "reason": reasons.get(i, "transitive match"),
+        })
+
+    return [merged[root] for root in order], [report[root] for root in order if root in report]
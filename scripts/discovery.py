@@ -0,0 +1,152 @@
+"""
+Input discovery for the investor data pipeline
+Finds copies among candidate input files (resources/ holds "Copy of ..."
+and "(1)" variants) so each distinct content is parsed only once.
+
+Byte-identical copies are found first: files are compared by size, then
+by a hash of their first PREFIX_SIZE bytes, and only files that still
+collide are fully hashed. Near-identical copies (a re-export with other
+line endings, quoting or a few edited cells) are found among the rest:
+CSV and Excel files with the same header row are compared by their sets
+of rows, with cells whitespace-normalized, and count as copies when at
+least NEAR_DUPLICATE_SIMILARITY of their distinct rows are shared.
+"""
+import contextlib
+import csv
+import re
+from pathlib import Path
+
+from csv_dialect import sniff_dialect
+from hashing import file_sha256
+
+PREFIX_SIZE = 64 * 1024
+# Shared rows / all distinct rows of two files for one to be a copy
+NEAR_DUPLICATE_SIMILARITY = 0.95
+
+_SPACE_RE = re.compile(r'\s+')
+
+_COPY_NAME = re.compile(r'^copy of |\(\d+\)$', re.IGNORECASE)
+
+def looks_like_copy(path):
+    """True for names like 'Copy of X.csv' or 'X(1).csv'"""
+    return bool(_COPY_NAME.search(Path(path).stem))
+
+def prefer_originals(paths):
+    """Sort paths so that originals come before their 'Copy of'/'(1)' variants"""
+    return sorted(paths, key=lambda p: (looks_like_copy(p), Path(p).name.lower()))
+
+def _split(groups, key):
+    """Refine each group of paths by key(path), keeping input order"""
+    refined = []
+    for group in groups:
+        if len(group) == 1:
+            refined.append(group)
+            continue
+        buckets = {}
+        for path in group:
+            buckets.setdefault(key(path), []).append(path)
+        refined.extend(buckets.values())
+    return refined
+
+def _cell(value):
+    return '' if value is None else _SPACE_RE.sub(' ', str(value)).strip()
+
+def _csv_rows(path):
+    dialect = sniff_dialect(path)
+    with open(path, 'r', encoding=dialect.encoding, newline='') as f:
+        reader = csv.reader(f, delimiter=dialect.delimiter, quotechar=dialect.quotechar,
+                            skipinitialspace=dialect.skipinitialspace)
+        for row in reader:
+            yield tuple(_cell(value) for value in row)
+
+def _excel_rows(path):
+    from openpyxl import load_workbook
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        for sheet in workbook.worksheets:
+            for row in sheet.iter_rows(values_only=True):
+                yield tuple(_cell(value) for value in row)
+    finally:
+        workbook.close()
+
+_READERS = {'.csv': _csv_rows, '.xlsx': _excel_rows, '.xlsm': _excel_rows}
+
+def _rows(path):
+    """Rows of a table file without trailing empty cells; empty rows are skipped"""
+    with contextlib.closing(_READERS[path.suffix.lower()](path)) as table:
+        for row in table:
+            while row and not row[-1]:
+                row = row[:-1]
+            if row:
+                yield row
+
+def _header(path):
+    with contextlib.closing(_rows(path)) as rows:
+        header = next(rows, ())
+    return (path.suffix.lower(), tuple(cell.lower() for cell in header))
+
+def near_duplicates(paths, similarity=NEAR_DUPLICATE_SIMILARITY):
+    """
+    Return {path: (original, share of rows in common)} for files whose
+    rows nearly all match an earlier file with the same header. Only
+    files sharing a header are read past it.
+    """
+    by_header = {}
+    for path in paths:
+        if path.suffix.lower() in _READERS:
+            by_header.setdefault(_header(path), []).append(path)
+
+    found = {}
+    for group in by_header.values():
+        if len(group) < 2:
+            continue
+        kept = []
+        for path in group:
+            with contextlib.closing(_rows(path)) as rows:
+                next(rows, None)
+                rows = set(rows)
+            for original, original_rows in kept:
+                union = len(rows | original_rows)
+                shared = len(rows & original_rows) / union if union else 1.0
+                if shared >= similarity:
+                    found[path] = (original, shared)
+                    break
+            else:
+                kept.append((path, rows))
+    return found
+
+def distinct_files(paths, prefix_size=PREFIX_SIZE, similarity=NEAR_DUPLICATE_SIMILARITY):
+    """
+    Return (distinct, aliases). distinct keeps the first path of each
+    distinct content, in input order; aliases maps every duplicate to
+    (path kept in its place, share of rows in common), the share being
+    None for byte-identical copies. similarity=None finds only those.
+    """
+    paths = [Path(p) for p in paths]
+    groups = _split([paths], lambda p: p.stat().st_size)
+    groups = _split(groups, lambda p: file_sha256(p, prefix_size))
+    # Files no longer than the prefix are already fully compared
+    groups = _split(groups, lambda p: '' if p.stat().st_size <= prefix_size else file_sha256(p))
+
+    canonical = set()
+    aliases = {}
+    for group in groups:
+        for path in group[1:]:
+            aliases[path] = (group[0], None)
+        canonical.add(group[0])
+    distinct = [p for p in paths if p in canonical]
+
+    if similarity is not None:
+        near = near_duplicates(distinct, similarity)
+        aliases.update(near)
+        distinct = [p for p in distinct if p not in near]
+    return distinct, aliases
+
+def report_aliases(aliases):
+    """Print which files were treated as copies of another"""
+    for alias, (original, shared) in aliases.items():
+        if shared is None:
+            print(f"  Skipping {alias.name}: identical to {original.name}")
+        else:
+            print(f"  Skipping {alias.name}: nearly identical to {original.name} "
+                  f"({shared:.0%} of rows shared)")
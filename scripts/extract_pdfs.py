@@ -3,53 +3,177 @@ PDF Content Extractor
 Extracts text content from PDF files and converts to structured markdown
 """
 import pdfplumber
-import re
+import argparse
+import json
+import os
 from pathlib import Path
 
+from guide_html import GuideHtmlRenderer, publish, remove_stale, update_index
+from guide_text import GuideNormalizer
+from hashing import file_sha256
+from page_cache import DEFAULT_MAX_BYTES, PageCache
+from parallel import imap_ordered, resolve_jobs
+
 BASE_PATH = Path(__file__).parent.parent / "resources"
 OUTPUT_PATH = Path(__file__).parent.parent / "public" / "content"
 
-def clean_text(text):
-    """Clean extracted text"""
-    # Remove extra whitespace
-    text = re.sub(r'\s+', ' ', text)
-    # Remove extra newlines
-    text = re.sub(r'\n\s*\n\s*\n+', '\n\n', text)
-    return text.strip()
+# Part of the page cache key: bump the suffix when page extraction changes
+EXTRACTOR_VERSION = f"pdfplumber-{pdfplumber.__version__}/1"
+
+# Freshly extracted pages are written to the cache in batches of this size
+CACHE_BATCH = 32
+
+def write_atomic(path, write):
+    """Call write(f) on a temporary file, then move it over path"""
+    tmp_path = path.with_name(path.name + '.tmp')
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            write(f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+def iter_page_texts(pdf_path, start=0, stop=None):
+    """
+    Yield the raw text of pages [start, stop), closing each page right
+    after it is read so pdfplumber's per-page object cache doesn't grow
+    """
+    with pdfplumber.open(pdf_path) as pdf:
+        for page in pdf.pages[start:stop]:
+            text = page.extract_text() or ''
+            page.close()
+            yield text
+
+def extract_page_range(pdf_path, start, stop):
+    """Pool worker: open the PDF and return the raw text of pages [start, stop)"""
+    return list(iter_page_texts(pdf_path, start, stop))
+
+def page_ranges(page_count, jobs):
+    """Split pages into about four contiguous ranges per worker (one if serial)"""
+    chunks = max(1, min(page_count, jobs * 4 if jobs > 1 else 1))
+    bounds = [page_count * i // chunks for i in range(chunks + 1)]
+    return list(zip(bounds, bounds[1:]))
 
-def extract_pdf_content(pdf_path, output_name):
-    """Extract content from PDF and save as markdown"""
+def missing_ranges(missing, jobs):
+    """Split sorted page indices into contiguous ranges for the workers"""
+    runs = []
+    for page in missing:
+        if runs and runs[-1][1] == page:
+            runs[-1][1] = page + 1
+        else:
+            runs.append([page, page + 1])
+    return [
+        (start + a, start + b)
+        for start, stop in runs
+        for a, b in page_ranges(stop - start, jobs)
+    ]
+
+def extract_pages(pdf_path, jobs=1, cache=None):
+    """
+    Yield the raw text of every page in order, taking pages from the cache
+    when possible and extracting the rest (in worker processes if jobs > 1)
+    """
+    doc_hash = file_sha256(pdf_path) if cache else None
+    page_count = cache.page_count(doc_hash) if cache else None
+    cached = cache.get_pages(doc_hash) if cache else {}
+    
+    if page_count is None:
+        with pdfplumber.open(pdf_path) as pdf:
+            page_count = len(pdf.pages)
+    
+    missing = [page for page in range(page_count) if page not in cached]
+    if cache:
+        print(f"  {page_count - len(missing)} cached, {len(missing)} extracted")
+    
+    # Each worker opens the PDF itself and extracts a range of pages; the
+    # ranges come back in order, so the output matches a serial run. A
+    # serial run reads the pages lazily, one at a time.
+    jobs = resolve_jobs(jobs)
+    ranges = missing_ranges(missing, jobs)
+    if jobs > 1:
+        tasks = [(pdf_path, start, stop) for start, stop in ranges]
+        results = imap_ordered(extract_page_range, tasks, jobs)
+    else:
+        results = (iter_page_texts(pdf_path, start, stop) for start, stop in ranges)
+    extracted = zip(ranges, results)
+    
+    fresh = {}
+    page = 0
+    while page < page_count:
+        if page in cached:
+            yield cached.pop(page)
+            page += 1
+            continue
+        (start, stop), texts = next(extracted)
+        for page, text in zip(range(start, stop), texts):
+            fresh[page] = text
+            if cache and len(fresh) >= CACHE_BATCH:
+                cache.put_pages(doc_hash, page_count, fresh)
+                fresh = {}
+            yield text
+        page = stop
+    
+    if cache and fresh:
+        cache.put_pages(doc_hash, page_count, fresh)
+
+def extract_pdf_content(pdf_path, output_name, jobs=1, cache=None):
+    """
+    Extract content from PDF and save it as markdown, plus a rendered HTML
+    fragment and table of contents JSON under content-hashed names listed
+    in guides.json. Everything is written to temporary files as pages are
+    extracted, which then replace the targets.
+    """
     print(f"Extracting content from {pdf_path.name}...")
     
     try:
-        content = []
-        content.append(f"# {output_name}\n\n")
-        content.append("> This content was extracted from the PDF guide in the resources folder.\n\n")
+        # Create output directory
+        OUTPUT_PATH.mkdir(parents=True, exist_ok=True)
         
-        with pdfplumber.open(pdf_path) as pdf:
-            for page_num, page in enumerate(pdf.pages, 1):
-                text = page.extract_text()
-                
-                if text:
-                    cleaned = clean_text(text)
-                    if cleaned:
-                        content.append(f"## Page {page_num}\n\n")
-                        content.append(f"{cleaned}\n\n")
-                        content.append("---\n\n")
+        slug = output_name.lower().replace(' ', '-')
+        output_file = OUTPUT_PATH / f"{slug}.md"
+        html_tmp = OUTPUT_PATH / f"{slug}.html.tmp"
+        toc_tmp = OUTPUT_PATH / f"{slug}.toc.json.tmp"
+        normalizer = GuideNormalizer(output_name)
+        renderer = GuideHtmlRenderer()
+        page_count = 0
         
-        # Combine all content
-        full_content = "".join(content)
+        def write_markdown(f):
+            nonlocal page_count
+            with open(html_tmp, 'w', encoding='utf-8') as html_file:
+                def emit(blocks):
+                    for block in blocks:
+                        f.write(block)
+                        for line in renderer.feed(block):
+                            html_file.write(f"{line}\n")
+                
+                emit([f"# {output_name}\n\n",
+                      "> This content was extracted from the PDF guide in the resources folder.\n\n"])
+                for page_count, text in enumerate(extract_pages(pdf_path, jobs, cache), 1):
+                    emit(normalizer.feed(text))
+                emit(normalizer.close())
+                for line in renderer.close():
+                    html_file.write(f"{line}\n")
         
-        # Create output directory
-        OUTPUT_PATH.mkdir(parents=True, exist_ok=True)
+        try:
+            write_atomic(output_file, write_markdown)
+            with open(toc_tmp, 'w', encoding='utf-8') as f:
+                json.dump(normalizer.toc, f, indent=2, ensure_ascii=False)
+            entry = {
+                "markdown": output_file.name,
+                "html": publish(html_tmp, slug, ".html"),
+                "toc": publish(toc_tmp, f"{slug}.toc", ".json"),
+            }
+        finally:
+            html_tmp.unlink(missing_ok=True)
+            toc_tmp.unlink(missing_ok=True)
         
-        # Save to file
-        output_file = OUTPUT_PATH / f"{output_name.lower().replace(' ', '-')}.md"
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(full_content)
+        remove_stale(OUTPUT_PATH, slug, {entry["html"], entry["toc"]})
+        update_index(OUTPUT_PATH, slug, entry)
         
         print(f"✓ Saved to {output_file}")
-        print(f"✓ Extracted {len(pdf.pages)} pages")
+        print(f"✓ Rendered {entry['html']} and {entry['toc']}")
+        print(f"✓ Extracted {page_count} pages, {len(normalizer.toc)} TOC entries")
         
         return output_file
         
@@ -57,8 +181,17 @@ def extract_pdf_content(pdf_path, output_name):
         print(f"Error extracting PDF: {str(e)}")
         return None
 
-def main():
+def main(argv=None):
     """Main extraction function"""
+    parser = argparse.ArgumentParser(description="Extract the PDF guides to markdown")
+    parser.add_argument('--jobs', type=int, default=1, metavar='N',
+                        help="extract pages in N worker processes (0 = one per CPU)")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="extract every page again without using the page cache")
+    parser.add_argument('--cache-size', type=int, default=DEFAULT_MAX_BYTES // (1024 * 1024),
+                        metavar='MB', help="page cache size cap in MB (default: %(default)s)")
+    args = parser.parse_args(argv)
+    
     print("Starting PDF extraction...\n")
     
     # PDF files to process
@@ -73,6 +206,10 @@ def main():
         }
     ]
     
+    cache = None
+    if not args.no_cache:
+        cache = PageCache(EXTRACTOR_VERSION, max_bytes=args.cache_size * 1024 * 1024)
+    
     for pdf_info in pdfs:
         pdf_path = BASE_PATH / pdf_info["filename"]
         
@@ -80,9 +217,12 @@ def main():
             print(f"Warning: File not found: {pdf_path}")
             continue
         
-        extract_pdf_content(pdf_path, pdf_info["output_name"])
+        extract_pdf_content(pdf_path, pdf_info["output_name"], args.jobs, cache)
         print()
     
+    if cache:
+        cache.close()
+    
     print("✓ PDF extraction complete!")
 
 if __name__ == "__main__":
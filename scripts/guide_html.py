@@ -0,0 +1,108 @@
+"""
+HTML rendering for extracted PDF guides
+Renders the markdown blocks GuideNormalizer produces into the same HTML
+fragment src/lib/guide-processor.ts used to build at request time
+(headings with ids, paragraphs, lists, bold callouts). All text is
+HTML-escaped before any markup is added, so the fragment is safe to
+inject as-is. Guide files are published under content-hashed names with
+an index so pages can find the current ones.
+"""
+import html
+import json
+import os
+import re
+from pathlib import Path
+
+from guide_text import heading_id
+from hashing import HASH_LENGTH, content_hash
+
+GUIDES_INDEX = "guides.json"
+
+PARAGRAPH_CLASS = "mb-4 text-muted-foreground leading-relaxed"
+LIST_CLASSES = {
+    'ul': "list-disc pl-6 space-y-2 mb-4",
+    'ol': "list-decimal pl-6 space-y-2 mb-4",
+}
+
+_HEADING_RE = re.compile(r'^(#{1,3}) (.*)$')
+_BULLET_RE = re.compile(r'^- (.*)$')
+_NUMBERED_RE = re.compile(r'^\d{1,2}\. (.*)$')
+_BOLD_RE = re.compile(r'\*\*(.+?)\*\*')
+
+def inline(text):
+    """Escape text and turn **bold** spans into <strong>"""
+    return _BOLD_RE.sub(r'<strong>\1</strong>', html.escape(text, quote=True))
+
+class GuideHtmlRenderer:
+    """
+    Feed markdown blocks in order with feed(), which yields HTML lines;
+    close() yields whatever is needed to end an open list.
+    """
+
+    def __init__(self):
+        self._list = None
+
+    def _open_list(self, tag):
+        lines = []
+        if self._list != tag:
+            lines.extend(self._close_list())
+            lines.append(f'<{tag} class="{LIST_CLASSES[tag]}">')
+            self._list = tag
+        return lines
+
+    def _close_list(self):
+        if self._list is None:
+            return []
+        tag, self._list = self._list, None
+        return [f'</{tag}>']
+
+    def feed(self, block):
+        """Yield the HTML lines for one markdown block"""
+        block = block.strip()
+        if not block or block.startswith('> '):
+            return
+        heading = _HEADING_RE.match(block)
+        bullet = _BULLET_RE.match(block)
+        numbered = _NUMBERED_RE.match(block)
+        if bullet or numbered:
+            yield from self._open_list('ul' if bullet else 'ol')
+            yield f"<li>{inline((bullet or numbered).group(1))}</li>"
+            return
+        yield from self._close_list()
+        if heading:
+            level, title = len(heading.group(1)), heading.group(2)
+            yield f'<h{level} id="{heading_id(title)}">{html.escape(title)}</h{level}>'
+        else:
+            yield f'<p class="{PARAGRAPH_CLASS}">{inline(block)}</p>'
+
+    def close(self):
+        """Yield the closing tag of a list still open at the end"""
+        yield from self._close_list()
+
+def publish(path, stem, suffix):
+    """Rename a finished file to stem.<hash><suffix> next to it and return the new name"""
+    path = Path(path)
+    hashed = path.with_name(f"{stem}.{content_hash(path)}{suffix}")
+    os.replace(path, hashed)
+    return hashed.name
+
+def remove_stale(out_dir, stem, keep):
+    """Delete hashed files of a guide other than the ones in keep"""
+    stale = re.compile(r'^%s(\.toc)?\.[0-9a-f]{%d}\.(html|json)$' % (re.escape(stem), HASH_LENGTH))
+    for path in Path(out_dir).iterdir():
+        if stale.match(path.name) and path.name not in keep:
+            path.unlink()
+
+def update_index(out_dir, slug, entry):
+    """Record a guide's current files in the guides index, atomically"""
+    index_path = Path(out_dir) / GUIDES_INDEX
+    index = {}
+    if index_path.exists():
+        with open(index_path, 'r', encoding='utf-8') as f:
+            index = json.load(f)
+    index[slug] = entry
+    tmp_path = index_path.with_name(index_path.name + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(index, f, indent=2, ensure_ascii=False)
+    os.replace(tmp_path, index_path)
+    return index
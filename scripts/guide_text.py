@@ -0,0 +1,146 @@
+"""
+Text normalizer for extracted PDF guide pages
+Turns the hard-wrapped lines pdfplumber returns into markdown blocks in a
+single pass over each page: wrapped lines are joined back into paragraphs
+and list items, module titles and short title lines become headings, and
+page-number lines are dropped. Paragraphs that run over a page break are
+kept whole, so the normalizer is fed pages in order and keeps its state
+between them. Headings are collected into a table of contents whose ids
+match the ones src/lib/guide-processor.ts puts on the rendered headers.
+"""
+import re
+
+# Longest line still treated as a heading rather than the start of a paragraph
+HEADING_MAX_CHARS = 80
+# Headings up to this level go into the table of contents
+TOC_MAX_LEVEL = 2
+
+_SPACE_RE = re.compile(r'\s+')
+# Page numbers ("7", "Page 7", "7 of 20") and stray list numbers ("1.")
+_PAGE_NUMBER_RE = re.compile(r'^(?:page\s*)?\d{1,4}\.?(?:\s*(?:of|/)\s*\d{1,4})?$', re.IGNORECASE)
+_MODULE_RE = re.compile(r'^MODULE\s*\d+\s*[-:–]', re.IGNORECASE)
+_CALLOUT_RE = re.compile(r'^ABOUT THIS LESSON$', re.IGNORECASE)
+_BULLET_RE = re.compile(r'^[•▪●◦\-–]\s+')
+_NUMBERED_RE = re.compile(r'^\d{1,2}\.\s+\S')
+_SENTENCE_END_RE = re.compile(r'[.!?:][\'"”’)\]]*$')
+_PUNCT_END_RE = re.compile(r'[.!?:;,\-][\'"”’)\]]*$')
+_CLAUSE_BREAK_RE = re.compile(r'[.!?,;] ')
+_ID_RE = re.compile(r'[^a-z0-9]+')
+
+# A line ending in one of these is a wrapped sentence, not a title
+_CONTINUING_WORDS = frozenset(
+    'a an and as at by for from in into of on or our that the their to with your'.split()
+)
+
+def heading_id(title):
+    """Anchor id for a heading, the same slug guide-processor.ts generates"""
+    return _ID_RE.sub('-', title.lower()).strip('-')
+
+class GuideNormalizer:
+    """
+    Feed page texts in order with feed(), which yields finished markdown
+    blocks (with their trailing newlines); close() yields the last one.
+    toc lists the headings seen so far as {"id", "title", "level"} dicts.
+    """
+
+    def __init__(self, title=None):
+        self.toc = []
+        self._kind = None
+        self._parts = []
+        self._prev = ''
+        self._title_id = heading_id(title) if title else None
+        if title:
+            self._add_toc(title, 1)
+
+    def _add_toc(self, title, level):
+        if level <= TOC_MAX_LEVEL:
+            self.toc.append({"id": heading_id(title), "title": title, "level": level})
+
+    def _flush(self, next_kind=None):
+        """
+        Return the open block as markdown (or None) and start a new one.
+        Blocks end in a blank line, except between items of the same list,
+        which renderers would otherwise split into separate lists.
+        """
+        kind, parts = self._kind, self._parts
+        self._kind, self._parts = None, []
+        if not parts:
+            return None
+        text = ''.join(parts)
+        end = '\n' if kind in ('li', 'ol') and kind == next_kind else '\n\n'
+        if kind == 'h2':
+            self._add_toc(text, 2)
+            return f"## {text}{end}"
+        if kind == 'h3':
+            # The guide's own title page repeats the document heading
+            return None if heading_id(text) == self._title_id else f"### {text}{end}"
+        if kind == 'li':
+            return f"- {text}{end}"
+        return f"{text}{end}"
+
+    def _start(self, kind, text):
+        block = self._flush(kind)
+        self._kind, self._parts = kind, [text]
+        return block
+
+    def _append(self, text):
+        last = self._parts[-1]
+        # Words hyphenated across a line break are joined without a space
+        self._parts.append(text if last.endswith('-') else ' ' + text)
+
+    def _line(self, line, next_line):
+        """Handle one stripped, non-empty line; return a finished block or None"""
+        prev, self._prev = self._prev, line
+        ended = not prev or self._kind in ('h2', 'h3') or bool(_SENTENCE_END_RE.search(prev))
+
+        if _MODULE_RE.match(line):
+            return self._start('h2', line)
+        if _CALLOUT_RE.match(line):
+            block = self._start('p', f"**{line.title()}**")
+            self._prev = ''
+            return block
+        if _BULLET_RE.match(line):
+            return self._start('li', _BULLET_RE.sub('', line, count=1))
+        if _NUMBERED_RE.match(line):
+            return self._start('ol', line)
+
+        starts_lower = line[0].islower()
+        if self._kind == 'h2' and not starts_lower and len(line.split()) <= 3 \
+                and not line.isupper() and not _PUNCT_END_RE.search(line):
+            # The rest of a wrapped module title, e.g. "MODULE 2- Preparing
+            # for Your Fundraising" / "Journey"
+            self._append(line)
+            return None
+        if ended and not starts_lower and len(line) <= HEADING_MAX_CHARS \
+                and not _PUNCT_END_RE.search(line) and not _CLAUSE_BREAK_RE.search(line) \
+                and line.rsplit(' ', 1)[-1] not in _CONTINUING_WORDS \
+                and not (next_line and next_line[0].islower()):
+            return self._start('h3', line)
+        # List items only continue on lower-case lines; an unpunctuated item
+        # is often followed directly by the next paragraph
+        if self._kind in ('li', 'ol'):
+            joins = starts_lower
+        else:
+            joins = self._kind == 'p' and (starts_lower or not ended)
+        if joins:
+            self._append(line)
+            return None
+        return self._start('p', line)
+
+    def feed(self, text):
+        """Yield the blocks completed by the next page's text"""
+        lines = []
+        for raw in text.split('\n'):
+            line = _SPACE_RE.sub(' ', raw).strip()
+            if line and not _PAGE_NUMBER_RE.match(line):
+                lines.append(line)
+        for line, next_line in zip(lines, lines[1:] + ['']):
+            block = self._line(line, next_line)
+            if block:
+                yield block
+
+    def close(self):
+        """Yield the block still open after the last page"""
+        block = self._flush()
+        if block:
+            yield block
@@ -0,0 +1,30 @@
+"""
+Content hashing shared by the data scripts
+Manifests, caches and content-addressed file names all key on the
+SHA-256 of a file's bytes, read in 1 MiB blocks so large inputs aren't
+loaded into memory. Published files (investor shards, rendered guides)
+embed a short form of it in their names.
+"""
+import hashlib
+
+BLOCK_SIZE = 1 << 20
+# Hex digits of the digest kept in content-addressed file names
+HASH_LENGTH = 12
+
+def file_sha256(path, limit=None):
+    """SHA-256 hex digest of a file's contents, or of its first limit bytes"""
+    digest = hashlib.sha256()
+    remaining = limit
+    with open(path, 'rb') as f:
+        while remaining is None or remaining > 0:
+            block = f.read(BLOCK_SIZE if remaining is None else min(BLOCK_SIZE, remaining))
+            if not block:
+                break
+            digest.update(block)
+            if remaining is not None:
+                remaining -= len(block)
+    return digest.hexdigest()
+
+def content_hash(path):
+    """Short SHA-256 hex digest of a file's contents, for file names"""
+    return file_sha256(path)[:HASH_LENGTH]
@@ -0,0 +1,228 @@
+"""
+Cached query index over public/data/investors.json
+One pass over the dataset builds a compact index with record counts by
+source, geography and type, exact name and email lookups, the token
+search index (search_index.py) and each record's display name. It is
+cached under .cache/ and reused while investors.json is unchanged (same
+size and mtime, or else the same SHA-256), so the checks ops runs after
+every data push don't re-parse the dataset.
+
+Replaces analyze_investors.py, analyze_investors_v2.py, check_investors.py
+and check_presence.py:
+
+    python scripts/investor_index.py summary [--output FILE]
+    python scripts/investor_index.py counts geography
+    python scripts/investor_index.py contains "Dale Ventures" [--output FILE]
+    python scripts/investor_index.py name "Dale Ventures"
+    python scripts/investor_index.py email someone@example.com
+    python scripts/investor_index.py search "dale ven"
+"""
+import argparse
+import json
+import os
+import re
+import sys
+from collections import Counter
+from pathlib import Path
+
+from dedup import normalize_email, normalize_name
+from hashing import file_sha256
+from search_index import DATA_PATH, SearchIndex, SearchIndexBuilder
+
+INDEX_VERSION = 1
+CACHE_PATH = Path(__file__).parent.parent / ".cache" / "investors-index.json"
+
+# CLI name -> record field counted by it
+COUNT_FIELDS = {'source': 'source', 'geography': 'source_geography', 'type': 'type'}
+
+_EMAIL_SPLIT_RE = re.compile(r'[\s,;/]+')
+
+def split_emails(value):
+    """Normalized addresses in a field that may list several"""
+    return [normalize_email(e) for e in _EMAIL_SPLIT_RE.split(str(value)) if '@' in e]
+
+def build_index(json_path):
+    """Read the dataset once and return the index as a dict"""
+    json_path = Path(json_path)
+    stat = json_path.stat()
+    with open(json_path, 'r', encoding='utf-8') as f:
+        records = json.load(f)
+
+    counts = {field: Counter() for field in COUNT_FIELDS.values()}
+    names = []
+    name_ids = {}
+    email_ids = {}
+    search = SearchIndexBuilder()
+    for record_id, record in enumerate(records):
+        for field, counter in counts.items():
+            counter[str(record.get(field, 'Unknown'))] += 1
+        name = record.get('name')
+        names.append(None if name is None else str(name))
+        if name is not None:
+            name_ids.setdefault(normalize_name(name), []).append(record_id)
+        if record.get('email'):
+            for email in split_emails(record['email']):
+                ids = email_ids.setdefault(email, [])
+                if not ids or ids[-1] != record_id:
+                    ids.append(record_id)
+        search.add(record)
+
+    return {
+        "version": INDEX_VERSION,
+        "dataset": {
+            "path": str(json_path.resolve()),
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "sha256": file_sha256(json_path),
+        },
+        "count": len(records),
+        "counts": {field: dict(counter.most_common()) for field, counter in counts.items()},
+        "names": names,
+        "name_ids": name_ids,
+        "email_ids": email_ids,
+        "search": search.to_dict(),
+    }
+
+def _is_current(data, json_path):
+    """True if a cached index still describes json_path"""
+    if data.get("version") != INDEX_VERSION:
+        return False
+    dataset = data.get("dataset", {})
+    if dataset.get("path") != str(json_path.resolve()):
+        return False
+    stat = json_path.stat()
+    if dataset.get("size") != stat.st_size:
+        return False
+    if dataset.get("mtime_ns") == stat.st_mtime_ns:
+        return True
+    return dataset.get("sha256") == file_sha256(json_path)
+
+class InvestorIndex:
+    """Query API over a built index; none of the queries read the dataset"""
+
+    def __init__(self, data):
+        self.data = data
+        self.count = data["count"]
+        self.counts = data["counts"]
+        self.names = data["names"]
+        self._name_ids = data["name_ids"]
+        self._email_ids = data["email_ids"]
+        self.search_index = SearchIndex(data["search"])
+
+    @classmethod
+    def load(cls, json_path=DATA_PATH / "investors.json", cache_path=CACHE_PATH, rebuild=False):
+        """Load the cached index for json_path, rebuilding it if missing or stale"""
+        json_path, cache_path = Path(json_path), Path(cache_path)
+        if not rebuild and cache_path.exists():
+            try:
+                with open(cache_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if _is_current(data, json_path):
+                    return cls(data)
+            except (OSError, ValueError):
+                pass
+
+        data = build_index(json_path)
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_name(cache_path.name + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(tmp_path, cache_path)
+        return cls(data)
+
+    def count_by(self, field):
+        """{value: record count} for 'source', 'geography' or 'type'"""
+        return self.counts[COUNT_FIELDS[field]]
+
+    def by_name(self, name):
+        """Record IDs whose name matches exactly (case, accents and legal suffixes ignored)"""
+        return list(self._name_ids.get(normalize_name(name), []))
+
+    def by_email(self, email):
+        """Record IDs listing this email address"""
+        return list(self._email_ids.get(normalize_email(email), []))
+
+    def search(self, query, prefix=True):
+        """Record IDs matching every token of query (see SearchIndex.search)"""
+        return self.search_index.search(query, prefix)
+
+    def contains(self, text):
+        """True if some record has this exact name, or every token of text"""
+        return bool(self.by_name(text)) or self.search_index.contains(text)
+
+def _write(lines, output):
+    """Print lines, or write them to output if given"""
+    text = "\n".join(lines) + "\n"
+    if output:
+        with open(output, 'w', encoding='utf-8') as f:
+            f.write(text)
+        print(f"Written to {output}")
+    else:
+        sys.stdout.write(text)
+
+def _matches(index, ids, limit=50):
+    lines = [f"{len(ids)} match(es)"]
+    lines.extend(f"  #{i}: {index.names[i]}" for i in ids[:limit])
+    if len(ids) > limit:
+        lines.append(f"  ... {len(ids) - limit} more")
+    return lines
+
+def main(argv=None):
+    """Answer dataset queries from the cached index"""
+    parser = argparse.ArgumentParser(description="Query the investor dataset through a cached index")
+    parser.add_argument('--data', default=str(DATA_PATH / "investors.json"),
+                        help="dataset to query (default: public/data/investors.json)")
+    parser.add_argument('--cache', default=str(CACHE_PATH), help="index cache file")
+    parser.add_argument('--rebuild', action='store_true', help="rebuild the index first")
+    commands = parser.add_subparsers(dest='command')
+
+    summary = commands.add_parser('summary', help="total records and records per source")
+    summary.add_argument('--output', metavar='FILE', help="write the result to FILE")
+
+    counts = commands.add_parser('counts', help="records per source, geography or type")
+    counts.add_argument('field', choices=sorted(COUNT_FIELDS),
+                        help="records without the field count as Unknown; none of the "
+                             "current sources has a type column, so 'type' lists only Unknown "
+                             "until one does")
+    counts.add_argument('--output', metavar='FILE', help="write the result to FILE")
+
+    contains = commands.add_parser('contains', help="check that an investor is present")
+    contains.add_argument('text')
+    contains.add_argument('--output', metavar='FILE', help="write Found/Not Found to FILE")
+
+    for name, help_text in (('name', "look up records by exact name"),
+                            ('email', "look up records by email address"),
+                            ('search', "token search (the last term may be a prefix)")):
+        command = commands.add_parser(name, help=help_text)
+        command.add_argument('query')
+
+    args = parser.parse_args(argv)
+    command = args.command or 'summary'
+
+    try:
+        index = InvestorIndex.load(args.data, args.cache, rebuild=args.rebuild)
+    except (OSError, ValueError) as e:
+        print(f"Error reading {args.data}: {e}")
+        return 2
+
+    if command == 'summary':
+        lines = [f"Total records: {index.count}", "Unique sources:"]
+        lines.extend(f"- {source}: {count} records" for source, count in index.count_by('source').items())
+        _write(lines, getattr(args, 'output', None))
+    elif command == 'counts':
+        _write([f"- {value}: {count}" for value, count in index.count_by(args.field).items()],
+               args.output)
+    elif command == 'contains':
+        found = index.contains(args.text)
+        _write(["Found" if found else "Not Found"], args.output)
+        return 0 if found else 1
+    elif command == 'name':
+        _write(_matches(index, index.by_name(args.query)), None)
+    elif command == 'email':
+        _write(_matches(index, index.by_email(args.query)), None)
+    elif command == 'search':
+        _write(_matches(index, index.search(args.query)), None)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
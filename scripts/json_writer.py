@@ -0,0 +1,154 @@
+"""
+Incremental JSON writers for the investor data converters
+Records are buffered into batches, each batch is encoded in one call and
+written through a buffered binary file, so no single string ever holds
+the whole dataset. Output goes to a temporary file that is renamed over
+the target when the writer is closed, so memory stays flat and a failed
+run never leaves a half-written output behind.
+
+Encoding uses orjson when it is installed and the standard library json
+module otherwise (see BACKENDS); both write UTF-8 without escaping
+non-ASCII text, and give the same output for the converters' records.
+Output is compact by default; indent=2 gives the layout of
+json.dump(records, f, indent=2, ensure_ascii=False) for debug copies.
+"""
+import json
+import os
+from pathlib import Path
+
+from records import json_default
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Records encoded per call, and the write buffer size in bytes
+BATCH_SIZE = 1000
+BUFFER_SIZE = 1 << 16
+
+def _stdlib_encode(value, indent=None):
+    if indent is None:
+        text = json.dumps(value, ensure_ascii=False, separators=(',', ':'), default=json_default)
+    else:
+        text = json.dumps(value, indent=indent, ensure_ascii=False, default=json_default)
+    return text.encode('utf-8')
+
+def _orjson_encode(value, indent=None):
+    if indent not in (None, 2):
+        # orjson only indents by two spaces
+        return _stdlib_encode(value, indent)
+    # Investor is a dataclass: hand it to json_default, which skips
+    # absent (None) fields, rather than letting orjson dump every slot
+    option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_PASSTHROUGH_DATACLASS
+    if indent is not None:
+        option |= orjson.OPT_INDENT_2
+    return orjson.dumps(value, default=json_default, option=option)
+
+# Backend name -> encode(value, indent) returning UTF-8 bytes
+BACKENDS = {'json': _stdlib_encode}
+if orjson is not None:
+    BACKENDS['orjson'] = _orjson_encode
+DEFAULT_BACKEND = 'orjson' if orjson is not None else 'json'
+
+def get_encoder(backend=None):
+    """Return the encode function for a backend name (None for the default)"""
+    backend = backend or DEFAULT_BACKEND
+    if backend not in BACKENDS:
+        raise ValueError(f"JSON backend '{backend}' is not available "
+                         f"(choose from {', '.join(sorted(BACKENDS))})")
+    return BACKENDS[backend]
+
+class _RecordWriter:
+    """Base class: owns the temp file, the batch and the atomic rename"""
+
+    def __init__(self, path, backend=None, batch_size=BATCH_SIZE):
+        self.path = Path(path)
+        self.tmp_path = self.path.with_name(self.path.name + '.tmp')
+        self.encode = get_encoder(backend)
+        self.batch_size = batch_size
+        self.count = 0
+        self._batch = []
+        self._file = open(self.tmp_path, 'wb', buffering=BUFFER_SIZE)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def write(self, record):
+        """Queue one record, writing out the batch once it is full"""
+        self._batch.append(record)
+        if len(self._batch) >= self.batch_size:
+            self._flush()
+
+    def write_many(self, records):
+        """Write every record of an iterable"""
+        for record in records:
+            self.write(record)
+
+    def _flush(self):
+        if self._batch:
+            self._write_batch(self._batch)
+            self.count += len(self._batch)
+            self._batch = []
+
+    def _finish(self):
+        """Write anything that must follow the last record"""
+
+    def close(self):
+        """Finish the file and move it over the target"""
+        self._flush()
+        self._finish()
+        self._file.close()
+        os.replace(self.tmp_path, self.path)
+
+    def abort(self):
+        """Discard the partial output"""
+        self._file.close()
+        self.tmp_path.unlink(missing_ok=True)
+
+class JsonArrayWriter(_RecordWriter):
+    """
+    Stream records as a JSON array, minified by default. With indent=2 the
+    bytes match json.dump(records, f, indent=2, ensure_ascii=False).
+    """
+
+    def __init__(self, path, indent=None, backend=None, batch_size=BATCH_SIZE):
+        super().__init__(path, backend, batch_size)
+        self.indent = indent
+
+    def _write_batch(self, batch):
+        # Encode the batch as an array and drop its brackets: the items
+        # come out separated and (if indented) nested as in the full array
+        if self.indent is None:
+            items = self.encode(batch)[1:-1]
+            self._file.write(b'[' if self.count == 0 else b',')
+        else:
+            items = self.encode(batch, self.indent)[2:-2]
+            self._file.write(b'[\n' if self.count == 0 else b',\n')
+        self._file.write(items)
+
+    def _finish(self):
+        if self.count == 0:
+            self._file.write(b'[]')
+        elif self.indent is None:
+            self._file.write(b']')
+        else:
+            self._file.write(b'\n]')
+
+class NdjsonWriter(_RecordWriter):
+    """Stream records as newline-delimited JSON, one compact object per line"""
+
+    def _write_batch(self, batch):
+        self._file.write(b''.join(self.encode(record) + b'\n' for record in batch))
+
+def write_json(records, path, indent=None, backend=None):
+    """Write a list of records as a JSON array; returns the record count"""
+    with JsonArrayWriter(path, indent, backend) as writer:
+        writer.write_many(records)
+    return writer.count
@@ -0,0 +1,388 @@
+"""
+Record normalization for the investor data converters
+Runs on cleaned records and adds structured fields the directory can
+filter on with plain comparisons instead of matching free text:
+
+  - hq_city, hq_state, hq_country, parsed together from 'company
+    address' ("street, city, state, country, postal code") or, without
+    one, from the free-text city ('Mumbai', 'DIFC, Dubai, UAE'), so the
+    three always describe one place; 'company country' fills in a
+    missing country. Common aliases are folded together ('Gurgaon' ->
+    'Gurugram', 'UAE' -> 'United Arab Emirates')
+  - ticket_min_usd, ticket_max_usd, from ticket_size ('$50K - $200K',
+    'INR 2-5 Cr', 'Up to $1M'), converted with the fixed USD_RATES
+
+It also has the value normalizers the column schema (column_schema.py)
+declares for URL fields (scheme, lower-case host, no trailing slash;
+LinkedIn and Twitter URLs as https://www.linkedin.com/in/handle and
+https://twitter.com/handle) and email fields (lower-case domains); those
+run on the columns, before cleaning.
+
+Each parser is memoized on the raw string, since cities, addresses and
+ticket sizes repeat across thousands of rows. URLs and emails are
+mostly unique per row and mostly canonical already, so those are
+checked with one regex first and only the ones that change reach the
+cached parser.
+"""
+import re
+from functools import lru_cache
+from urllib.parse import urlsplit, urlunsplit
+
+CACHE_SIZE = 1 << 14
+
+# Longest free-text part still taken for a city name, and words that
+# mark a part as a street or building instead
+MAX_PLACE_WORDS = 3
+STREET_WORDS = frozenset((
+    'road', 'rd', 'street', 'st', 'str', 'avenue', 'ave', 'boulevard', 'blvd', 'lane',
+    'rue', 'marg', 'tower', 'towers', 'building', 'house', 'floor', 'office', 'suite',
+    'plaza', 'square', 'block', 'sector',
+))
+
+# Country names recognised in free text, besides COUNTRY_ALIASES
+COUNTRIES = frozenset(name.lower() for name in (
+    'Argentina', 'Australia', 'Austria', 'Bahrain', 'Bangladesh', 'Belgium', 'Bermuda',
+    'Brazil', 'British Virgin Islands', 'Canada', 'Cayman Islands', 'Chile', 'China',
+    'Colombia', 'Cyprus', 'Denmark', 'Egypt', 'Estonia', 'Finland', 'France', 'Germany',
+    'Greece', 'Hong Kong', 'India', 'Indonesia', 'Ireland', 'Israel', 'Italy', 'Japan',
+    'Jordan', 'Kenya', 'Kuwait', 'Lebanon', 'Luxembourg', 'Malaysia', 'Mauritius',
+    'Mexico', 'Morocco', 'Nepal', 'Netherlands', 'New Zealand', 'Nigeria', 'Norway',
+    'Oman', 'Pakistan', 'Philippines', 'Poland', 'Portugal', 'Qatar', 'Saudi Arabia',
+    'Singapore', 'South Africa', 'South Korea', 'Spain', 'Sri Lanka', 'Sweden',
+    'Switzerland', 'Taiwan', 'Thailand', 'Turkey', 'Ukraine', 'United Arab Emirates',
+    'United Kingdom', 'United States', 'Vietnam', 'Russia', 'Hungary', 'Czech Republic',
+))
+
+COUNTRY_ALIASES = {
+    'uae': 'United Arab Emirates',
+    'u.a.e.': 'United Arab Emirates',
+    'usa': 'United States',
+    'us': 'United States',
+    'u.s.': 'United States',
+    'u.s.a.': 'United States',
+    'united states of america': 'United States',
+    'uk': 'United Kingdom',
+    'u.k.': 'United Kingdom',
+    'great britain': 'United Kingdom',
+    'england': 'United Kingdom',
+    'ksa': 'Saudi Arabia',
+    'korea': 'South Korea',
+    'republic of korea': 'South Korea',
+    'holland': 'Netherlands',
+    'the netherlands': 'Netherlands',
+    'turkiye': 'Turkey',
+}
+
+# Two-letter country codes that aren't also US state codes
+COUNTRY_ALIASES.update({code: name for code, name in (
+    ('ae', 'United Arab Emirates'), ('at', 'Austria'), ('au', 'Australia'),
+    ('be', 'Belgium'), ('bh', 'Bahrain'), ('cn', 'China'), ('eg', 'Egypt'),
+    ('es', 'Spain'), ('fr', 'France'), ('gb', 'United Kingdom'), ('gr', 'Greece'),
+    ('hk', 'Hong Kong'), ('jp', 'Japan'), ('kw', 'Kuwait'), ('lu', 'Luxembourg'),
+    ('nl', 'Netherlands'), ('pk', 'Pakistan'), ('qa', 'Qatar'), ('sa', 'Saudi Arabia'),
+    ('sg', 'Singapore'), ('tr', 'Turkey'), ('ua', 'Ukraine'), ('za', 'South Africa'),
+)})
+
+CITY_ALIASES = {
+    'gurgaon': 'Gurugram',
+    'bangalore': 'Bengaluru',
+    'bombay': 'Mumbai',
+    'madras': 'Chennai',
+    'calcutta': 'Kolkata',
+    'delhi': 'New Delhi',
+    'new york city': 'New York',
+    'nyc': 'New York',
+    'sf': 'San Francisco',
+}
+
+# Approximate USD value of one unit, for filtering rather than accounting
+USD_RATES = {
+    'USD': 1.0,
+    'INR': 0.012,
+    'AED': 0.2723,
+    'SAR': 0.2667,
+    'EUR': 1.08,
+    'GBP': 1.27,
+    'SGD': 0.74,
+}
+
+US_STATES = {
+    'AL': 'Alabama', 'AK': 'Alaska', 'AZ': 'Arizona', 'AR': 'Arkansas', 'CA': 'California',
+    'CO': 'Colorado', 'CT': 'Connecticut', 'DE': 'Delaware', 'DC': 'District of Columbia',
+    'FL': 'Florida', 'GA': 'Georgia', 'HI': 'Hawaii', 'ID': 'Idaho', 'IL': 'Illinois',
+    'IN': 'Indiana', 'IA': 'Iowa', 'KS': 'Kansas', 'KY': 'Kentucky', 'LA': 'Louisiana',
+    'ME': 'Maine', 'MD': 'Maryland', 'MA': 'Massachusetts', 'MI': 'Michigan',
+    'MN': 'Minnesota', 'MS': 'Mississippi', 'MO': 'Missouri', 'MT': 'Montana',
+    'NE': 'Nebraska', 'NV': 'Nevada', 'NH': 'New Hampshire', 'NJ': 'New Jersey',
+    'NM': 'New Mexico', 'NY': 'New York', 'NC': 'North Carolina', 'ND': 'North Dakota',
+    'OH': 'Ohio', 'OK': 'Oklahoma', 'OR': 'Oregon', 'PA': 'Pennsylvania',
+    'RI': 'Rhode Island', 'SC': 'South Carolina', 'SD': 'South Dakota', 'TN': 'Tennessee',
+    'TX': 'Texas', 'UT': 'Utah', 'VT': 'Vermont', 'VA': 'Virginia', 'WA': 'Washington',
+    'WV': 'West Virginia', 'WI': 'Wisconsin', 'WY': 'Wyoming',
+}
+US_STATE_NAMES = frozenset(US_STATES.values())
+
+CURRENCY_SYMBOLS = {'$': 'USD', '₹': 'INR', '€': 'EUR', '£': 'GBP', 'rs': 'INR', 'rs.': 'INR'}
+
+MULTIPLIERS = {
+    'k': 1e3, 'thousand': 1e3,
+    'm': 1e6, 'mm': 1e6, 'mn': 1e6, 'million': 1e6, 'millions': 1e6,
+    'b': 1e9, 'bn': 1e9, 'billion': 1e9,
+    'l': 1e5, 'lac': 1e5, 'lacs': 1e5, 'lakh': 1e5, 'lakhs': 1e5,
+    'cr': 1e7, 'crs': 1e7, 'crore': 1e7, 'crores': 1e7,
+}
+
+_POSTAL_RE = re.compile(r'^[A-Z]{0,2}\d[\dA-Z -]{0,9}$', re.IGNORECASE)
+_AMOUNT_RE = re.compile(r'(\d+(?:\.\d+)?)\s*([a-z]+\.?)?')
+_RANGE_RE = re.compile(r'\s*(?:-|–|—|\bto\b)\s*')
+_CURRENCY_RE = re.compile(r'\b(' + '|'.join(USD_RATES) + r')\b|[$₹€£]|\brs\.?', re.IGNORECASE)
+_EMAIL_DOMAIN_RE = re.compile(r'@([\w.-]+)')
+# URLs canonical_url would return unchanged
+_CANONICAL_URL_RE = re.compile(
+    r'https://www\.linkedin\.com/(?:in|company|school)/[a-z0-9_%-]+'
+    r'|https://twitter\.com/\w+'
+    r'|https?://(?![\w.-]*\b(?:linkedin|twitter|x)\.com\b)[a-z0-9.-]+(?:/[^?#\s]*[^/?#\s])?'
+)
+_LINKEDIN_PATH_RE = re.compile(r'^/(in|company|school)/([^/?#]+)', re.IGNORECASE)
+# Values canonical_url treats as links: an http(s) URL or a bare dotted
+# host such as 'www.acme.com/about'; anything else is kept as it is
+_HTTP_URL_RE = re.compile(r'(?:https?:)?//', re.IGNORECASE)
+_BARE_HOST_RE = re.compile(r'(?:[a-z0-9-]+\.)+[a-z]{2,}(?::\d+)?(?:[/?#]\S*)?', re.IGNORECASE)
+
+def _title(token):
+    """Title-case all-lower tokens; keep acronyms and mixed case as written"""
+    return token.title() if token.islower() else token
+
+def known_country(name):
+    """Full name of a country named or abbreviated in name, or None"""
+    key = name.strip().lower()
+    if key in COUNTRY_ALIASES:
+        return COUNTRY_ALIASES[key]
+    return _title(name.strip()) if key in COUNTRIES else None
+
+def canonical_country(name):
+    """Full country name for an alias such as 'UAE' or 'USA'"""
+    return known_country(name) or _title(name.strip()) if name else None
+
+def canonical_city(name):
+    """Current city name for an alias such as 'Gurgaon' or 'Bangalore'"""
+    return CITY_ALIASES.get(name.lower(), _title(name)) if name else None
+
+def _split_country(token):
+    """(rest, country) when token ends with a country, as in 'Dubai-UAE'"""
+    country = known_country(token)
+    if country:
+        return None, country
+    for sep in ('-', ' '):
+        head, _, tail = token.rpartition(sep)
+        while head:
+            country = known_country(tail)
+            if country:
+                return head.strip(' -'), country
+            head, _, word = head.rpartition(sep)
+            tail = f"{word}{sep}{tail}"
+    return token, None
+
+@lru_cache(maxsize=CACHE_SIZE)
+def parse_location(text, structured=True):
+    """
+    (city, state, country) from a location. A structured one is read by
+    position, as "street, city, state, country, postal code" or a shorter
+    tail of it (a single name is a country). Free text is read from the
+    end: a known country ('Dubai-UAE', '..., TR') and a US state ('Los
+    Angeles, CA') are taken off, then the next place name is the city
+    unless it looks like a street (see STREET_WORDS). Missing parts are
+    None.
+    """
+    parts = [part.strip() for part in str(text).split(',')]
+    parts = [part for part in parts if part and not (_POSTAL_RE.match(part) and
+                                                     any(c.isdigit() for c in part))]
+    if not parts:
+        return None, None, None
+
+    if structured:
+        if len(parts) == 1:
+            return None, None, canonical_country(parts[0])
+        country = canonical_country(parts[-1])
+        if len(parts) == 2:
+            return canonical_city(parts[0]), None, country
+        state = _title(parts[-2])
+        if state == country:
+            # City-states: 'Singapore, Singapore, Singapore'
+            return canonical_city(state), None, country
+        return canonical_city(parts[-3]), state, country
+
+    # Free text: peel country, state and stray codes off the end; the
+    # next place name is the city
+    city = state = country = None
+    while parts and city is None:
+        words = [word for word in parts.pop().replace(' - ', ' ').split()
+                 if not any(c.isdigit() for c in word)]
+        if not words:
+            continue
+        if country is None:
+            rest, country = _split_country(' '.join(words))
+            if country:
+                if rest:
+                    parts.append(rest)
+                continue
+        if state is None and country in (None, 'United States'):
+            if words[-1] in US_STATES:
+                state, country = US_STATES[words.pop()], 'United States'
+            elif parts and ' '.join(words) in US_STATE_NAMES:
+                state, country = ' '.join(words), 'United States'
+                continue
+        # Skip bare codes and PO boxes; stop at a street or building,
+        # which is longer than any city name
+        while words and len(words[-1]) <= 3 and words[-1].isupper():
+            words.pop()
+        if not words or words[0].lower().rstrip('.') in ('po', 'p.o'):
+            continue
+        if len(words) > MAX_PLACE_WORDS or STREET_WORDS.intersection(w.lower() for w in words):
+            break
+        if known_country(' '.join(words)):
+            # 'India PIN - 122009', 'SINGAPORE, Singapore 238997'
+            country = country or known_country(' '.join(words))
+            break
+        city = ' '.join(words)
+    return canonical_city(city), state, country
+
+def canonical_url(url):
+    """
+    URL with a scheme, lower-case host and no trailing slash; LinkedIn
+    and Twitter profile URLs reduced to https://host/in/handle,
+    https://host/company/handle or https://host/handle form. Values that
+    aren't http(s) URLs or bare hosts ('N', 'mailto:...') are returned
+    unchanged, so they don't become links.
+    """
+    if _CANONICAL_URL_RE.fullmatch(url):
+        # Most URLs, and most unique ones, need no change: keep them
+        # out of the cache
+        return url
+    return _canonical_url(url)
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _canonical_url(value):
+    url = str(value).strip()
+    if _HTTP_URL_RE.match(url) is None:
+        if _BARE_HOST_RE.fullmatch(url) is None:
+            return value
+        url = 'https://' + url
+    try:
+        parts = urlsplit(url)
+        port = parts.port
+    except ValueError:
+        return value
+    host = (parts.hostname or '').lower()
+    if not host:
+        return value
+    path = parts.path.rstrip('/')
+
+    if host == 'linkedin.com' or host.endswith('.linkedin.com'):
+        match = _LINKEDIN_PATH_RE.match(path)
+        if match:
+            return f"https://www.linkedin.com/{match.group(1).lower()}/{match.group(2).lower()}"
+        # Legacy /pub/name/x/y/z paths need their ids: keep the whole path
+        return urlunsplit(('https', 'www.linkedin.com', path, '', ''))
+    if host in ('twitter.com', 'www.twitter.com', 'mobile.twitter.com', 'x.com', 'www.x.com'):
+        if not path and parts.fragment.startswith('!/'):
+            # Old hashbang links: twitter.com/#!/handle
+            path = parts.fragment[1:]
+        handle = path.strip('/').split('/')[0].lstrip('@')
+        return f"https://twitter.com/{handle}" if handle else "https://twitter.com"
+
+    netloc = host if port is None else f"{host}:{port}"
+    return urlunsplit((parts.scheme.lower() or 'https', netloc, path, parts.query, parts.fragment))
+
+def normalize_emails(text):
+    """Email field with every address's domain lower-cased"""
+    if text == text.lower():
+        return text
+    return _lower_domains(text)
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _lower_domains(text):
+    return _EMAIL_DOMAIN_RE.sub(lambda m: '@' + m.group(1).lower(), text)
+
+def _amount(text):
+    """Number in text with its unit applied ('2.5M' -> 2500000.0), or None"""
+    match = _AMOUNT_RE.search(text.replace(',', ''))
+    if not match:
+        return None, None
+    value = float(match.group(1))
+    unit = (match.group(2) or '').rstrip('.')
+    if unit in MULTIPLIERS:
+        return value * MULTIPLIERS[unit], unit
+    return value, None
+
+@lru_cache(maxsize=CACHE_SIZE)
+def parse_ticket_size(text):
+    """
+    (min, max) ticket in USD from text such as '$50K - $200K',
+    'INR 2-5 Cr', 'Up to $1M' or '$500K+'; an open end is None,
+    a single amount gives min == max. (None, None) if unparseable or
+    if the range runs backwards.
+    """
+    text = str(text).strip().lower()
+    match = _CURRENCY_RE.search(text)
+    if match:
+        code = match.group(1)
+        currency = code.upper() if code else CURRENCY_SYMBOLS[match.group(0).lower()]
+        text = _CURRENCY_RE.sub(' ', text)
+    else:
+        currency = 'USD'
+    rate = USD_RATES[currency]
+
+    upper_only = bool(re.match(r'\s*(up ?to|upto|max(imum)?|under|below|<)', text))
+    lower_only = text.rstrip().endswith('+') or bool(re.match(r'\s*(min(imum)?|from|above|over|>)', text))
+
+    bounds = [_amount(part) for part in _RANGE_RE.split(text, maxsplit=1)]
+    bounds = [bound for bound in bounds if bound[0] is not None]
+    if not bounds:
+        return None, None
+    if len(bounds) == 2:
+        # '2-5 Cr' or '5 Cr - 10': the unit is written once, for both
+        (low, low_unit), (high, high_unit) = bounds
+        if low_unit is None and high_unit is not None:
+            bounds[0] = (low * MULTIPLIERS[high_unit], high_unit)
+        elif high_unit is None and low_unit is not None:
+            bounds[1] = (high * MULTIPLIERS[low_unit], low_unit)
+
+    low, high = round(bounds[0][0] * rate), round(bounds[-1][0] * rate)
+    if len(bounds) == 1 and upper_only:
+        return None, high
+    if len(bounds) == 1 and lower_only:
+        return low, None
+    if low > high:
+        return None, None
+    return low, high
+
+def normalize_record(record):
+    """
+    Set one Investor's structured fields; reads and writes slots
+    directly, as this runs once per row
+    """
+    # City, state and country come from one parse, so they describe the
+    # same place: the address if it names anything, else the free-text
+    # city (often a branch office, not the head office of the address)
+    location = (None, None, None)
+    if isinstance(record.company_address, str):
+        location = parse_location(record.company_address)
+    if location == (None, None, None) and isinstance(record.city, str):
+        location = parse_location(record.city, structured=False)
+    city, state, country = location
+    if country is None and isinstance(record.company_country, str):
+        country = canonical_country(record.company_country)
+    record.hq_city = city
+    record.hq_state = state
+    record.hq_country = country
+
+    if record.ticket_size is not None:
+        record.ticket_min_usd, record.ticket_max_usd = parse_ticket_size(record.ticket_size)
+    return record
+
+def normalize_records(records):
+    """Normalize a list of cleaned Investor records in place and return it"""
+    for record in records:
+        normalize_record(record)
+    return records
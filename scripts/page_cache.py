@@ -0,0 +1,109 @@
+"""
+Page-level cache for PDF text extraction
+Stores the text pdfplumber extracted from each page, keyed by the PDF's
+content hash, the page index and the extractor version, in a small SQLite
+database. Re-runs only extract pages of new or changed PDFs, and text
+post-processing can change freely because the raw page text is cached.
+The cache is capped in size; the least recently used pages go first.
+"""
+import sqlite3
+import time
+from pathlib import Path
+
+DEFAULT_PATH = Path(__file__).parent.parent / ".cache" / "pdf-pages.sqlite3"
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    pdf_hash TEXT NOT NULL,
+    version TEXT NOT NULL,
+    page_count INTEGER NOT NULL,
+    PRIMARY KEY (pdf_hash, version)
+);
+CREATE TABLE IF NOT EXISTS pages (
+    pdf_hash TEXT NOT NULL,
+    version TEXT NOT NULL,
+    page INTEGER NOT NULL,
+    text TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    last_used REAL NOT NULL,
+    PRIMARY KEY (pdf_hash, version, page)
+);
+CREATE INDEX IF NOT EXISTS pages_last_used ON pages (last_used);
+"""
+
+class PageCache:
+    """SQLite-backed page text cache with a size cap and LRU eviction"""
+
+    def __init__(self, version, path=DEFAULT_PATH, max_bytes=DEFAULT_MAX_BYTES):
+        self.version = version
+        self.max_bytes = max_bytes
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(path))
+        self._db.executescript(SCHEMA)
+        # The cap may have been lowered since the last run
+        self.evict()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Commit and close the database"""
+        self._db.commit()
+        self._db.close()
+
+    def page_count(self, doc_hash):
+        """Page count recorded for a document, or None if never seen"""
+        row = self._db.execute(
+            "SELECT page_count FROM documents WHERE pdf_hash = ? AND version = ?",
+            (doc_hash, self.version),
+        ).fetchone()
+        return row[0] if row else None
+
+    def get_pages(self, doc_hash):
+        """Return {page index: text} for the cached pages of a document"""
+        rows = self._db.execute(
+            "SELECT page, text FROM pages WHERE pdf_hash = ? AND version = ?",
+            (doc_hash, self.version),
+        ).fetchall()
+        if rows:
+            self._db.execute(
+                "UPDATE pages SET last_used = ? WHERE pdf_hash = ? AND version = ?",
+                (time.time(), doc_hash, self.version),
+            )
+        return dict(rows)
+
+    def put_pages(self, doc_hash, page_count, pages):
+        """Store {page index: text} for a document and evict if over the cap"""
+        now = time.time()
+        self._db.execute(
+            "INSERT OR REPLACE INTO documents (pdf_hash, version, page_count) VALUES (?, ?, ?)",
+            (doc_hash, self.version, page_count),
+        )
+        self._db.executemany(
+            "INSERT OR REPLACE INTO pages (pdf_hash, version, page, text, size, last_used) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            [(doc_hash, self.version, page, text, len(text.encode('utf-8')), now)
+             for page, text in pages.items()],
+        )
+        self.evict()
+        self._db.commit()
+
+    def evict(self):
+        """Delete least recently used pages until the cache fits max_bytes"""
+        total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM pages").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        rows = self._db.execute(
+            "SELECT rowid, size FROM pages ORDER BY last_used, rowid"
+        ).fetchall()
+        doomed = []
+        for rowid, size in rows:
+            if total <= self.max_bytes:
+                break
+            doomed.append((rowid,))
+            total -= size
+        self._db.executemany("DELETE FROM pages WHERE rowid = ?", doomed)
@@ -0,0 +1,36 @@
+"""
+Process pool helpers shared by the investor data converters
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+def resolve_jobs(jobs):
+    """Turn a --jobs value into a worker count (0 means one per CPU)"""
+    if not jobs or jobs < 0:
+        return os.cpu_count() or 1
+    return jobs
+
+def imap_ordered(func, tasks, jobs=1):
+    """
+    Call func(*task) for every task and yield the results in task order,
+    each one as soon as it and all earlier results are ready.
+
+    With more than one job the calls run in a ProcessPoolExecutor, so func
+    must be a module-level function and the task arguments picklable.
+    Results are always returned in submission order, which keeps the
+    merged output identical to a serial run.
+    """
+    tasks = list(tasks)
+    workers = min(resolve_jobs(jobs), len(tasks))
+
+    if workers <= 1:
+        for task in tasks:
+            yield func(*task)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(func, *zip(*tasks))
+
+def map_ordered(func, tasks, jobs=1):
+    """Like imap_ordered, but return all results as a list"""
+    return list(imap_ordered(func, tasks, jobs))
@@ -0,0 +1,177 @@
+"""
+Per-stage profiling for the investor data converters
+Stages are wrapped in `with stage(name, source) as s:` blocks, which do
+nothing until enable() is called (the converters' --profile option).
+When enabled each stage records wall time, CPU time, peak traced Python
+memory (tracemalloc), the process's peak RSS so far and, if the block
+sets s.rows, row throughput. Repeated blocks with the same name and
+source (e.g. one per chunk) add up. One stage can also be run under
+cProfile.
+"""
+import cProfile
+import io
+import json
+import pstats
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+PROFILE_VERSION = 1
+
+_profile = None
+
+def peak_rss_bytes():
+    """Peak resident set size of this process so far, or None if unknown"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes on Linux
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+class StageStats:
+    """Totals for one (stage, source) pair"""
+
+    __slots__ = ('name', 'source', 'calls', 'wall', 'cpu', 'rows', 'peak_traced', 'peak_rss')
+
+    def __init__(self, name, source):
+        self.name = name
+        self.source = source
+        self.calls = 0
+        self.wall = 0.0
+        self.cpu = 0.0
+        self.rows = None
+        self.peak_traced = 0
+        self.peak_rss = None
+
+    def to_dict(self):
+        return {
+            "stage": self.name,
+            "source": self.source,
+            "calls": self.calls,
+            "wall_s": round(self.wall, 6),
+            "cpu_s": round(self.cpu, 6),
+            "rows": self.rows,
+            "rows_per_s": round(self.rows / self.wall, 1) if self.rows and self.wall else None,
+            "peak_traced_bytes": self.peak_traced,
+            "peak_rss_bytes": self.peak_rss,
+        }
+
+class _Block:
+    """Handle a stage block can set the row count on"""
+    __slots__ = ('rows',)
+
+    def __init__(self):
+        self.rows = None
+
+class Profile:
+    """Collects StageStats in first-seen order"""
+
+    def __init__(self, cprofile_stage=None):
+        self.stages = {}
+        self.cprofile_stage = cprofile_stage
+        self.cprofile = cProfile.Profile() if cprofile_stage else None
+        self.started = time.perf_counter()
+
+    @contextmanager
+    def stage(self, name, source=None):
+        block = _Block()
+        profiler = self.cprofile if name == self.cprofile_stage else None
+        tracemalloc.reset_peak()
+        wall, cpu = time.perf_counter(), time.process_time()
+        if profiler is not None:
+            profiler.enable()
+        try:
+            yield block
+        finally:
+            if profiler is not None:
+                profiler.disable()
+            stats = self.stages.get((name, source))
+            if stats is None:
+                stats = self.stages[(name, source)] = StageStats(name, source)
+            stats.calls += 1
+            stats.wall += time.perf_counter() - wall
+            stats.cpu += time.process_time() - cpu
+            if block.rows is not None:
+                stats.rows = (stats.rows or 0) + block.rows
+            stats.peak_traced = max(stats.peak_traced, tracemalloc.get_traced_memory()[1])
+            stats.peak_rss = peak_rss_bytes()
+
+    def to_dict(self):
+        totals = {}
+        for stats in self.stages.values():
+            total = totals.setdefault(stats.name, StageStats(stats.name, None))
+            total.calls += stats.calls
+            total.wall += stats.wall
+            total.cpu += stats.cpu
+            if stats.rows is not None:
+                total.rows = (total.rows or 0) + stats.rows
+            total.peak_traced = max(total.peak_traced, stats.peak_traced)
+            total.peak_rss = stats.peak_rss
+        return {
+            "version": PROFILE_VERSION,
+            "wall_s": round(time.perf_counter() - self.started, 6),
+            "peak_rss_bytes": peak_rss_bytes(),
+            "stages": [stats.to_dict() for stats in self.stages.values()],
+            "totals": [stats.to_dict() for stats in totals.values()],
+        }
+
+    def report(self):
+        """Print a per-stage table and, if used, the cProfile top functions"""
+        data = self.to_dict()
+        print("\n" + "="*60)
+        print("PROFILE")
+        print("="*60)
+        print(f"  {'stage':16s} {'source':18s} {'wall s':>8s} {'cpu s':>8s} "
+              f"{'rows/s':>10s} {'traced MB':>9s}")
+        for entry in data["stages"]:
+            rate = f"{entry['rows_per_s']:,.0f}" if entry['rows_per_s'] else '-'
+            print(f"  {entry['stage']:16s} {str(entry['source'] or ''):18s} "
+                  f"{entry['wall_s']:8.3f} {entry['cpu_s']:8.3f} {rate:>10s} "
+                  f"{entry['peak_traced_bytes'] / 2**20:9.1f}")
+        rss = data["peak_rss_bytes"]
+        print(f"  Total {data['wall_s']:.3f} s" + (f", peak RSS {rss / 2**20:.1f} MB" if rss else ""))
+
+        if self.cprofile is not None:
+            out = io.StringIO()
+            pstats.Stats(self.cprofile, stream=out).sort_stats('cumulative').print_stats(20)
+            print(f"\ncProfile of stage '{self.cprofile_stage}':")
+            print(out.getvalue())
+
+    def write(self, path):
+        """Write the figures as JSON"""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+def enable(cprofile_stage=None):
+    """Start profiling stages (and tracing allocations) in this process"""
+    global _profile
+    tracemalloc.start()
+    _profile = Profile(cprofile_stage)
+    return _profile
+
+@contextmanager
+def stage(name, source=None):
+    """Time a pipeline stage; a no-op unless enable() was called"""
+    if _profile is None:
+        yield _Block()
+    else:
+        with _profile.stage(name, source) as block:
+            yield block
+
+def finish(json_path=None):
+    """Print the report, write JSON if json_path is set, and stop profiling"""
+    global _profile
+    if _profile is None:
+        return
+    _profile.report()
+    if json_path:
+        _profile.write(json_path)
+        print(f"✓ Wrote profile to {json_path}")
+    _profile = None
+    tracemalloc.stop()
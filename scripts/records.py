@@ -0,0 +1,157 @@
+"""
+Typed investor record shared by every pipeline stage
+An Investor keeps the canonical fields and the vendor columns most
+sources carry in __slots__ attributes, so a record costs one small
+object instead of a dict per row. Any other column goes into a side map,
+which is only created when a row has one. Investor is also a mutable
+mapping keyed by the output field names ('first name', 'personal linkedin
+url', ...), so stages that read records by key work unchanged, and
+json_default lets json.dump write it out.
+
+A field set to None is absent: it is skipped when iterating and never
+written to the output.
+"""
+from collections.abc import Mapping, MutableMapping
+from dataclasses import dataclass, field, fields
+from typing import Optional, Union
+
+Value = Optional[Union[str, int, float, bool]]
+
+@dataclass(slots=True, eq=False)
+class Investor(MutableMapping):
+    """One investor row: canonical fields, common vendor fields, extras"""
+
+    # Canonical fields (column_schema.SCHEMA) and source metadata
+    name: Value = None
+    type: Value = None
+    geography: Value = None
+    city: Value = None
+    stage: Value = None
+    focus: Value = None
+    email: Value = None
+    linkedin: Value = None
+    website: Value = None
+    ticket_size: Value = None
+    description: Value = None
+    notes: Value = None
+    portfolio: Value = None
+    contact_person: Value = None
+    phone: Value = None
+    source: Value = None
+    source_geography: Value = None
+
+    # Vendor columns shared by several sources; metadata 'key' is the
+    # output name when it isn't the attribute name
+    first_name: Value = field(default=None, metadata={'key': 'first name'})
+    last_name: Value = field(default=None, metadata={'key': 'last name'})
+    title: Value = None
+    position: Value = None
+    personal_linkedin_url: Value = field(default=None, metadata={'key': 'personal linkedin url'})
+    company_linkedin_url: Value = field(default=None, metadata={'key': 'company linkedin url'})
+    twitter_url: Value = field(default=None, metadata={'key': 'twitter url'})
+    company_address: Value = field(default=None, metadata={'key': 'company address'})
+    company_country: Value = field(default=None, metadata={'key': 'company country'})
+
+    # Structured fields derived from the ones above (normalize.py)
+    hq_city: Value = None
+    hq_state: Value = None
+    hq_country: Value = None
+    ticket_min_usd: Value = None
+    ticket_max_usd: Value = None
+
+    # Every other column, keyed by its output name
+    extras: Optional[dict] = None
+
+    @classmethod
+    def from_items(cls, items):
+        """Build a record from (output key, value) pairs, skipping None values"""
+        record = cls()
+        for key, value in items:
+            if value is not None:
+                record[key] = value
+        return record
+
+    @classmethod
+    def from_mapping(cls, mapping):
+        """Build a record from a dict (e.g. one read back from JSON)"""
+        if isinstance(mapping, cls):
+            return mapping.copy()
+        return cls.from_items(mapping.items())
+
+    def __getitem__(self, key):
+        attr = ATTRIBUTES.get(key)
+        if attr is not None:
+            value = getattr(self, attr)
+        elif self.extras is not None:
+            value = self.extras.get(key)
+        else:
+            value = None
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key, value):
+        attr = ATTRIBUTES.get(key)
+        if attr is not None:
+            setattr(self, attr, value)
+        elif value is not None:
+            if self.extras is None:
+                self.extras = {}
+            self.extras[key] = value
+        elif self.extras is not None:
+            self.extras.pop(key, None)
+
+    def __delitem__(self, key):
+        if key not in self:
+            raise KeyError(key)
+        self[key] = None
+
+    def __iter__(self):
+        for attr, key in KEYS:
+            if getattr(self, attr) is not None:
+                yield key
+        if self.extras:
+            yield from self.extras
+
+    def __len__(self):
+        count = sum(getattr(self, attr) is not None for attr, _ in KEYS)
+        return count + (len(self.extras) if self.extras else 0)
+
+    def copy(self):
+        """Shallow copy, with its own extras map"""
+        record = Investor()
+        for attr, _ in KEYS:
+            setattr(record, attr, getattr(self, attr))
+        record.extras = dict(self.extras) if self.extras else None
+        return record
+
+    def to_dict(self):
+        """Plain dict in output key order"""
+        return dict(self.items())
+
+# (attribute, output key) for every slot except extras, in output order
+KEYS = tuple((f.name, f.metadata.get('key', f.name)) for f in fields(Investor) if f.name != 'extras')
+ATTRIBUTES = {key: attr for attr, key in KEYS}
+
+def record_builder(columns):
+    """
+    Return a function that turns a row of values (in columns order, None
+    for absent cells) into an Investor, resolving each column once
+    """
+    slots = [(i, ATTRIBUTES[column]) for i, column in enumerate(columns) if column in ATTRIBUTES]
+    others = [(i, column) for i, column in enumerate(columns) if column not in ATTRIBUTES]
+
+    def build(row):
+        record = Investor(**{attr: row[i] for i, attr in slots})
+        if others:
+            extras = {column: row[i] for i, column in others if row[i] is not None}
+            if extras:
+                record.extras = extras
+        return record
+    return build
+
+def json_default(value):
+    """default= hook for json.dump/json.dumps that writes Investor records"""
+    if isinstance(value, Mapping):
+        return dict(value.items())
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
@@ -0,0 +1,201 @@
+"""
+Prebuilt search index for the investor dataset
+Builds an inverted index from normalized tokens of the searchable fields
+to record IDs (positions in investors.json), so lookups and presence
+checks are index lookups instead of scans over the whole file.
+
+Artifact layout (minified JSON):
+    {
+      "version": 1,
+      "count": <number of records>,
+      "fields": [...],
+      "source_sha256": <hash of the JSON file the index was built from>,
+      "tokens": [...],            sorted, for binary-search prefix lookups
+      "postings": [[...], ...]    delta-encoded record IDs per token
+    }
+"""
+import argparse
+import json
+import os
+import re
+import unicodedata
+from bisect import bisect_left
+from pathlib import Path
+
+from hashing import file_sha256
+
+INDEX_VERSION = 1
+SEARCH_FIELDS = ('name', 'first name', 'last name', 'focus', 'city', 'title')
+
+DATA_PATH = Path(__file__).parent.parent / "public" / "data"
+INDEX_FILE = "search-index.json"
+
+_TOKEN_RE = re.compile(r'[a-z0-9]+')
+
+def tokenize(text):
+    """Lower-case, strip accents and split text into alphanumeric tokens"""
+    text = unicodedata.normalize('NFKD', str(text))
+    text = text.encode('ascii', 'ignore').decode('ascii').lower()
+    return _TOKEN_RE.findall(text)
+
+class SearchIndexBuilder:
+    """Accumulates tokens one record at a time (record IDs are assigned in order)"""
+
+    def __init__(self, fields=SEARCH_FIELDS):
+        self.fields = fields
+        self.count = 0
+        self._postings = {}
+
+    def add(self, record):
+        """Index one record under the next record ID"""
+        record_id = self.count
+        self.count += 1
+        for field in self.fields:
+            value = record.get(field)
+            if value is None:
+                continue
+            for token in tokenize(value):
+                ids = self._postings.setdefault(token, [])
+                if not ids or ids[-1] != record_id:
+                    ids.append(record_id)
+
+    def add_many(self, records):
+        """Index every record of an iterable"""
+        for record in records:
+            self.add(record)
+
+    def to_dict(self, source_sha256=None):
+        """Return the compact artifact as a dict"""
+        tokens = sorted(self._postings)
+        postings = []
+        for token in tokens:
+            ids = self._postings[token]
+            postings.append([ids[0]] + [b - a for a, b in zip(ids, ids[1:])])
+        return {
+            "version": INDEX_VERSION,
+            "count": self.count,
+            "fields": list(self.fields),
+            "source_sha256": source_sha256,
+            "tokens": tokens,
+            "postings": postings,
+        }
+
+    def write(self, path, source_sha256=None):
+        """Write the artifact as minified JSON, atomically"""
+        path = Path(path)
+        tmp_path = path.with_name(path.name + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(source_sha256), f, separators=(',', ':'))
+        os.replace(tmp_path, path)
+
+class SearchIndex:
+    """
+    Query API over a built index. Exact token lookups are dict lookups
+    and prefix lookups are a binary search over the sorted token list, so
+    neither scans the records.
+    """
+
+    def __init__(self, data):
+        if data.get("version") != INDEX_VERSION:
+            raise ValueError(f"Unsupported search index version: {data.get('version')}")
+        self.count = data["count"]
+        self.fields = data["fields"]
+        self.source_sha256 = data.get("source_sha256")
+        self.tokens = data["tokens"]
+        self._postings = data["postings"]
+        self._positions = {token: i for i, token in enumerate(self.tokens)}
+
+    @classmethod
+    def load(cls, path):
+        """Load an index artifact from disk"""
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls(json.load(f))
+
+    def _ids(self, position):
+        """Decode the delta-encoded posting list at a token position"""
+        ids = []
+        current = 0
+        for delta in self._postings[position]:
+            current += delta
+            ids.append(current)
+        return ids
+
+    def lookup(self, token):
+        """Record IDs containing exactly this token"""
+        position = self._positions.get(token)
+        return set() if position is None else set(self._ids(position))
+
+    def prefix(self, prefix):
+        """Record IDs containing any token that starts with prefix"""
+        ids = set()
+        position = bisect_left(self.tokens, prefix)
+        while position < len(self.tokens) and self.tokens[position].startswith(prefix):
+            ids.update(self._ids(position))
+            position += 1
+        return ids
+
+    def search(self, query, prefix=True):
+        """
+        Sorted record IDs matching every token of query. With prefix=True
+        the last token may be a prefix, as in type-ahead search.
+        """
+        tokens = tokenize(query)
+        if not tokens:
+            return []
+        matches = None
+        for i, token in enumerate(tokens):
+            if prefix and i == len(tokens) - 1:
+                ids = self.prefix(token)
+            else:
+                ids = self.lookup(token)
+            matches = ids if matches is None else matches & ids
+            if not matches:
+                return []
+        return sorted(matches)
+
+    def contains(self, query):
+        """True if some record has every token of query (exact tokens)"""
+        return bool(self.search(query, prefix=False))
+
+def build_index_file(json_path, index_path, fields=SEARCH_FIELDS):
+    """Build an index artifact from a records JSON file"""
+    with open(json_path, 'r', encoding='utf-8') as f:
+        records = json.load(f)
+    builder = SearchIndexBuilder(fields)
+    builder.add_many(records)
+    source_sha256 = file_sha256(json_path)
+    builder.write(index_path, source_sha256)
+    return SearchIndex(builder.to_dict(source_sha256))
+
+def load_or_build(json_path=DATA_PATH / "investors.json", index_path=DATA_PATH / INDEX_FILE):
+    """Load the index for json_path, rebuilding it if missing or stale"""
+    json_path, index_path = Path(json_path), Path(index_path)
+    if index_path.exists():
+        index = SearchIndex.load(index_path)
+        if index.source_sha256 == file_sha256(json_path):
+            return index
+    return build_index_file(json_path, index_path)
+
+def main(argv=None):
+    """Query the investor search index from the command line"""
+    parser = argparse.ArgumentParser(description="Search the investor index")
+    parser.add_argument('query', nargs='?', help="search terms (last one may be a prefix)")
+    parser.add_argument('--data', default=str(DATA_PATH / "investors.json"),
+                        help="records JSON file the index belongs to")
+    parser.add_argument('--index', default=str(DATA_PATH / INDEX_FILE),
+                        help="index artifact (rebuilt when missing or stale)")
+    parser.add_argument('--rebuild', action='store_true', help="rebuild the index first")
+    args = parser.parse_args(argv)
+
+    if args.rebuild:
+        index = build_index_file(args.data, args.index)
+    else:
+        index = load_or_build(args.data, args.index)
+    print(f"Index: {len(index.tokens)} tokens over {index.count} records")
+
+    if args.query:
+        ids = index.search(args.query)
+        print(f"{len(ids)} match(es) for {args.query!r}: {ids[:50]}")
+
+if __name__ == "__main__":
+    main()
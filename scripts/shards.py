@@ -0,0 +1,122 @@
+"""
+Sharded investor data artifacts for the directory pages
+Writes one minified shard per source_geography and per source, and an
+index.json listing each file's name, record count and content hash (the
+full dataset is the converter's own, already minified, investors.json).
+Values whose slugs collide ('UAE & Middle East', 'UAE Middle East')
+share one shard. Shard file names embed the hash so they can be served
+with long-lived cache headers.
+"""
+import json
+import os
+import re
+from pathlib import Path
+
+from hashing import HASH_LENGTH, content_hash
+from json_writer import JsonArrayWriter
+
+SHARD_FIELDS = ('source_geography', 'source')
+INDEX_FILE = "index.json"
+HASHED_NAME = re.compile(r'^[a-z0-9-]+\.[0-9a-f]{%d}\.json$' % HASH_LENGTH)
+
+def slugify(value):
+    """Turn a field value into a file-name-safe slug"""
+    slug = re.sub(r'[^a-z0-9]+', '-', str(value).lower()).strip('-')
+    return slug or 'unknown'
+
+class ShardSet:
+    """
+    Collects records one at a time into minified shard files under
+    out_dir. Every shard is streamed to disk as records arrive, so memory
+    does not grow with the dataset; call close() to hash, rename and
+    index them.
+    """
+
+    def __init__(self, out_dir, fields=SHARD_FIELDS):
+        self.out_dir = Path(out_dir)
+        self.fields = fields
+        self.out_dir.mkdir(parents=True, exist_ok=True)
+        # (field, slug) -> writer, and the values written to each shard
+        self._writers = {}
+        self._values = {}
+        self.index = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def _writer(self, field, value):
+        key = (field, slugify(value))
+        if key not in self._writers:
+            name = f"{field.replace('_', '-')}--{key[1]}.json"
+            self._writers[key] = JsonArrayWriter(self.out_dir / name, indent=None)
+            self._values[key] = []
+        if value not in self._values[key]:
+            self._values[key].append(value)
+        return self._writers[key]
+
+    def add(self, record):
+        """Append a record to each of its shards"""
+        for field in self.fields:
+            if field in record:
+                self._writer(field, record[field]).write(record)
+
+    def add_many(self, records):
+        """Append every record of an iterable"""
+        for record in records:
+            self.add(record)
+
+    def _publish(self, writer):
+        """Close a writer, rename its file to include the hash, describe it"""
+        writer.close()
+        digest = content_hash(writer.path)
+        hashed = writer.path.with_name(f"{writer.path.stem}.{digest}{writer.path.suffix}")
+        os.replace(writer.path, hashed)
+        return {
+            "file": hashed.name,
+            "count": writer.count,
+            "hash": digest,
+            "bytes": hashed.stat().st_size,
+        }
+
+    def close(self):
+        """Finish every shard, drop stale ones and write index.json"""
+        index = {"shards": {}}
+        for field in self.fields:
+            index["shards"][field] = []
+        for key, writer in self._writers.items():
+            values = self._values[key]
+            index["shards"][key[0]].append({"value": values[0], "values": values,
+                                            **self._publish(writer)})
+
+        # Remove shards left over from earlier runs with other hashes (and
+        # the full-dataset copy older versions wrote)
+        current = set()
+        for entries in index["shards"].values():
+            current.update(entry["file"] for entry in entries)
+        for path in self.out_dir.glob("*.json"):
+            if HASHED_NAME.match(path.name) and path.name not in current:
+                path.unlink()
+
+        tmp_index = self.out_dir / (INDEX_FILE + '.tmp')
+        with open(tmp_index, 'w', encoding='utf-8') as f:
+            json.dump(index, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_index, self.out_dir / INDEX_FILE)
+        self.index = index
+        return index
+
+    def abort(self):
+        """Discard every partially written shard"""
+        for writer in self._writers.values():
+            writer.abort()
+
+def write_shards(records, out_dir, fields=SHARD_FIELDS):
+    """Write the shards and index for a list of records"""
+    with ShardSet(out_dir, fields) as shards:
+        shards.add_many(records)
+    return shards.index
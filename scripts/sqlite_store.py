@@ -0,0 +1,213 @@
+"""
+SQLite output for the investor dataset
+Writes the records into an `investors` table with one column per
+Investor field (extra vendor columns as a JSON object in `extras`),
+indexes on name, email, source_geography, source, type and hq_country,
+and an FTS5 table over name, focus, title and city. Rows are bulk-loaded with
+batched executemany calls inside a single transaction into a temporary
+database, which replaces the target once complete.
+
+The directory and the analysis scripts can then filter, paginate and
+search with indexed queries (see InvestorStore) instead of loading the
+whole JSON file.
+"""
+import json
+import os
+import sqlite3
+from pathlib import Path
+
+from records import KEYS, Investor
+from search_index import tokenize
+
+STORE_VERSION = 2
+BATCH_SIZE = 5000
+
+COLUMNS = tuple(attr for attr, _ in KEYS)
+INDEXED = ('name', 'email', 'source_geography', 'source', 'type', 'hq_country')
+FTS_COLUMNS = ('name', 'focus', 'title', 'city')
+
+def _schema():
+    # No declared types: cells keep the type cleaning gave them (text,
+    # or a number where numbers_only kept one)
+    columns = ",\n    ".join(COLUMNS)
+    indexes = "\n".join(
+        f"CREATE INDEX investors_{column} ON investors ({column});" for column in INDEXED
+    )
+    return f"""
+CREATE TABLE investors (
+    id INTEGER PRIMARY KEY,
+    {columns},
+    extras TEXT
+);
+{indexes}
+"""
+
+FTS_SCHEMA = f"""
+CREATE VIRTUAL TABLE investors_fts USING fts5(
+    {', '.join(FTS_COLUMNS)}, content='investors', content_rowid='id'
+);
+"""
+
+def match_expression(query, prefix=True):
+    """
+    FTS5 MATCH expression for free text: the query's tokens, each quoted
+    so that '-', '/' or FTS5 keywords in it ('e-commerce', 'AI/ML', 'OR')
+    are never read as query syntax. None if the query has no tokens.
+    """
+    tokens = tokenize(query)
+    if not tokens:
+        return None
+    terms = [f'"{token}"' for token in tokens]
+    if prefix:
+        terms[-1] += '*'
+    return ' '.join(terms)
+
+def _row(record_id, record):
+    if not isinstance(record, Investor):
+        record = Investor.from_mapping(record)
+    extras = json.dumps(record.extras, ensure_ascii=False) if record.extras else None
+    return (record_id,) + tuple(getattr(record, column) for column in COLUMNS) + (extras,)
+
+class SqliteWriter:
+    """
+    Collects records one at a time and inserts them in batches of
+    BATCH_SIZE; close() builds the full-text index, commits and moves
+    the database over the target.
+    """
+
+    def __init__(self, path, batch_size=BATCH_SIZE):
+        self.path = Path(path)
+        self.tmp_path = self.path.with_name(self.path.name + '.tmp')
+        self.batch_size = batch_size
+        self.count = 0
+        self.fts = True
+        self._batch = []
+
+        self.tmp_path.unlink(missing_ok=True)
+        self._db = sqlite3.connect(str(self.tmp_path), isolation_level=None)
+        self._db.execute("PRAGMA journal_mode = OFF")
+        self._db.execute("PRAGMA synchronous = OFF")
+        self._db.execute("BEGIN")
+        self._create()
+
+        placeholders = ', '.join('?' * (len(COLUMNS) + 2))
+        self._insert = f"INSERT INTO investors (id, {', '.join(COLUMNS)}, extras) VALUES ({placeholders})"
+
+    def _create(self):
+        # executescript would commit the open transaction, so run the
+        # statements one by one
+        for statement in _schema().split(';'):
+            if statement.strip():
+                self._db.execute(statement)
+        try:
+            self._db.execute(FTS_SCHEMA)
+        except sqlite3.OperationalError as e:
+            print(f"  Warning: SQLite has no FTS5 ({e}), skipping the full-text index")
+            self.fts = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def _flush(self):
+        if self._batch:
+            self._db.executemany(self._insert, self._batch)
+            self._batch = []
+
+    def add(self, record):
+        """Queue one record under the next id"""
+        self._batch.append(_row(self.count, record))
+        self.count += 1
+        if len(self._batch) >= self.batch_size:
+            self._flush()
+
+    def add_many(self, records):
+        """Queue every record of an iterable"""
+        for record in records:
+            self.add(record)
+
+    def close(self):
+        """Insert the last batch, index, commit and move the file into place"""
+        self._flush()
+        if self.fts:
+            self._db.execute("INSERT INTO investors_fts (investors_fts) VALUES ('rebuild')")
+        self._db.execute(f"PRAGMA user_version = {STORE_VERSION}")
+        self._db.execute("COMMIT")
+        self._db.execute("ANALYZE")
+        self._db.close()
+        os.replace(self.tmp_path, self.path)
+
+    def abort(self):
+        """Discard the partial database"""
+        self._db.close()
+        self.tmp_path.unlink(missing_ok=True)
+
+def write_sqlite(records, path, batch_size=BATCH_SIZE):
+    """Write a list of records to a new SQLite database at path"""
+    with SqliteWriter(path, batch_size) as writer:
+        writer.add_many(records)
+    return writer.count
+
+class InvestorStore:
+    """Indexed queries over a database written by SqliteWriter"""
+
+    def __init__(self, path):
+        self._db = sqlite3.connect(f"file:{Path(path)}?mode=ro", uri=True)
+        self._db.row_factory = sqlite3.Row
+
+    def close(self):
+        self._db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _record(self, row):
+        record = Investor(**{column: row[column] for column in COLUMNS})
+        if row['extras']:
+            record.extras = json.loads(row['extras'])
+        return record
+
+    def count_by(self, column):
+        """{value: record count} for an indexed column, most common first"""
+        if column not in INDEXED:
+            raise ValueError(f"{column} is not an indexed column")
+        rows = self._db.execute(
+            f"SELECT {column}, COUNT(*) FROM investors GROUP BY {column} ORDER BY COUNT(*) DESC"
+        )
+        return {value: count for value, count in rows}
+
+    def page(self, limit=50, offset=0, **filters):
+        """Records matching column=value filters (indexed columns), in id order"""
+        for column in filters:
+            if column not in INDEXED:
+                raise ValueError(f"{column} is not an indexed column")
+        where = " AND ".join(f"{column} = ?" for column in filters) or "1"
+        rows = self._db.execute(
+            f"SELECT * FROM investors WHERE {where} ORDER BY id LIMIT ? OFFSET ?",
+            (*filters.values(), limit, offset),
+        )
+        return [self._record(row) for row in rows]
+
+    def search(self, query, limit=50, prefix=True):
+        """
+        Full-text search over name, focus, title and city, best matches
+        first. Like SearchIndex.search, every token of query must match
+        and with prefix=True the last one may be a prefix.
+        """
+        match = match_expression(query, prefix)
+        if match is None:
+            return []
+        rows = self._db.execute(
+            "SELECT investors.* FROM investors_fts JOIN investors ON investors.id = investors_fts.rowid "
+            "WHERE investors_fts MATCH ? ORDER BY rank LIMIT ?",
+            (match, limit),
+        )
+        return [self._record(row) for row in rows]
@@ -0,0 +1,50 @@
+"""
+Shared Excel workbook reader
+Opens a workbook once and streams its sheets from the same handle, instead
+of re-reading the whole .xlsx archive for every sheet.
+"""
+import pandas as pd
+
+class Workbook:
+    """
+    A read-only Excel workbook opened once.
+
+    For .xlsx files pandas loads the archive with openpyxl in read-only
+    mode, so each sheet's rows are streamed from the open file when the
+    sheet is parsed. Use as a context manager to release the file handle.
+    """
+
+    def __init__(self, file_path):
+        self.file_path = file_path
+        self._xls = pd.ExcelFile(file_path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Close the underlying workbook"""
+        self._xls.close()
+
+    @property
+    def sheet_names(self):
+        """Sheet names in workbook order"""
+        return self._xls.sheet_names
+
+    def read_sheet(self, sheet_name, nrows=None):
+        """Read one sheet into a DataFrame (optionally only its first nrows)"""
+        return self._xls.parse(sheet_name=sheet_name, nrows=nrows)
+
+    def iter_sheets(self):
+        """Yield (sheet_name, DataFrame) for every sheet, one at a time"""
+        for sheet_name in self.sheet_names:
+            yield sheet_name, self.read_sheet(sheet_name)
+
+    def preview(self, sheet_name, rows=3):
+        """
+        Header-only fast path: return the column names and first rows of a
+        sheet without reading the rest of it.
+        """
+        return self.read_sheet(sheet_name, nrows=rows)
@@ -1,15 +1,11 @@
 import { HandbookLayout } from "@/components/handbook/HandbookLayout";
 import Link from "next/link";
 import { ArrowLeft, Mail, Menu } from "lucide-react";
-import fs from "fs";
-import path from "path";
-import { processGuideContent } from "@/lib/guide-processor";
+import { loadGuide } from "@/lib/guide-content";
 
 export default function ColdOutreachPage() {
-    // Read the markdown content
-    const filePath = path.join(process.cwd(), "public", "content", "cold-outreach-guide.md");
-    const rawContent = fs.readFileSync(filePath, "utf-8");
-    const { html, toc } = processGuideContent(rawContent);
+    // Pre-rendered by scripts/extract_pdfs.py
+    const { html, toc } = loadGuide("cold-outreach-guide");
 
     return (
         <HandbookLayout currentSection="funding-stages">
@@ -3,9 +3,7 @@
 import { HandbookLayout } from "@/components/handbook/HandbookLayout";
 import Link from "next/link";
 import { ArrowLeft, BookOpen, Menu } from "lucide-react";
-import fs from "fs";
-import path from "path";
-import { processGuideContent } from "@/lib/guide-processor";
+import { loadGuide } from "@/lib/guide-content";
 
 // We need to read the file in the component for SSG/SSR in Next.js App Router.
 // But fs is server-side only. This component is marked "use client" so we can't use fs directly.
@@ -19,10 +17,8 @@ import { processGuideContent } from "@/lib/guide-processor";
 // So I will write this as a Server Component.
 
 export default function FundraisingGuidePage() {
-    // Read the markdown content
-    const filePath = path.join(process.cwd(), "public", "content", "complete-fundraising-guide.md");
-    const rawContent = fs.readFileSync(filePath, "utf-8");
-    const { html, toc } = processGuideContent(rawContent);
+    // Pre-rendered by scripts/extract_pdfs.py
+    const { html, toc } = loadGuide("complete-fundraising-guide");
 
     return (
         <HandbookLayout currentSection="funding-stages">
@@ -40,6 +40,11 @@ export interface Investor {
     "company address"?: string;
     "company country"?: string;
     contact_person?: string;
+    hq_city?: string;
+    hq_state?: string;
+    hq_country?: string;
+    ticket_min_usd?: number;
+    ticket_max_usd?: number;
 }
 
 interface InvestorDirectoryProps {
@@ -0,0 +1,31 @@
+import fs from "fs";
+import path from "path";
+import { processGuideContent, ProcessedGuide, TocItem } from "@/lib/guide-processor";
+
+const CONTENT_DIR = path.join(process.cwd(), "public", "content");
+
+interface GuideFiles {
+    markdown: string;
+    html: string;
+    toc: string;
+}
+
+// scripts/extract_pdfs.py renders each guide to an HTML fragment and a TOC
+// JSON file (content-hashed names) and lists them in guides.json. Server-only.
+export function loadGuide(slug: string): ProcessedGuide {
+    const indexPath = path.join(CONTENT_DIR, "guides.json");
+    const index: Record<string, GuideFiles> = fs.existsSync(indexPath)
+        ? JSON.parse(fs.readFileSync(indexPath, "utf-8"))
+        : {};
+    const files = index[slug];
+
+    if (files) {
+        const html = fs.readFileSync(path.join(CONTENT_DIR, files.html), "utf-8");
+        const toc: TocItem[] = JSON.parse(fs.readFileSync(path.join(CONTENT_DIR, files.toc), "utf-8"));
+        return { html, toc };
+    }
+
+    // Not pre-rendered yet: fall back to processing the markdown
+    const markdown = fs.readFileSync(path.join(CONTENT_DIR, `${slug}.md`), "utf-8");
+    return processGuideContent(markdown);
+}
@@ -0,0 +1,19 @@
+"""
+Shared test setup: the pipeline lives in flat scripts/ modules that
+import each other by name, so put scripts/ on the path, and load the
+converters (whose file names have dashes) by path.
+"""
+import importlib.util
+import sys
+from pathlib import Path
+
+SCRIPTS = Path(__file__).resolve().parent.parent / "scripts"
+sys.path.insert(0, str(SCRIPTS))
+
+def load_script(filename):
+    """Import a script from scripts/ by file name, e.g. 'convert-csv-to-json.py'"""
+    name = filename.removesuffix('.py').replace('-', '_')
+    spec = importlib.util.spec_from_file_location(name, SCRIPTS / filename)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
@@ -0,0 +1,121 @@
+"""
+clean_frame against the per-cell clean_investor_data it replaced: both
+converters' options must give the same records, values and types as the
+old loop over df.to_dict('records').
+"""
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from conftest import load_script
+
+csv_converter = load_script('convert-csv-to-json.py')
+excel_converter = load_script('convert-excel-to-json.py')
+
+def old_clean_csv(investors):
+    """convert-csv-to-json.clean_investor_data before vectorizing"""
+    cleaned = []
+    for inv in investors:
+        if not inv.get('name') or pd.isna(inv.get('name')):
+            continue
+        clean_inv = {}
+        for key, value in inv.items():
+            if pd.isna(value):
+                continue
+            if isinstance(value, str):
+                value = value.strip()
+                if value and value.lower() not in ['nan', 'n/a', 'na', '-', '']:
+                    clean_inv[key] = value
+            elif isinstance(value, (int, float)):
+                clean_inv[key] = value
+        if clean_inv.get('name'):
+            cleaned.append(clean_inv)
+    return cleaned
+
+def old_clean_excel(investors):
+    """convert-excel-to-json.clean_investor_data before vectorizing"""
+    cleaned = []
+    for inv in investors:
+        if not inv.get('name') or pd.isna(inv.get('name')):
+            continue
+        clean_inv = {}
+        for key, value in inv.items():
+            if pd.isna(value):
+                continue
+            if isinstance(value, str):
+                value = value.strip()
+                if value:
+                    clean_inv[key] = value
+            else:
+                clean_inv[key] = value
+        cleaned.append(clean_inv)
+    return cleaned
+
+def old_records(df):
+    with warnings.catch_warnings():
+        # to_dict warns that duplicate columns keep only their last value
+        warnings.simplefilter('ignore', UserWarning)
+        return df.to_dict('records')
+
+def typed(records):
+    """
+    Records as {key: (type name, value)}, so 1, 1.0 and True differ. Key
+    order isn't compared: Investor records list keys in slot order.
+    """
+    return [{k: (type(v).__name__, v) for k, v in r.items()} for r in records]
+
+def text_frame():
+    """A CSV source as the reader gives it: every column text, NaN for empty cells"""
+    return pd.DataFrame({
+        'name': ['  Alpha Capital ', 'N/A', np.nan, '-', 'Beta', '', 'nan', '42', 'Gamma'],
+        'city': [' Mumbai', 'Pune', 'Delhi', np.nan, 'NA', '   ', 'Goa', 'n/a', 'Na'],
+        'email': ['a@x.com ', np.nan, np.nan, 'b@y.com', '-', np.nan, np.nan, 'c@z.com', ''],
+        'focus': ['SaaS', 'Fintech', np.nan, np.nan, ' Health ', np.nan, 'AI', 'AI', '-'],
+    }, dtype=object)
+
+def mixed_frame():
+    """An Excel-like sheet: numbers, bools, dates and strings mixed in columns"""
+    df = pd.DataFrame({
+        'name': ['Alpha', 7, 0, np.nan, '  ', 'Delta', 3.5, 'Eps', True],
+        'ticket_size': [50000, np.nan, 1.5, 10, 'N/A', '-', ' 100K ', 2, np.nan],
+        'phone': [np.int64(98), np.float64(1.25), 'x', np.nan, np.bool_(True), '', None, 4, 5],
+        'active': [True, False, True, False, True, False, True, False, True],
+        'count': [1, 2, 3, 4, 5, 6, 7, 8, 9],
+        'score': [1.0, np.nan, 2.5, 3.0, np.nan, 0.0, 1.5, 2.0, 9.0],
+        'joined': pd.to_datetime(['2020-01-01', None, '2021-05-06', None, None,
+                                  '2019-12-31', None, '2022-02-02', None]),
+    })
+    return df.astype({'name': object, 'ticket_size': object, 'phone': object})
+
+def duplicate_frame():
+    """Two columns standardized to the same name: the last one wins"""
+    df = pd.DataFrame([
+        ['Alpha', 'first', ' second ', 'SaaS'],
+        ['Beta', 'first', np.nan, 'N/A'],
+        [np.nan, 'x', 'y', 'z'],
+        ['Gamma', np.nan, '-', 'AI'],
+    ], columns=['name', 'city', 'city', 'focus'], dtype=object)
+    return df
+
+FRAMES = {'text': text_frame, 'mixed': mixed_frame, 'duplicates': duplicate_frame}
+
+@pytest.mark.parametrize('frame', FRAMES)
+def test_csv_options_match_old_loop(frame):
+    df = FRAMES[frame]()
+    expected = old_clean_csv(old_records(df))
+    actual = csv_converter.clean_investor_data(df)
+    assert typed(actual) == typed(expected)
+
+@pytest.mark.parametrize('frame', FRAMES)
+def test_excel_options_match_old_loop(frame):
+    df = FRAMES[frame]()
+    expected = old_clean_excel(old_records(df))
+    actual = excel_converter.clean_investor_data(df)
+    assert typed(actual) == typed(expected)
+
+def test_frame_without_name_column():
+    df = pd.DataFrame({'city': ['Mumbai']})
+    assert csv_converter.clean_investor_data(df) == []
+    assert excel_converter.clean_investor_data(df) == []
@@ -0,0 +1,60 @@
+"""
+Header mapping and per-field normalizers (column_schema.py)
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from column_schema import column_mapping, fuzzy_matches, resolve_header, standardize_columns
+
+# Vendor columns the records carry as they are: none of them may be taken
+# for a schema field by fuzzy matching ('first name' is 0.84 from 'firm name')
+UNMAPPED_HEADERS = [
+    'first name', 'last name', 'title', 'position', 'company address', 'company country',
+    'unnamed: 0', 'lead source', 'last contacted', 'notes to self', 'fund size',
+]
+
+@pytest.mark.parametrize('header', UNMAPPED_HEADERS)
+def test_vendor_headers_stay_unmapped(header):
+    assert resolve_header(header) == (None, None)
+
+@pytest.mark.parametrize('header, field', [
+    ('vc firm name', 'name'),
+    ('contact e-mail', 'email'),
+    ('linkedin profiles', 'linkedin'),
+    ('investment stages', 'stage'),
+])
+def test_fuzzy_headers(header, field):
+    assert resolve_header(header)[0] == field
+
+def test_exact_alias_wins_over_fuzzy_match(capsys):
+    headers = ['Firm Name', 'VC Firm name', ' Contact  E-mail ', 'First Name']
+    assert column_mapping(headers, 'test-exact') == {'firm name': 'name', 'contact e-mail': 'email'}
+    assert fuzzy_matches(headers, 'test-exact') == {'contact e-mail': ('email', 'contact email')}
+    # Matches are returned for the caller to report, never printed here
+    assert capsys.readouterr().out == ''
+
+def test_normalizers_apply_to_their_columns():
+    df = pd.DataFrame({
+        'Investor Name': ['Acme', 'Beta', 'Gamma'],
+        'Website': ['www.Acme.COM/', np.nan, 42],
+        'Contact Email': ['Jo@Acme.COM', 'N/A', None],
+        'Company Twitter': ['http://www.twitter.com/acme/', None, None],
+        'Twitter URL': ['http://www.twitter.com/acme/', None, None],
+        'About': ['www.Acme.COM/', None, None],
+    }, dtype=object)
+    df = standardize_columns(df, 'test-normalizers')
+    assert list(df.columns) == ['name', 'website', 'email', 'company twitter', 'twitter url',
+                                'description']
+    assert df['website'].tolist()[0] == 'https://www.acme.com'
+    assert pd.isna(df['website'][1]) and df['website'][2] == 42
+    assert df['email'].tolist()[:2] == ['Jo@acme.com', 'N/A']
+    assert df['twitter url'][0] == 'https://twitter.com/acme'
+    # Columns without a normalizer are left alone
+    assert df['company twitter'][0] == 'http://www.twitter.com/acme/'
+    assert df['description'][0] == 'www.Acme.COM/'
+
+def test_duplicate_columns_are_each_normalized():
+    df = pd.DataFrame([['Acme', 'acme.com/', 'WWW.ACME.COM']], columns=['name', 'url', 'web'])
+    df = standardize_columns(df, 'test-duplicates')
+    assert df.iloc[0].tolist() == ['Acme', 'https://acme.com', 'https://www.acme.com']
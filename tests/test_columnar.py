@@ -0,0 +1,52 @@
+"""
+The columnar export must rebuild exactly the records of the row-oriented
+output: same keys in the same order, missing fields left out, and values
+of different types (True, 1, 1.0) kept apart by the dictionary encoding.
+"""
+import json
+
+from columnar import decode_columnar, encode_columnar, read_columnar, write_columnar
+from json_writer import write_json
+from records import Investor
+
+def typed_items(records):
+    """Records as lists of (key, type name, value), so order and types are compared"""
+    return [[(k, type(v).__name__, v) for k, v in r.items()] for r in records]
+
+def sample_records():
+    records = [
+        {'name': 'Alpha', 'source': 'vc', 'flag': True, 'ticket': 1},
+        {'name': 'Beta', 'source': 'vc', 'flag': 1, 'ticket': 1.0},
+        {'source': 'angels', 'name': 'Gamma', 'flag': 1.0},
+        {'name': 'Delta', 'source': 'vc'},
+        {'name': 'Eps', 'source': 'angels', 'flag': False, 'ticket': 0, 'city': 'Pune'},
+        {'name': 'Zeta', 'source': 'vc', 'flag': 0, 'ticket': 0.0},
+    ]
+    # Enough repeats for 'source' and 'flag' to be dictionary-encoded
+    return records * 4
+
+def test_round_trip_keeps_order_missing_fields_and_types():
+    records = sample_records()
+    data = encode_columnar(records)
+    assert 'dictionary' in data['columns']['source']
+    assert 'dictionary' in data['columns']['flag']
+    assert typed_items(decode_columnar(data)) == typed_items(records)
+
+def test_unique_column_is_stored_plain():
+    records = [{'name': f'Investor {i}'} for i in range(10)]
+    data = encode_columnar(records)
+    assert data['columns']['name'] == {'values': [r['name'] for r in records]}
+    assert decode_columnar(data) == records
+
+def test_file_matches_row_oriented_output(tmp_path):
+    records = [Investor.from_mapping(r) for r in sample_records()]
+    records[0]['extra column'] = 'kept'
+    write_json(records, tmp_path / 'investors.json')
+    write_columnar(records, tmp_path / 'investors.columnar.json')
+
+    with open(tmp_path / 'investors.json', encoding='utf-8') as f:
+        rows = json.load(f)
+    assert typed_items(read_columnar(tmp_path / 'investors.columnar.json')) == typed_items(rows)
+
+def test_empty():
+    assert decode_columnar(encode_columnar([])) == []
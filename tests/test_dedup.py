@@ -0,0 +1,36 @@
+"""
+Exact matches on a person's email or LinkedIn handle only merge records
+of the same firm
+"""
+from dedup import deduplicate
+
+def names(records):
+    return [r['name'] for r in records]
+
+def test_same_email_different_firm_is_kept():
+    records = [
+        {'name': 'Prathamus Ventures', 'email': 'ashok@athamus.com'},
+        {'name': 'Elev8 Venture', 'email': 'Ashok@athamus.com '},
+    ]
+    merged, report = deduplicate(records)
+    assert names(merged) == ['Prathamus Ventures', 'Elev8 Venture']
+    assert report == []
+
+def test_same_linkedin_different_firm_is_kept():
+    records = [
+        {'name': 'Venture Catalysts++', 'linkedin': 'https://www.linkedin.com/in/mandarjoshidubai/'},
+        {'name': '9Unicorns', 'personal linkedin url': 'https://linkedin.com/in/mandarjoshidubai'},
+    ]
+    merged, _ = deduplicate(records)
+    assert names(merged) == ['Venture Catalysts++', '9Unicorns']
+
+def test_same_email_same_firm_is_merged():
+    records = [
+        {'name': 'Accel', 'email': 'a@accel.com', 'source': 'vc'},
+        {'name': 'Other Fund', 'email': 'a@accel.com'},
+        {'name': 'Accel India Pvt Ltd', 'email': 'a@accel.com', 'city': 'Bengaluru'},
+    ]
+    merged, report = deduplicate(records)
+    assert names(merged) == ['Accel', 'Other Fund']
+    assert merged[0]['city'] == 'Bengaluru'
+    assert report[0]['merged'][0]['reason'] == 'same email a@accel.com'
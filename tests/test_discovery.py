@@ -0,0 +1,51 @@
+"""
+Byte-identical and near-identical input copies are skipped (discovery.py)
+"""
+from discovery import distinct_files
+
+HEADER = 'name,email,city'
+ROWS = [f'Fund {i},partner{i}@fund{i}.com,City {i}' for i in range(40)]
+
+def write(path, lines, newline='\n'):
+    path.write_bytes(newline.join(lines).encode('utf-8') + newline.encode())
+    return path
+
+def test_byte_identical_copy(tmp_path):
+    original = write(tmp_path / 'vc.csv', [HEADER] + ROWS)
+    copy = write(tmp_path / 'Copy of vc.csv', [HEADER] + ROWS)
+    distinct, aliases = distinct_files([original, copy])
+    assert distinct == [original]
+    assert aliases == {copy: (original, None)}
+
+def test_other_line_endings_are_a_copy(tmp_path):
+    original = write(tmp_path / 'vc.csv', [HEADER] + ROWS)
+    copy = write(tmp_path / 'vc(1).csv', [HEADER] + ROWS, newline='\r\n')
+    distinct, aliases = distinct_files([original, copy])
+    assert distinct == [original]
+    assert aliases == {copy: (original, 1.0)}
+
+def test_one_edited_cell_is_a_copy(tmp_path):
+    original = write(tmp_path / 'vc.csv', [HEADER] + ROWS)
+    edited = ROWS[:5] + ['Fund 5,partner5@fund5.com,Elsewhere'] + ROWS[6:]
+    copy = write(tmp_path / 'vc(1).csv', [HEADER] + edited)
+    distinct, aliases = distinct_files([original, copy])
+    assert distinct == [original]
+    assert aliases[copy][0] == original
+    assert 0.95 <= aliases[copy][1] < 1
+
+def test_whitespace_in_cells_is_ignored(tmp_path):
+    original = write(tmp_path / 'vc.csv', [HEADER] + ROWS)
+    spaced = ROWS[:5] + ['Fund 5, partner5@fund5.com,City  5 '] + ROWS[6:]
+    copy = write(tmp_path / 'vc(1).csv', [HEADER] + spaced)
+    assert distinct_files([original, copy])[1] == {copy: (original, 1.0)}
+
+def test_same_header_different_rows_are_kept(tmp_path):
+    first = write(tmp_path / 'india.csv', [HEADER] + ROWS[:20])
+    second = write(tmp_path / 'us.csv', [HEADER] + ROWS[20:])
+    other = write(tmp_path / 'angels.csv', ['name,email'] + [r.rsplit(',', 1)[0] for r in ROWS])
+    assert distinct_files([first, second, other]) == ([first, second, other], {})
+
+def test_near_copies_can_be_turned_off(tmp_path):
+    original = write(tmp_path / 'vc.csv', [HEADER] + ROWS)
+    copy = write(tmp_path / 'vc(1).csv', [HEADER] + ROWS, newline='\r\n')
+    assert distinct_files([original, copy], similarity=None) == ([original, copy], {})
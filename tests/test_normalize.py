@@ -0,0 +1,112 @@
+"""
+Location, URL, email and ticket-size normalization (normalize.py)
+"""
+import pytest
+
+from normalize import canonical_url, normalize_emails, normalize_record, parse_location, parse_ticket_size
+from records import Investor
+
+def hq(record):
+    return record.hq_city, record.hq_state, record.hq_country
+
+@pytest.mark.parametrize('fields, expected', [
+    # The free-text city is a branch office: the address wins as a whole
+    (dict(city='Bengaluru', company_country='United States',
+          company_address='428 University Avenue, Palo Alto, California, United States, 94301'),
+     ('Palo Alto', 'California', 'United States')),
+    (dict(city='Gurugram', company_country='India',
+          company_address='Mumbai, Maharashtra, India, 400013'),
+     ('Mumbai', 'Maharashtra', 'India')),
+    # An address naming only a country doesn't borrow the free-text city
+    (dict(city='Bengaluru', company_country='Bermuda', company_address='Bermuda'),
+     (None, None, 'Bermuda')),
+    # Without an address the free-text city is parsed as a whole
+    (dict(city='Dubai, UAE'), ('Dubai', None, 'United Arab Emirates')),
+    (dict(city='Gurgaon'), ('Gurugram', None, None)),
+    (dict(city='San Francisco, CA'), ('San Francisco', 'California', 'United States')),
+    # 'company country' only fills a missing country
+    (dict(city='Pune', company_country='India'), ('Pune', None, 'India')),
+    (dict(company_country='UAE'), (None, None, 'United Arab Emirates')),
+])
+def test_location_fields_come_from_one_place(fields, expected):
+    record = normalize_record(Investor(name='Firm', **fields))
+    assert hq(record) == expected
+
+@pytest.mark.parametrize('text, expected', [
+    ('Gurugram, Haryana, India, 122002', ('Gurugram', 'Haryana', 'India')),
+    ('77 Hal Compound Road, Bengaluru, Karnataka, India, 560037',
+     ('Bengaluru', 'Karnataka', 'India')),
+    ('17 Connaught Place, London, England, United Kingdom, W2',
+     ('London', 'England', 'United Kingdom')),
+    ('20 University St, San Francisco, California, United States, 94134-1148',
+     ('San Francisco', 'California', 'United States')),
+    ('11 Stanley St, Singapore, Singapore, 068730', ('Singapore', None, 'Singapore')),
+    ('Bermuda', (None, None, 'Bermuda')),
+])
+def test_structured_address(text, expected):
+    assert parse_location(text) == expected
+
+@pytest.mark.parametrize('text, expected', [
+    ('512, Index Tower, DIFC, Dubai, UAE', ('Dubai', None, 'United Arab Emirates')),
+    ('Dubai Silicon Oasis, DDP, Building A2, Dubai-UAE', ('Dubai', None, 'United Arab Emirates')),
+    ('Uvez Sokak, No:5, Arnavutkoy, Besiktas, Istanbul 34345, TR', ('Istanbul', None, 'Turkey')),
+    ('440 N. Wolfe Rd, Sunnyvale, CA 94085, US', ('Sunnyvale', 'California', 'United States')),
+    ('Floor 1, 32 Wigmore Street, London, W1U 2RP', ('London', None, None)),
+    ('28 Boulevard Royal, L 2449 Luxembourg', (None, None, 'Luxembourg')),
+    ('New York', ('New York', None, None)),
+])
+def test_free_text_location(text, expected):
+    assert parse_location(text, structured=False) == expected
+
+@pytest.mark.parametrize('url, expected', [
+    ('http://www.linkedin.com/in/Aakash-d-68648045/', 'https://www.linkedin.com/in/aakash-d-68648045'),
+    ('https://in.linkedin.com/company/acme?trk=x', 'https://www.linkedin.com/company/acme'),
+    ('https://in.linkedin.com/pub/jane-doe/1/2/3', 'https://www.linkedin.com/pub/jane-doe/1/2/3'),
+    ('http://www.twitter.com/OmnivoreAgtech/', 'https://twitter.com/OmnivoreAgtech'),
+    ('https://twitter.com/#!/GCVP', 'https://twitter.com/GCVP'),
+    ('www.Example.COM/about/', 'https://www.example.com/about'),
+    ('http://seafund.in/', 'http://seafund.in'),
+    ('http://example.com:80x', 'http://example.com:80x'),
+    ('//cdn.example.com/x/', 'https://cdn.example.com/x'),
+    ('acme.vc', 'https://acme.vc'),
+    ('linkedin.com/in/Jane-Doe', 'https://www.linkedin.com/in/jane-doe'),
+])
+def test_canonical_url(url, expected):
+    assert canonical_url(url) == expected
+    assert canonical_url(expected) == expected
+
+@pytest.mark.parametrize('value', [
+    'N', 'NA', 'none', 'Not available', 'See website', 'mailto:x@y.com',
+    'ftp://files.example.com/deck.pdf', 'tel:+911234567', 'localhost:3000', 'acme',
+])
+def test_non_links_are_kept(value):
+    assert canonical_url(value) == value
+
+def test_email_domains_are_lower_cased():
+    assert normalize_emails('John@Example.COM, b@X.io') == 'John@example.com, b@x.io'
+    assert normalize_emails('a@b.com') == 'a@b.com'
+
+@pytest.mark.parametrize('text, expected', [
+    ('$50K - $200K', (50000, 200000)),
+    ('INR 2-5 Cr', (240000, 600000)),
+    ('Up to $1M', (None, 1000000)),
+    ('$500K+', (500000, None)),
+    ('USD 100,000', (100000, 100000)),
+    ('$1M to $3M', (1000000, 3000000)),
+    ('Varies', (None, None)),
+    # The unit is written once and applies to both bounds
+    ('INR 5 Cr - 10', (600000, 1200000)),
+    ('$2 - 3M', (2000000, 3000000)),
+    ('$2M - 3', (2000000, 3000000)),
+    ('50-100k', (50000, 100000)),
+    ('$100 - $200', (100, 200)),
+    # Backwards ranges are unparseable
+    ('$5M - $1M', (None, None)),
+    ('$500K - 100', (None, None)),
+    ('', (None, None)),
+    ('From $250K', (250000, None)),
+    ('Max USD 2 million', (None, 2000000)),
+    ('₹50 lakhs', (60000, 60000)),
+])
+def test_ticket_size(text, expected):
+    assert parse_ticket_size(text) == expected
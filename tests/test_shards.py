@@ -0,0 +1,32 @@
+"""
+Shards of values whose slugs collide are merged instead of overwritten
+"""
+import json
+
+from shards import INDEX_FILE, write_shards
+
+def read(path):
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+def test_colliding_slugs_share_a_shard(tmp_path):
+    records = [
+        {'name': 'A', 'source_geography': 'UAE & Middle East', 'source': 'x'},
+        {'name': 'B', 'source_geography': 'UAE Middle East', 'source': 'x'},
+        {'name': 'C', 'source_geography': 'India', 'source': 'y'},
+    ]
+    index = write_shards(records, tmp_path)
+    assert index == read(tmp_path / INDEX_FILE)
+
+    geography = {entry['values'][0]: entry for entry in index['shards']['source_geography']}
+    assert sorted(geography) == ['India', 'UAE & Middle East']
+    uae = geography['UAE & Middle East']
+    assert uae['values'] == ['UAE & Middle East', 'UAE Middle East']
+    assert uae['count'] == 2
+    assert [r['name'] for r in read(tmp_path / uae['file'])] == ['A', 'B']
+
+def test_stale_files_are_removed(tmp_path):
+    (tmp_path / 'investors-min.0123456789ab.json').write_text('[]')
+    index = write_shards([{'name': 'A', 'source': 'x'}], tmp_path)
+    files = {entry['file'] for entries in index['shards'].values() for entry in entries}
+    assert {path.name for path in tmp_path.iterdir()} == files | {INDEX_FILE}